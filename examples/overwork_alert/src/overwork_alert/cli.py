@@ -9,7 +9,7 @@ from pathlib import Path
 
 from .config import DEFAULT_CONFIG_PATH, load_config
 from .daemon import run_daemon
-from .ipc import ControlChannelError, send_request
+from .ipc import ControlChannelError, ControlClient, send_request
 from .launchagent import install as install_autostart
 from .launchagent import uninstall as uninstall_autostart
 
@@ -22,6 +22,30 @@ def _load_socket_path(config_path: Path) -> str:
     return load_config(config_path).control_socket_path
 
 
+def _watch(socket_path: str) -> int:
+    """Print the status, then every state change pushed by the daemon, until it stops."""
+    try:
+        with ControlClient(socket_path=socket_path, timeout_seconds=None) as client:
+            client.send({"cmd": "status"})
+            client.send({"cmd": "subscribe"})
+            resp = client.receive()
+            if resp is None or not resp.get("ok"):
+                print((resp or {}).get("error", "error"), file=sys.stderr)
+                return 2
+            print(json.dumps(resp.get("state"), sort_keys=True), flush=True)
+            while True:
+                msg = client.receive()
+                if msg is None:
+                    return 0
+                if msg.get("event") == "state":
+                    print(json.dumps(msg.get("state"), sort_keys=True), flush=True)
+    except ControlChannelError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """Run the CLI. Returns a process exit code."""
     # @cpt-req:cpt-overwork-alert-spec-cli-control-req-reset-and-controls:p1
@@ -35,6 +59,9 @@ def main(argv: list[str] | None = None) -> int:
         p = sub.add_parser(name)
         _add_common_args(p)
 
+    p_watch = sub.add_parser("watch")
+    _add_common_args(p_watch)
+
     p_install = sub.add_parser("install-autostart")
     _add_common_args(p_install)
 
@@ -69,6 +96,9 @@ def main(argv: list[str] | None = None) -> int:
 
     socket_path = _load_socket_path(args.config)
 
+    if args.cmd == "watch":
+        return _watch(socket_path)
+
     try:
         if args.cmd == "status":
             # @cpt-flow:cpt-overwork-alert-spec-cli-control-flow-status:p1
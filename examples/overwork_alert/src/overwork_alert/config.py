@@ -7,9 +7,12 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+import time
 from dataclasses import replace
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from .models import Config
 
@@ -52,6 +55,7 @@ def load_config(config_path: Path | None = None) -> Config:
     tick_interval_seconds = _parse_positive_int(raw.get("tick_interval_seconds"))
     max_tick_delta_seconds = _parse_positive_int(raw.get("max_tick_delta_seconds"))
     control_socket_path = raw.get("control_socket_path")
+    state_journal_path = raw.get("state_journal_path")
 
     if limit_seconds is not None:
         cfg = replace(cfg, limit_seconds=limit_seconds)
@@ -70,4 +74,69 @@ def load_config(config_path: Path | None = None) -> Config:
     if isinstance(control_socket_path, str) and control_socket_path:
         cfg = replace(cfg, control_socket_path=control_socket_path)
 
+    if isinstance(state_journal_path, str) and state_journal_path:
+        cfg = replace(cfg, state_journal_path=os.path.expanduser(state_journal_path))
+
     return cfg
+
+
+class ConfigCache:
+    """Effective config that is re-parsed only when the config file changes.
+
+    `get()` stats the file at most once per `check_interval_seconds` and reloads
+    when its mtime or size changed. `request_reload()` forces a reload on the next
+    `get()`; it only sets a flag, so it is safe to call from a signal handler.
+    """
+
+    def __init__(
+        self,
+        config_path: Path | None = None,
+        *,
+        check_interval_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        stat: Callable[[Path], os.stat_result] = os.stat,
+        loader: Callable[[Path], Config] = load_config,
+    ) -> None:
+        self._path = config_path or DEFAULT_CONFIG_PATH
+        self._check_interval_seconds = check_interval_seconds
+        self._clock = clock
+        self._stat = stat
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._config: Config | None = None
+        self._signature: tuple[int, int] | None = None
+        self._checked_at: float | None = None
+        self._reload_requested = False
+        self.reload_count = 0
+
+    def request_reload(self) -> None:
+        """Reload on the next `get()` regardless of the file signature."""
+        self._reload_requested = True
+
+    def get(self) -> Config:
+        """Return the effective config, reloading it if the file changed."""
+        with self._lock:
+            now = self._clock()
+            if (
+                self._config is not None
+                and not self._reload_requested
+                and self._checked_at is not None
+                and now - self._checked_at < self._check_interval_seconds
+            ):
+                return self._config
+            self._checked_at = now
+
+            signature = self._file_signature()
+            if self._config is None or self._reload_requested or signature != self._signature:
+                self._reload_requested = False
+                self._config = self._loader(self._path)
+                self._signature = signature
+                self.reload_count += 1
+            return self._config
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            st = self._stat(self._path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
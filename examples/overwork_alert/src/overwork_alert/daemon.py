@@ -9,17 +9,20 @@ Implements:
 from __future__ import annotations
 
 import logging
+import signal
 import threading
 import time
 from dataclasses import replace
 from pathlib import Path
+from typing import Callable
 
-from .config import load_config
-from .idle import get_idle_seconds
+from .config import ConfigCache
+from .idle import IdleProvider, default_idle_provider
 from .ipc import ControlRequest, ControlServer
-from .models import Config, TrackerState, TrackerStatus
+from .journal import StateJournal
+from .models import Config, TrackerState, TrackerStatus, clone_state
 from .notification_policy import apply_notification_policy, should_notify
-from .notify import send_notification
+from .notify import NotificationWorker, send_notification
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +106,65 @@ def tick_once(*, state: TrackerState, config: Config, idle_seconds: int | None,
     # @cpt-end:cpt-overwork-alert-spec-tracker-core-flow-tick-loop:p1:inst-return-state
 
 
+# Longest sleep between ticks while nothing can accrue (idle or paused).
+MAX_SLEEP_SECONDS = 60.0
+# Shortest sleep, so a deadline that is due does not spin the loop.
+MIN_SLEEP_SECONDS = 1.0
+
+
+def next_tick_delay(*, state: TrackerState, config: Config, idle_seconds: int | None, now: float) -> float:
+    """Return how long the daemon may sleep before the next tick can matter.
+
+    While the user is active, ticks must come at least every `max_tick_delta_seconds`
+    (longer gaps are clamped by `tick_once`), and also land on the nearest deadline:
+    crossing `limit_seconds`, the next repeat reminder, or the idle threshold. While
+    idle or paused nothing accrues, so sampling backs off the longer the user stays
+    away, up to MAX_SLEEP_SECONDS; `_rebase_after_away` keeps the tick that ends such
+    a sleep from being clamped.
+    """
+    base = float(config.tick_interval_seconds)
+    if state.status == TrackerStatus.PAUSED:
+        # Resuming wakes the loop (see Daemon._wake).
+        return MAX_SLEEP_SECONDS
+    if idle_seconds is None:
+        return base
+    if idle_seconds >= config.idle_threshold_seconds:
+        away_seconds = idle_seconds - config.idle_threshold_seconds
+        return max(base, min(MAX_SLEEP_SECONDS, float(away_seconds)))
+
+    delay = max(base, float(config.max_tick_delta_seconds))
+    deadlines = [float(config.idle_threshold_seconds - idle_seconds)]
+    if state.active_time_seconds <= config.limit_seconds:
+        deadlines.append(float(config.limit_seconds - state.active_time_seconds + 1))
+    elif state.last_reminder_at is not None:
+        deadlines.append(state.last_reminder_at + config.repeat_interval_seconds - now)
+    return max(MIN_SLEEP_SECONDS, min([delay] + deadlines))
+
+
+def _is_away(*, state: TrackerState, config: Config, idle_seconds: int | None) -> bool:
+    """Return True if nothing accrues at this sample (paused or idle), so the loop may back off."""
+    if state.status == TrackerStatus.PAUSED:
+        return True
+    return idle_seconds is not None and idle_seconds >= config.idle_threshold_seconds
+
+
+def _rebase_after_away(*, state: TrackerState, config: Config, idle_seconds: int | None, now: float) -> TrackerState:
+    """Start the first tick after an idle/paused back-off at the user's return.
+
+    The sleep before this tick may be far longer than `max_tick_delta_seconds`, so
+    `tick_once` would clamp it. The last input (`now - idle_seconds`, never before
+    the previous tick) is taken as the return time instead; activity between the
+    return and the last input is not counted.
+    """
+    if state.last_tick_at is None or idle_seconds is None:
+        return state
+    if idle_seconds >= config.idle_threshold_seconds:
+        return state
+    if now - state.last_tick_at <= config.max_tick_delta_seconds:
+        return state
+    return replace(state, last_tick_at=max(state.last_tick_at, now - idle_seconds))
+
+
 def _notification_message(*, config: Config) -> tuple[str, str]:
     title = "Overwork Alert"
     msg = "You have exceeded your configured work limit. Consider taking a break."
@@ -115,8 +177,12 @@ def _maybe_send_overwork_notification(
     config: Config,
     idle_seconds: int | None,
     now: float,
+    send: Callable[..., bool] = send_notification,
 ) -> TrackerState:
-    """Evaluate notification policy and send notifications if needed."""
+    """Evaluate notification policy and send notifications if needed.
+
+    `send` delivers (or, for the daemon, enqueues) the notification.
+    """
 
     # @cpt-begin:cpt-overwork-alert-spec-notifications-flow-first-alert:p1:inst-detect-over-limit
     # @cpt-begin:cpt-overwork-alert-spec-notifications-flow-repeat-reminder:p1:inst-still-over-limit
@@ -164,11 +230,11 @@ def _maybe_send_overwork_notification(
 
     if is_first_alert:
         # @cpt-begin:cpt-overwork-alert-spec-notifications-flow-first-alert:p1:inst-send-notification
-        ok = send_notification(title=title, message=msg)
+        ok = send(title=title, message=msg)
         # @cpt-end:cpt-overwork-alert-spec-notifications-flow-first-alert:p1:inst-send-notification
     else:
         # @cpt-begin:cpt-overwork-alert-spec-notifications-flow-repeat-reminder:p1:inst-send-reminder
-        ok = send_notification(title=title, message=msg)
+        ok = send(title=title, message=msg)
         # @cpt-end:cpt-overwork-alert-spec-notifications-flow-repeat-reminder:p1:inst-send-reminder
 
     if not ok:
@@ -189,23 +255,38 @@ def _maybe_send_overwork_notification(
 class Daemon:
     """Long-running daemon process (single user session)."""
 
-    def __init__(self, *, config_path: Path | None = None) -> None:
-        self._config_path = config_path
+    def __init__(self, *, config_path: Path | None = None, idle_provider: IdleProvider | None = None) -> None:
+        self._config = ConfigCache(config_path)
+        self._idle = idle_provider or default_idle_provider()
+        # Delivery runs off the state lock, so IPC requests never wait on osascript.
+        self._notifier = NotificationWorker()
         self._state = TrackerState()
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        # Set by control commands so the loop re-evaluates its next deadline.
+        self._wake_event = threading.Event()
         self._ipc: ControlServer | None = None
+        self._published_state: dict | None = None
+        self._journal: StateJournal | None = None
+        # Orders journal writes without holding the state lock during file I/O.
+        self._journal_lock = threading.Lock()
 
     def run_forever(self) -> None:
         """Run the daemon until a stop command is received."""
-        config = load_config(self._config_path)
-        self._ipc = ControlServer(socket_path=config.control_socket_path, request_handler=self._handle_request)
+        config = self._config.get()
+        if config.state_journal_path:
+            self._journal = StateJournal(Path(config.state_journal_path))
+            self._state = self._journal.recover()
+        self._ipc = ControlServer(socket_path=config.control_socket_path, request_handler=self._on_request)
         self._ipc.start()
+        self._notifier.start()
+        previous_sighup = self._install_sighup_handler()
 
+        away = False
         try:
             while not self._stop_event.is_set():
                 # @cpt-begin:cpt-overwork-alert-spec-tracker-core-flow-tick-loop:p1:inst-load-config
-                config = load_config(self._config_path)
+                config = self._config.get()
                 # @cpt-end:cpt-overwork-alert-spec-tracker-core-flow-tick-loop:p1:inst-load-config
                 now = time.time()
 
@@ -220,14 +301,18 @@ class Daemon:
                         first_tick = True
 
                 if first_tick:
-                    time.sleep(config.tick_interval_seconds)
+                    self._sleep(config.tick_interval_seconds)
                     continue
 
                 # @cpt-begin:cpt-overwork-alert-spec-tracker-core-flow-tick-loop:p1:inst-read-idle
-                idle_seconds = get_idle_seconds()
+                idle_seconds = self._idle.idle_seconds()
                 # @cpt-end:cpt-overwork-alert-spec-tracker-core-flow-tick-loop:p1:inst-read-idle
 
                 with self._lock:
+                    if away:
+                        self._state = _rebase_after_away(
+                            state=self._state, config=config, idle_seconds=idle_seconds, now=now,
+                        )
                     # @cpt-req:cpt-overwork-alert-spec-tracker-core-req-idle-aware-accumulation:p1
                     self._state = tick_once(state=self._state, config=config, idle_seconds=idle_seconds, now=now)
 
@@ -237,16 +322,64 @@ class Daemon:
                         config=config,
                         idle_seconds=idle_seconds,
                         now=now,
+                        send=self._notifier.submit,
                     )
+                    delay = next_tick_delay(state=self._state, config=config, idle_seconds=idle_seconds, now=now)
+                    away = _is_away(state=self._state, config=config, idle_seconds=idle_seconds)
 
-                time.sleep(config.tick_interval_seconds)
+                self._publish_state()
+                self._sleep(delay)
         finally:
+            self._notifier.stop()
+            if self._journal:
+                with self._journal_lock:
+                    with self._lock:
+                        snapshot = clone_state(self._state)
+                    self._journal.close(snapshot)
+            if previous_sighup is not None:
+                signal.signal(signal.SIGHUP, previous_sighup)
             try:
                 if self._ipc:
                     self._ipc.stop()
             except OSError:
                 pass
 
+    def _on_request(self, req: ControlRequest) -> dict:
+        resp = self._handle_request(req)
+        if req.cmd in {"pause", "resume", "reset"}:
+            self._publish_state()
+        return resp
+
+    def _publish_state(self) -> None:
+        """Journal the state and push the status payload to IPC subscribers if it changed."""
+        if self._journal:
+            with self._journal_lock:
+                with self._lock:
+                    snapshot = clone_state(self._state)
+                self._journal.record(snapshot)
+        with self._lock:
+            state = self._state.to_dict(config=self._config.get())
+            if state == self._published_state:
+                return
+            self._published_state = state
+        if self._ipc:
+            self._ipc.publish({"event": "state", "state": state})
+
+    def _sleep(self, timeout: float) -> None:
+        """Sleep until the timeout, a state-changing control command or stop."""
+        self._wake_event.wait(timeout)
+        self._wake_event.clear()
+
+    def _wake(self) -> None:
+        self._wake_event.set()
+
+    def _install_sighup_handler(self):
+        """Reload the config on SIGHUP; return the previous handler (None if not installed)."""
+        if not hasattr(signal, "SIGHUP") or threading.current_thread() is not threading.main_thread():
+            return None
+        previous = signal.signal(signal.SIGHUP, lambda _signum, _frame: self._config.request_reload())
+        return signal.SIG_DFL if previous is None else previous
+
     # @cpt-algo:cpt-overwork-alert-spec-cli-control-algo-handle-command:p1
     def _handle_request(self, req: ControlRequest) -> dict:
         """Handle a validated control request from the local Unix socket."""
@@ -257,7 +390,7 @@ class Daemon:
         with self._lock:
             if cmd == "status":
                 # @cpt-flow:cpt-overwork-alert-spec-cli-control-flow-status:p1
-                config = load_config(self._config_path)
+                config = self._config.get()
                 # @cpt-begin:cpt-overwork-alert-spec-cli-control-algo-handle-command:p1:inst-handle-status
                 # @cpt-begin:cpt-overwork-alert-spec-cli-control-flow-status:p1:inst-return-status
                 return {"ok": True, "state": self._state.to_dict(config=config)}
@@ -271,6 +404,7 @@ class Daemon:
                 # @cpt-begin:cpt-overwork-alert-spec-tracker-core-state-tracker-status:p1:inst-transition-pause
                 self._state.status = TrackerStatus.PAUSED
                 # @cpt-end:cpt-overwork-alert-spec-tracker-core-state-tracker-status:p1:inst-transition-pause
+                self._wake()
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-algo-handle-command:p1:inst-handle-pause
                 return {"ok": True}
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-flow-pause:p1:inst-daemon-pause
@@ -282,6 +416,7 @@ class Daemon:
                 # @cpt-begin:cpt-overwork-alert-spec-tracker-core-state-tracker-status:p1:inst-transition-resume
                 self._state.status = TrackerStatus.RUNNING
                 # @cpt-end:cpt-overwork-alert-spec-tracker-core-state-tracker-status:p1:inst-transition-resume
+                self._wake()
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-algo-handle-command:p1:inst-handle-resume
                 return {"ok": True}
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-flow-resume:p1:inst-daemon-resume
@@ -297,6 +432,7 @@ class Daemon:
                 # @cpt-end:cpt-overwork-alert-spec-notifications-state-over-limit:p1:inst-transition-reset
 
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-flow-reset:p1:inst-clear-state
+                self._wake()
 
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-algo-handle-command:p1:inst-handle-reset
                 return {"ok": True}
@@ -306,6 +442,7 @@ class Daemon:
                 # @cpt-begin:cpt-overwork-alert-spec-cli-control-flow-stop:p1:inst-daemon-stop
                 # @cpt-begin:cpt-overwork-alert-spec-cli-control-algo-handle-command:p1:inst-handle-stop
                 self._stop_event.set()
+                self._wake()
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-algo-handle-command:p1:inst-handle-stop
                 return {"ok": True}
                 # @cpt-end:cpt-overwork-alert-spec-cli-control-flow-stop:p1:inst-daemon-stop
@@ -1,41 +1,132 @@
-"""macOS idle time sampling via `ioreg` (best-effort)."""
+"""Idle time sampling (best-effort).
+
+The daemon reads idle time through an `IdleProvider`. On macOS the default samples
+`ioreg` once per tick; elsewhere, e.g. on Linux CI, a file or callable provider
+stands in so the daemon loop runs without subprocesses. `CachedIdleProvider` shares
+one sample between callers that poll more often than its TTL.
+"""
 
 from __future__ import annotations
 
 import logging
+import os
 import re
 import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Protocol
 
 logger = logging.getLogger(__name__)
 
 _IDLE_RE = re.compile(r"\"HIDIdleTime\"\s*=\s*(\d+)")
 
+# Environment override: read idle seconds from this file instead of ioreg.
+IDLE_FILE_ENV = "OVERWORK_ALERT_IDLE_FILE"
+
+
+class IdleProvider(Protocol):
+    """Source of the user's current idle time."""
+
+    def idle_seconds(self) -> int | None:
+        """Return current idle seconds, or None if the sample is unavailable."""
+        ...
+
+
+class IoregIdleProvider:
+    """macOS idle time from `ioreg -c IOHIDSystem` (one subprocess per sample)."""
+
+    def idle_seconds(self) -> int | None:
+        try:
+            proc = subprocess.run(
+                ["ioreg", "-c", "IOHIDSystem"],
+                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except OSError:
+            logger.warning("Failed to invoke ioreg", exc_info=True)
+            return None
+
+        if proc.returncode != 0:
+            logger.warning("ioreg returned non-zero exit code: %s", proc.returncode)
+            return None
+
+        m = _IDLE_RE.search(proc.stdout)
+        if not m:
+            return None
+
+        try:
+            idle_ns = int(m.group(1))
+        except ValueError:
+            return None
+
+        return idle_ns // 1_000_000_000
+
+
+class CachedIdleProvider:
+    """Reuse another provider's sample for `ttl_seconds`."""
+
+    def __init__(
+        self,
+        provider: IdleProvider,
+        *,
+        ttl_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._provider = provider
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sampled_at: float | None = None
+        self._sample: int | None = None
+
+    def idle_seconds(self) -> int | None:
+        with self._lock:
+            now = self._clock()
+            if self._sampled_at is None or now - self._sampled_at >= self._ttl_seconds:
+                self._sample = self._provider.idle_seconds()
+                self._sampled_at = now
+            return self._sample
+
+
+class CallableIdleProvider:
+    """Idle time from a callable (tests, simulations)."""
+
+    def __init__(self, fn: Callable[[], int | None]) -> None:
+        self._fn = fn
+
+    def idle_seconds(self) -> int | None:
+        return self._fn()
+
+
+class FileIdleProvider:
+    """Idle seconds read from a text file holding one integer (Linux stand-in)."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def idle_seconds(self) -> int | None:
+        try:
+            n = int(self._path.read_text(encoding="utf-8").strip())
+        except (OSError, ValueError):
+            return None
+        return n if n >= 0 else None
+
+
+def default_idle_provider() -> IdleProvider:
+    """Return the daemon's idle provider ($OVERWORK_ALERT_IDLE_FILE, else ioreg).
+
+    The tick loop is the only sampler and ticks at most every few seconds, so ioreg
+    is not wrapped in a `CachedIdleProvider`.
+    """
+    idle_file = os.environ.get(IDLE_FILE_ENV)
+    if idle_file:
+        return FileIdleProvider(Path(idle_file))
+    return IoregIdleProvider()
+
 
 def get_idle_seconds() -> int | None:
     """Return current idle seconds, or None if the sample is unavailable."""
-    try:
-        proc = subprocess.run(
-            ["ioreg", "-c", "IOHIDSystem"],
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-    except OSError:
-        logger.warning("Failed to invoke ioreg", exc_info=True)
-        return None
-
-    if proc.returncode != 0:
-        logger.warning("ioreg returned non-zero exit code: %s", proc.returncode)
-        return None
-
-    m = _IDLE_RE.search(proc.stdout)
-    if not m:
-        return None
-
-    try:
-        idle_ns = int(m.group(1))
-    except ValueError:
-        return None
-
-    return idle_ns // 1_000_000_000
+    return IoregIdleProvider().idle_seconds()
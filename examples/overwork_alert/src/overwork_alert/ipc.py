@@ -1,15 +1,27 @@
-"""Local-only control channel (Unix domain socket + JSON request/response)."""
+"""Local-only control channel (Unix domain socket + newline-delimited JSON).
+
+Each request and response is one JSON object per line. Connections are persistent:
+a client may pipeline several requests and reads the responses in order. After a
+`subscribe` request the daemon also pushes `{"event": "state", ...}` lines whenever
+the tracker state changes. A client that half-closes its side (the original one-shot
+protocol) gets its responses and then EOF.
+"""
 
 from __future__ import annotations
 
 import json
 import os
+import selectors
 import socket
-import socketserver
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
+# Longest accepted request line; longer input is answered with an error and closed.
+MAX_REQUEST_BYTES = 64 * 1024
+# A subscriber that falls this far behind is disconnected.
+MAX_PENDING_OUTPUT_BYTES = 1024 * 1024
+
 
 class ControlChannelError(RuntimeError):
     """Raised when the CLI cannot communicate with the daemon."""
@@ -24,55 +36,41 @@ class ControlRequest:
     cmd: str
 
 
-def _read_all(rfile) -> bytes:
-    chunks: list[bytes] = []
-    while True:
-        buf = rfile.read(4096)
-        if not buf:
-            break
-        chunks.append(buf)
-    return b"".join(chunks)
-
-
-class _ControlHandler(socketserver.StreamRequestHandler):
-    """Socket handler for a single request/response."""
-
-    # @cpt-state:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1
-    def handle(self) -> None:
-        raw = _read_all(self.rfile)
-        try:
-            data = json.loads(raw.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError):
-            self.wfile.write(json.dumps({"ok": False, "error": "invalid_json"}).encode("utf-8"))
-            return
+# @cpt-state:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1
+def _parse_request(raw: bytes) -> ControlRequest | dict[str, Any]:
+    """Return the validated request, or the error response for an invalid one."""
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return {"ok": False, "error": "invalid_json"}
 
-        if not isinstance(data, dict):
-            self.wfile.write(json.dumps({"ok": False, "error": "invalid_request"}).encode("utf-8"))
-            return
+    if not isinstance(data, dict):
+        return {"ok": False, "error": "invalid_request"}
 
-        cmd = data.get("cmd")
-        if not isinstance(cmd, str) or not cmd:
-            self.wfile.write(json.dumps({"ok": False, "error": "invalid_command"}).encode("utf-8"))
-            return
+    cmd = data.get("cmd")
+    if not isinstance(cmd, str) or not cmd:
+        return {"ok": False, "error": "invalid_command"}
 
-        # @cpt-begin:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-validated
-        req = ControlRequest(cmd=cmd)
-        # @cpt-end:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-validated
+    # @cpt-begin:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-validated
+    return ControlRequest(cmd=cmd)
+    # @cpt-end:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-validated
 
-        handler: Callable[[ControlRequest], dict[str, Any]] = self.server.request_handler  # type: ignore[attr-defined]
-        resp = handler(req)
 
-        # @cpt-begin:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-responded
-        self.wfile.write(json.dumps(resp).encode("utf-8"))
-        # @cpt-end:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-responded
+def _encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message).encode("utf-8") + b"\n"
 
 
-class _ThreadingUnixStreamServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
-    daemon_threads = True
+@dataclass
+class _Connection:
+    sock: socket.socket
+    inbuf: bytearray = field(default_factory=bytearray)
+    outbuf: bytearray = field(default_factory=bytearray)
+    subscribed: bool = False
+    closing: bool = False
 
 
 class ControlServer:
-    """Threaded Unix socket server providing local control commands."""
+    """Single-threaded, selector-based Unix socket server for local control commands."""
 
     def __init__(
         self,
@@ -82,7 +80,14 @@ class ControlServer:
     ) -> None:
         self._socket_path = socket_path
         self._request_handler = request_handler
-        self._server: _ThreadingUnixStreamServer | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._listener: socket.socket | None = None
+        self._wake_r: socket.socket | None = None
+        self._wake_w: socket.socket | None = None
+        self._connections: dict[int, _Connection] = {}
+        self._outbox: list[bytes] = []
+        self._outbox_lock = threading.Lock()
+        self._running = False
         self._thread: threading.Thread | None = None
 
     @property
@@ -93,24 +98,192 @@ class ControlServer:
         """Start the control server in a background thread."""
         self._cleanup_stale_socket()
 
-        server = _ThreadingUnixStreamServer(self._socket_path, _ControlHandler)
-        server.request_handler = self._request_handler  # type: ignore[attr-defined]
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self._socket_path)
         os.chmod(self._socket_path, 0o600)
-
-        self._server = server
-        self._thread = threading.Thread(target=server.serve_forever, name="overwork-alert-ipc", daemon=True)
+        listener.listen()
+        listener.setblocking(False)
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(listener, selectors.EVENT_READ, "accept")
+        self._selector.register(self._wake_r, selectors.EVENT_READ, "wake")
+        self._listener = listener
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="overwork-alert-ipc", daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
-        """Stop the control server and remove its socket file."""
-        if not self._server:
+        """Stop the control server, close all connections and remove its socket file."""
+        if not self._thread:
             return
 
-        self._server.shutdown()
-        self._server.server_close()
-        self._server = None
+        self._running = False
+        self._wake()
+        self._thread.join()
+        self._thread = None
+        for conn in list(self._connections.values()):
+            self._close(conn)
+        assert self._selector and self._listener and self._wake_r and self._wake_w
+        self._selector.close()
+        self._listener.close()
+        self._wake_r.close()
+        self._wake_w.close()
         self._cleanup_stale_socket()
 
+    def publish(self, message: dict[str, Any]) -> None:
+        """Push a message to every subscribed connection (thread-safe)."""
+        with self._outbox_lock:
+            self._outbox.append(_encode(message))
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            if self._wake_w:
+                self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            # A pending wake byte already guarantees the loop will run.
+            pass
+
+    def _serve(self) -> None:
+        assert self._selector
+        while self._running:
+            for key, mask in self._selector.select():
+                if key.data == "accept":
+                    self._accept()
+                elif key.data == "wake":
+                    self._drain_wake()
+                else:
+                    conn: _Connection = key.data
+                    if mask & selectors.EVENT_READ:
+                        self._read(conn)
+                    if mask & selectors.EVENT_WRITE and conn.sock.fileno() != -1:
+                        self._write(conn)
+
+    def _accept(self) -> None:
+        assert self._listener and self._selector
+        try:
+            sock, _addr = self._listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        sock.setblocking(False)
+        conn = _Connection(sock=sock)
+        self._connections[sock.fileno()] = conn
+        self._selector.register(sock, selectors.EVENT_READ, conn)
+
+    def _drain_wake(self) -> None:
+        assert self._wake_r
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        with self._outbox_lock:
+            messages, self._outbox = self._outbox, []
+        if not messages:
+            return
+        payload = b"".join(messages)
+        for conn in list(self._connections.values()):
+            if conn.subscribed and not conn.closing:
+                self._send(conn, payload)
+
+    def _read(self, conn: _Connection) -> None:
+        try:
+            data = conn.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(conn)
+            return
+
+        if not data:
+            # Half-close: answer a final unterminated request, flush, then close.
+            if conn.inbuf.strip():
+                self._respond(conn, bytes(conn.inbuf))
+            conn.inbuf.clear()
+            self._finish(conn)
+            return
+
+        conn.inbuf += data
+        while not conn.closing:
+            line, sep, rest = conn.inbuf.partition(b"\n")
+            if not sep:
+                break
+            conn.inbuf = bytearray(rest)
+            if line.strip():
+                self._respond(conn, bytes(line))
+        if len(conn.inbuf) > MAX_REQUEST_BYTES and not conn.closing:
+            conn.inbuf.clear()
+            self._send(conn, _encode({"ok": False, "error": "invalid_request"}))
+            self._finish(conn)
+
+    def _respond(self, conn: _Connection, raw: bytes) -> None:
+        req = _parse_request(raw)
+        if isinstance(req, ControlRequest) and req.cmd == "subscribe":
+            conn.subscribed = True
+            resp: dict[str, Any] = {"ok": True}
+        elif isinstance(req, ControlRequest):
+            resp = self._request_handler(req)
+        else:
+            resp = req
+
+        # @cpt-begin:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-responded
+        self._send(conn, _encode(resp))
+        # @cpt-end:cpt-overwork-alert-spec-cli-control-state-request-lifecycle:p1:inst-transition-responded
+
+    def _send(self, conn: _Connection, payload: bytes) -> None:
+        if conn.sock.fileno() == -1:
+            return
+        if len(conn.outbuf) + len(payload) > MAX_PENDING_OUTPUT_BYTES:
+            self._close(conn)
+            return
+        was_empty = not conn.outbuf
+        conn.outbuf += payload
+        if was_empty:
+            self._write(conn)
+
+    def _write(self, conn: _Connection) -> None:
+        assert self._selector
+        if conn.outbuf:
+            try:
+                sent = conn.sock.send(conn.outbuf)
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            except OSError:
+                self._close(conn)
+                return
+            del conn.outbuf[:sent]
+        if conn.outbuf:
+            self._selector.modify(conn.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, conn)
+        elif conn.closing:
+            self._close(conn)
+        else:
+            self._selector.modify(conn.sock, selectors.EVENT_READ, conn)
+
+    def _finish(self, conn: _Connection) -> None:
+        """Close the connection once its pending output is written."""
+        conn.closing = True
+        conn.subscribed = False
+        if not conn.outbuf:
+            self._close(conn)
+
+    def _close(self, conn: _Connection) -> None:
+        fd = conn.sock.fileno()
+        if fd == -1:
+            return
+        self._connections.pop(fd, None)
+        if self._selector:
+            try:
+                self._selector.unregister(conn.sock)
+            except (KeyError, ValueError):
+                pass
+        try:
+            conn.sock.close()
+        except OSError:
+            pass
+
     def _cleanup_stale_socket(self) -> None:
         try:
             st = os.stat(self._socket_path)
@@ -133,41 +306,68 @@ def stat_is_socket(mode: int) -> bool:
     return (mode & 0o170000) == 0o140000
 
 
-def send_request(*, socket_path: str, payload: dict[str, Any], timeout_seconds: float) -> dict[str, Any]:
-    """Send one JSON request to the daemon and return the decoded response."""
-    data = json.dumps(payload).encode("utf-8")
+class ControlClient:
+    """Persistent connection to the daemon's control socket."""
 
-    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    try:
-        s.settimeout(timeout_seconds)
-        s.connect(socket_path)
-        s.sendall(data)
+    def __init__(self, *, socket_path: str, timeout_seconds: float | None) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._buf = bytearray()
         try:
-            s.shutdown(socket.SHUT_WR)
+            self._sock.settimeout(timeout_seconds)
+            self._sock.connect(socket_path)
+        except (OSError, TimeoutError) as e:
+            self._sock.close()
+            raise ControlChannelError("Daemon unreachable") from e
+
+    def __enter__(self) -> ControlClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        try:
+            self._sock.close()
         except OSError:
             pass
 
-        resp_chunks: list[bytes] = []
-        while True:
-            buf = s.recv(4096)
-            if not buf:
-                break
-            resp_chunks.append(buf)
-
-        resp_raw = b"".join(resp_chunks)
+    def send(self, payload: dict[str, Any]) -> None:
+        """Send one request without waiting for its response (pipelining)."""
+        try:
+            self._sock.sendall(_encode(payload))
+        except (OSError, TimeoutError) as e:
+            raise ControlChannelError("Daemon unreachable") from e
+
+    def receive(self) -> dict[str, Any] | None:
+        """Return the next response or pushed event; None once the daemon closed."""
+        while b"\n" not in self._buf:
+            try:
+                chunk = self._sock.recv(65536)
+            except (OSError, TimeoutError) as e:
+                raise ControlChannelError("Daemon unreachable") from e
+            if not chunk:
+                return None
+            self._buf += chunk
+        line, _sep, rest = self._buf.partition(b"\n")
+        self._buf = bytearray(rest)
         try:
-            resp = json.loads(resp_raw.decode("utf-8"))
+            msg = json.loads(line.decode("utf-8"))
         except (UnicodeDecodeError, json.JSONDecodeError) as e:
             raise ControlChannelError("Invalid response JSON") from e
-
-        if not isinstance(resp, dict):
+        if not isinstance(msg, dict):
             raise ControlChannelError("Invalid response payload")
-
+        return msg
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one request and return its response."""
+        self.send(payload)
+        resp = self.receive()
+        if resp is None:
+            raise ControlChannelError("Daemon closed the connection")
         return resp
-    except (OSError, TimeoutError) as e:
-        raise ControlChannelError("Daemon unreachable") from e
-    finally:
-        try:
-            s.close()
-        except OSError:
-            pass
+
+
+def send_request(*, socket_path: str, payload: dict[str, Any], timeout_seconds: float) -> dict[str, Any]:
+    """Send one JSON request to the daemon and return the decoded response."""
+    with ControlClient(socket_path=socket_path, timeout_seconds=timeout_seconds) as client:
+        return client.request(payload)
@@ -0,0 +1,217 @@
+"""Crash-safe, append-only journal of tracker state.
+
+Every record is a full (small) `TrackerState` snapshot on its own line, prefixed with
+a CRC32 of the JSON text. State transitions (pause/resume, reset, notification state)
+are appended and fsynced immediately. Ticks only change accumulated time, so they are
+folded into a checkpoint at most every `checkpoint_interval_seconds`; checkpoints are
+flushed to the OS right away and fsynced in batches.
+
+Recovery reads backwards from the end of the file to the last record with a valid CRC
+(skipping a torn tail), so it costs O(journal tail). On startup the journal is
+compacted to that single record.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable
+
+from .models import TrackerState, TrackerStatus
+
+logger = logging.getLogger(__name__)
+
+_TICK_FIELDS = ("active_time_seconds", "last_tick_at")
+_TAIL_BLOCK_BYTES = 4096
+
+
+def _state_to_dict(state: TrackerState) -> dict[str, Any]:
+    return {
+        "status": state.status.value,
+        "active_time_seconds": int(state.active_time_seconds),
+        "last_tick_at": state.last_tick_at,
+        "over_limit_since": state.over_limit_since,
+        "last_reminder_at": state.last_reminder_at,
+    }
+
+
+def _state_from_dict(data: dict[str, Any]) -> TrackerState:
+    return TrackerState(
+        status=TrackerStatus(data["status"]),
+        active_time_seconds=int(data["active_time_seconds"]),
+        last_tick_at=data.get("last_tick_at"),
+        over_limit_since=data.get("over_limit_since"),
+        last_reminder_at=data.get("last_reminder_at"),
+    )
+
+
+def _encode_record(kind: str, state: dict[str, Any]) -> bytes:
+    body = json.dumps({"kind": kind, "state": state}, sort_keys=True, separators=(",", ":"))
+    return f"{zlib.crc32(body.encode('utf-8')):08x} {body}\n".encode("utf-8")
+
+
+def _decode_record(line: bytes) -> dict[str, Any] | None:
+    """Return the record's state dict, or None if the line is torn or corrupt."""
+    crc, sep, body = line.strip().partition(b" ")
+    if not sep:
+        return None
+    try:
+        if int(crc, 16) != zlib.crc32(body):
+            return None
+        rec = json.loads(body.decode("utf-8"))
+        state = rec["state"]
+        _state_from_dict(state)
+    except (ValueError, KeyError, TypeError, UnicodeDecodeError):
+        return None
+    return state
+
+
+def _read_last_record(path: Path) -> dict[str, Any] | None:
+    """Return the last valid record's state, scanning blocks backwards from the end."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        tail = b""
+        pos = end
+        while pos > 0:
+            step = min(_TAIL_BLOCK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            lines = tail.split(b"\n")
+            # lines[0] may be cut by the block boundary unless we reached the start.
+            complete = lines if pos == 0 else lines[1:]
+            for line in reversed(complete):
+                if line.strip():
+                    state = _decode_record(line)
+                    if state is not None:
+                        return state
+            tail = lines[0] if pos > 0 else b""
+    return None
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class StateJournal:
+    """Append-only tracker state journal with checkpoints and batched fsync."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        checkpoint_interval_seconds: float = 30.0,
+        fsync_interval_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._path = path
+        self._checkpoint_interval_seconds = checkpoint_interval_seconds
+        self._fsync_interval_seconds = fsync_interval_seconds
+        self._clock = clock
+        self._file = None
+        self._last: dict[str, Any] | None = None
+        self._last_checkpoint_at = 0.0
+        self._last_fsync_at = 0.0
+        self._unsynced = False
+        self.records_written = 0
+        self.fsyncs = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def recover(self) -> TrackerState:
+        """Return the last consistent state and compact the journal to it.
+
+        The restored state has no `last_tick_at`, so downtime is never counted as
+        active time; the daemon's first tick re-initializes it.
+        """
+        data = _read_last_record(self._path)
+        state = TrackerState() if data is None else _state_from_dict(data)
+        state.last_tick_at = None
+        self._compact(state)
+        return state
+
+    def record(self, state: TrackerState) -> None:
+        """Journal the state after a tick or command (writes only when needed)."""
+        data = _state_to_dict(state)
+        if data == self._last:
+            return
+        now = self._clock()
+        # Ticks only ever add time, so a drop is a reset even if nothing else changed.
+        transition = (
+            self._last is None
+            or data["active_time_seconds"] < self._last["active_time_seconds"]
+            or any(data[k] != self._last[k] for k in data if k not in _TICK_FIELDS)
+        )
+        if not transition and now - self._last_checkpoint_at < self._checkpoint_interval_seconds:
+            return
+        self._append("transition" if transition else "checkpoint", data)
+        self._last_checkpoint_at = now
+        if transition or now - self._last_fsync_at >= self._fsync_interval_seconds:
+            self._sync(now)
+
+    def close(self, state: TrackerState | None = None) -> None:
+        """Write a final checkpoint (if given), fsync and close."""
+        if self._file is None:
+            return
+        if state is not None and _state_to_dict(state) != self._last:
+            self._append("checkpoint", _state_to_dict(state))
+        self._sync(self._clock())
+        self._file.close()
+        self._file = None
+
+    def _append(self, kind: str, data: dict[str, Any]) -> None:
+        if self._file is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._path, "ab")
+        self._file.write(_encode_record(kind, data))
+        self._file.flush()
+        self._last = data
+        self._unsynced = True
+        self.records_written += 1
+
+    def _sync(self, now: float) -> None:
+        if self._file is None or not self._unsynced:
+            return
+        try:
+            os.fsync(self._file.fileno())
+        except OSError:
+            logger.warning("Journal fsync failed", exc_info=True)
+        self._last_fsync_at = now
+        self._unsynced = False
+        self.fsyncs += 1
+
+    def _compact(self, state: TrackerState) -> None:
+        """Atomically replace the journal with a single checkpoint of `state`."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        data = _state_to_dict(state)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_encode_record("checkpoint", data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path)
+        _fsync_dir(self._path.parent)
+        self._last = data
+        self._last_checkpoint_at = self._last_fsync_at = self._clock()
@@ -26,6 +26,8 @@ class Config:
     tick_interval_seconds: int = 5
     max_tick_delta_seconds: int = 10
     control_socket_path: str = "/tmp/overwork-alert.sock"
+    # Append-only state journal (empty: state is kept in memory only)
+    state_journal_path: str = ""
 
 
 @dataclass
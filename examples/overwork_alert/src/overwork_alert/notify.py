@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+import queue
 import subprocess
+import threading
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -27,3 +30,74 @@ def send_notification(*, title: str, message: str) -> bool:
         return False
 
     return proc.returncode == 0
+
+
+class NotificationWorker:
+    """Deliver notifications on a dedicated background thread.
+
+    `submit()` only enqueues, so a caller holding the daemon state lock never waits
+    for `osascript`. An alert identical to one still pending or in flight is
+    coalesced; when the bounded queue is full the alert is dropped (the policy will
+    remind again later).
+    """
+
+    def __init__(self, *, send: Callable[..., bool] = send_notification, max_pending: int = 4) -> None:
+        self._send = send
+        self._queue: queue.Queue[tuple[str, str] | None] = queue.Queue(maxsize=max_pending)
+        self._pending: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        """Start the delivery thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="overwork-alert-notify", daemon=True)
+        self._thread.start()
+
+    def stop(self, *, timeout_seconds: float = 2.0) -> None:
+        """Deliver what is queued (within the timeout) and stop the thread."""
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout_seconds)
+        except queue.Full:
+            pass
+        self._thread.join(timeout_seconds)
+        self._thread = None
+
+    def submit(self, *, title: str, message: str) -> bool:
+        """Queue a notification. Returns False if it had to be dropped."""
+        key = (title, message)
+        with self._lock:
+            if key in self._pending:
+                self.coalesced += 1
+                return True
+            try:
+                self._queue.put_nowait(key)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending.add(key)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            title, message = item
+            try:
+                ok = self._send(title=title, message=message)
+            except Exception:
+                logger.warning("Notification delivery raised", exc_info=True)
+                ok = False
+            with self._lock:
+                self._pending.discard(item)
+                if ok:
+                    self.delivered += 1
+            if not ok:
+                logger.warning("Notification delivery failed")
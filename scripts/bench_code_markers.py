@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Microbenchmark: code marker scanning on a large marker-free source tree.
+
+Compares `CodeFile.load()` (whole-file prefilter + single tokenizer regex) with the
+previous per-line, three-regex scan. The tree is generated in a temporary directory.
+
+Usage:
+    python scripts/bench_code_markers.py [--files 2000] [--lines 400] [--repeat 3]
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills" / "cypilot" / "scripts"))
+
+from cypilot.utils.codebase import CodeFile  # noqa: E402
+
+_LEGACY_SCOPE_RE = re.compile(
+    r"@cpt-(?!begin:)(?!end:)(?P<kind>[a-z][a-z0-9-]*):(?P<id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<phase>\d+)"
+)
+_LEGACY_BEGIN_RE = re.compile(
+    r"@cpt-begin:(?P<id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<phase>\d+):inst-(?P<inst>[a-z0-9-]+)"
+)
+_LEGACY_END_RE = re.compile(
+    r"@cpt-end:(?P<id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<phase>\d+):inst-(?P<inst>[a-z0-9-]+)"
+)
+
+_SOURCE_LINE = "    value = compute(item, cpt_cache[index])  # regular code, no traceability markers\n"
+
+
+def _legacy_scan(path: Path) -> int:
+    found = 0
+    for line in path.read_text(encoding="utf-8").splitlines():
+        for rx in (_LEGACY_SCOPE_RE, _LEGACY_BEGIN_RE, _LEGACY_END_RE):
+            for _m in rx.finditer(line):
+                found += 1
+    return found
+
+
+def _current_scan(path: Path) -> int:
+    cf, _errs = CodeFile.from_path(path)
+    return len(cf.references) if cf is not None else 0
+
+
+def _generate_tree(root: Path, files: int, lines: int) -> List[Path]:
+    body = "def handler(item, index):\n" + _SOURCE_LINE * max(lines - 1, 0)
+    out: List[Path] = []
+    for i in range(files):
+        sub = root / f"pkg{i % 50:02d}"
+        sub.mkdir(parents=True, exist_ok=True)
+        p = sub / f"module_{i:05d}.py"
+        p.write_text(body, encoding="utf-8")
+        out.append(p)
+    return out
+
+
+def _time(fn: Callable[[Path], int], paths: List[Path], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for p in paths:
+            fn(p)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark code marker scanning on a marker-free tree")
+    p.add_argument("--files", type=int, default=2000, help="Number of generated source files")
+    p.add_argument("--lines", type=int, default=400, help="Lines per generated file")
+    p.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is reported)")
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = _generate_tree(Path(tmpdir), args.files, args.lines)
+        total_lines = args.files * args.lines
+        legacy = _time(_legacy_scan, paths, args.repeat)
+        current = _time(_current_scan, paths, args.repeat)
+
+    print(f"tree: {args.files} files x {args.lines} lines = {total_lines} lines (no markers)")
+    print(f"legacy three-regex per-line scan: {legacy * 1000:.1f} ms")
+    print(f"prefiltered CodeFile.load:        {current * 1000:.1f} ms")
+    if current > 0:
+        print(f"speedup: {legacy / current:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-tick persistence cost of the overwork_alert state journal.
+
+Compares `StateJournal.record` (transitions fsynced immediately, ticks folded into
+periodic checkpoints with batched fsync) with rewriting a full JSON snapshot on
+every tick (tmp file + fsync + rename). Ticks are simulated with a fake clock
+(3600 ticks of 5 s are five hours of daemon time); every `--transition-every`-th
+tick toggles pause/resume. Files are written to a temporary directory.
+
+Usage:
+    python scripts/bench_overwork_journal.py [--ticks 3600] [--tick-seconds 5] [--transition-every 720]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "examples" / "overwork_alert" / "src"))
+
+from overwork_alert.journal import StateJournal, _state_to_dict  # noqa: E402
+from overwork_alert.models import TrackerState, TrackerStatus, clone_state  # noqa: E402
+
+
+def _simulate(ticks: int, tick_seconds: float, transition_every: int) -> List[TrackerState]:
+    states: List[TrackerState] = []
+    state = TrackerState(status=TrackerStatus.RUNNING)
+    for i in range(1, ticks + 1):
+        now = i * tick_seconds
+        if transition_every and i % transition_every == 0:
+            paused = state.status == TrackerStatus.PAUSED
+            state.status = TrackerStatus.RUNNING if paused else TrackerStatus.PAUSED
+        elif state.status == TrackerStatus.RUNNING:
+            state.active_time_seconds += int(tick_seconds)
+        state.last_tick_at = now
+        states.append(clone_state(state))
+    return states
+
+
+def _legacy_snapshot(path: Path, states: List[TrackerState]) -> tuple[float, int]:
+    tmp = path.with_name(path.name + ".tmp")
+    t0 = time.perf_counter()
+    for state in states:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_state_to_dict(state), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    return time.perf_counter() - t0, len(states)
+
+
+def _journal(path: Path, states: List[TrackerState], tick_seconds: float) -> tuple[float, StateJournal]:
+    clock = [0.0]
+    journal = StateJournal(path, clock=lambda: clock[0])
+    journal.recover()
+    t0 = time.perf_counter()
+    for i, state in enumerate(states, start=1):
+        clock[0] = i * tick_seconds
+        journal.record(state)
+    journal.close(states[-1])
+    return time.perf_counter() - t0, journal
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark overwork_alert state persistence per tick")
+    p.add_argument("--ticks", type=int, default=3600, help="Number of simulated ticks")
+    p.add_argument("--tick-seconds", type=float, default=5.0, help="Simulated seconds between ticks")
+    p.add_argument("--transition-every", type=int, default=720, help="Toggle pause/resume every N ticks (0: never)")
+    args = p.parse_args()
+
+    states = _simulate(max(args.ticks, 1), args.tick_seconds, max(args.transition_every, 0))
+    with tempfile.TemporaryDirectory(prefix="overwork-journal-bench-") as tmp:
+        legacy, legacy_fsyncs = _legacy_snapshot(Path(tmp) / "state.json", states)
+        current, journal = _journal(Path(tmp) / "state.journal", states, args.tick_seconds)
+        restored = StateJournal(Path(tmp) / "state.journal").recover()
+
+    last = states[-1]
+    if (restored.status, restored.active_time_seconds) != (last.status, last.active_time_seconds):
+        print("MISMATCH: recovered state differs from the last recorded state", file=sys.stderr)
+        return 1
+
+    n = len(states)
+    print(f"simulated: {n} ticks ({n * args.tick_seconds / 3600:.1f} h of daemon time)")
+    print(f"snapshot per tick:  {legacy / n * 1e6:8.1f} us/tick, {legacy_fsyncs} fsyncs")
+    print(
+        f"state journal:      {current / n * 1e6:8.1f} us/tick, {journal.fsyncs} fsyncs, "
+        f"{journal.records_written} records"
+    )
+    if current > 0:
+        print(f"speedup: {legacy / current:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
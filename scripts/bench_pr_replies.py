@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Microbenchmark: reply detection over a long PR conversation.
+
+Compares `pr._detect_pr_replies` (newest-first sweep over a precomputed quote
+set) with the previous pairwise scan that re-split and re-lowercased every later
+reply for each reviewer comment. The conversation is generated in memory.
+
+Usage:
+    python scripts/bench_pr_replies.py [--comments 2000] [--reply-every 3] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills" / "scripts"))
+
+import pr  # noqa: E402
+
+_AUTHOR = "author"
+_REVIEWERS = ("alice", "bob", "carol", "coderabbitai[bot]")
+
+
+def _legacy_has_quote_match(original_body: str, reply_body: str) -> bool:
+    quoted = []
+    for line in reply_body.splitlines():
+        s = line.strip()
+        if s.startswith(">"):
+            txt = s.lstrip(">").strip()
+            if txt and not txt.startswith("@"):
+                quoted.append(txt.lower())
+    if not quoted:
+        return False
+    orig_lower = original_body.lower()
+    return any(q in orig_lower for q in quoted)
+
+
+def _legacy_detect(comments: List[Dict], pr_author: str) -> Set[str]:
+    replied = set()
+    human = [c for c in comments if not pr._is_bot(c.get("author", {}).get("login", ""))]
+    for i, c in enumerate(human):
+        if c.get("author", {}).get("login", "") == pr_author:
+            continue
+        c_body = c.get("body") or ""
+        for j in range(i + 1, len(human)):
+            r = human[j]
+            if r.get("author", {}).get("login", "") != pr_author:
+                continue
+            if _legacy_has_quote_match(c_body, r.get("body") or ""):
+                replied.add(c.get("url", ""))
+                break
+    return replied
+
+
+def _generate_comments(count: int, reply_every: int) -> List[Dict]:
+    """Reviewer comments, with every `reply_every`-th one answered by a quoting author reply."""
+    comments: List[Dict] = []
+    i = 0
+    while len(comments) < count:
+        login = _REVIEWERS[i % len(_REVIEWERS)]
+        body = (
+            f"Finding {i}: the retry loop in module_{i % 97}.py swallows errors.\n"
+            f"Please handle timeout case {i} explicitly and add a regression test.\n"
+        )
+        comments.append({"author": {"login": login}, "body": body, "url": f"https://example.test/c/{i}"})
+        if i % reply_every == 0 and len(comments) < count:
+            reply = f"> @{login}\n> please handle timeout case {i} explicitly\n\nDone in the latest push."
+            comments.append({"author": {"login": _AUTHOR}, "body": reply, "url": f"https://example.test/r/{i}"})
+        i += 1
+    return comments
+
+
+def _time(fn: Callable[[List[Dict], str], Set[str]], comments: List[Dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(comments, _AUTHOR)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark PR comment reply detection")
+    p.add_argument("--comments", type=int, default=2000, help="Number of generated comments")
+    p.add_argument("--reply-every", type=int, default=3, help="Author replies to every Nth reviewer comment")
+    p.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is reported)")
+    args = p.parse_args()
+
+    comments = _generate_comments(args.comments, max(args.reply_every, 1))
+    expected = _legacy_detect(comments, _AUTHOR)
+    actual = pr._detect_pr_replies(comments, _AUTHOR)
+    if actual != expected:
+        print(f"MISMATCH: legacy found {len(expected)} replies, current found {len(actual)}", file=sys.stderr)
+        return 1
+
+    legacy = _time(_legacy_detect, comments, args.repeat)
+    current = _time(pr._detect_pr_replies, comments, args.repeat)
+
+    print(f"conversation: {len(comments)} comments, {len(expected)} replied")
+    print(f"legacy pairwise scan:     {legacy * 1000:.1f} ms")
+    print(f"indexed quote-set sweep:  {current * 1000:.1f} ms")
+    if current > 0:
+        print(f"speedup: {legacy / current:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
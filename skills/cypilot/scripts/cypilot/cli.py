@@ -32,6 +32,7 @@ from .utils.codebase import (
     CodeFile,
     cross_validate_code,
 )
+from .utils.errors import json_default
 
 
 def _safe_relpath(path: Path, base: Path) -> str:
@@ -407,11 +408,122 @@ def _render_template(lines: List[str], variables: Dict[str, str]) -> str:
     return _ensure_frontmatter_description_quoted(rendered)
 
 
+_PROXY_TARGET_RE = re.compile(r"ALWAYS open and follow `([^`]+)`")
+
+
+def _file_stamp(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [int(st.st_mtime_ns), int(st.st_size)]
+
+
+def _proxy_scan_entry(text: str, stamp: Optional[List[int]]) -> Dict[str, Any]:
+    m = _PROXY_TARGET_RE.search(text)
+    head = "\n".join(text.splitlines()[:5])
+    return {"stamp": stamp, "heading": head.lstrip().startswith("# /"), "target": m.group(1) if m else None}
+
+
+def _proxy_scan(path: Path, manifest: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the proxy markers ("heading", "target") of a file in a workflow dir.
+
+    Served from the agents manifest while the file's (mtime, size) stamp is
+    unchanged; otherwise the file is read once and the manifest is refreshed.
+    Returns None if the file cannot be read.
+    """
+    key = path.as_posix()
+    stamp = _file_stamp(path)
+    entry = manifest.get(key)
+    if isinstance(entry, dict) and stamp is not None and entry.get("stamp") == stamp and "target" in entry:
+        return entry
+    try:
+        text = path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+    entry = _proxy_scan_entry(text, stamp)
+    manifest[key] = entry
+    return entry
+
+
+def _output_unchanged(path: Path, manifest: Dict[str, Any], input_key: str) -> bool:
+    """True if `path` still holds what was rendered from `input_key` last time."""
+    entry = manifest.get(path.as_posix())
+    if not isinstance(entry, dict) or entry.get("input") != input_key:
+        return False
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return False
+    if entry.get("stamp") == stamp:
+        return True
+    # Touched but possibly identical: compare against the recorded output hash.
+    from .utils.cache import digest
+
+    try:
+        current = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return False
+    if digest(current) == entry.get("output"):
+        entry["stamp"] = stamp
+        return True
+    return False
+
+
+def _record_output(path: Path, manifest: Dict[str, Any], input_key: str, content: str) -> None:
+    from .utils.cache import digest
+
+    entry = _proxy_scan_entry(content, _file_stamp(path))
+    entry["input"] = input_key
+    entry["output"] = digest(content)
+    manifest[path.as_posix()] = entry
+
+
+def _self_check_example(example_path: str, template_path: str, kind: str) -> Dict[str, List[Dict[str, object]]]:
+    """Validate one kit example against its template (runs in self-check workers).
+
+    Returns JSON-ready "errors"/"warnings" lists, as stored in the result cache.
+    """
+    from .utils.template import validate_artifact_file_against_template
+
+    rep = validate_artifact_file_against_template(
+        artifact_path=Path(example_path),
+        template_path=Path(template_path),
+        expected_kind=kind,
+    )
+    out = {"errors": list(rep.get("errors", []) or []), "warnings": list(rep.get("warnings", []) or [])}
+    return json.loads(json.dumps(out, ensure_ascii=False, default=json_default))
+
+
+# Below this many uncached examples the default (--jobs 0) runs serially:
+# worker spawn and import cost would outweigh the parallel speedup.
+_SELF_CHECK_POOL_MIN_JOBS = 8
+
+
+def _run_self_check_jobs(jobs: List[Tuple[str, str, str]], workers: int) -> List[Dict[str, List[Dict[str, object]]]]:
+    """Run `_self_check_example` over jobs, in a process pool when workers > 1.
+
+    workers <= 0 picks a default: serial for small batches, else the CPU count.
+    """
+    if workers <= 0:
+        workers = (os.cpu_count() or 1) if len(jobs) >= _SELF_CHECK_POOL_MIN_JOBS else 1
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                return list(pool.map(_self_check_example, *zip(*jobs)))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # No process support here, or a worker died: fall back to serial.
+    return [_self_check_example(*job) for job in jobs]
+
+
 def _cmd_self_check(argv: List[str]) -> int:
     p = argparse.ArgumentParser(prog="self-check", description="Validate registered template examples against templates")
     p.add_argument("--root", default=".", help="Project root to search from (default: current directory)")
     p.add_argument("--kit", "--rule", dest="kit", help="Specific kit ID to check (e.g., cypilot-sdlc)")
     p.add_argument("--verbose", action="store_true", help="Include full per-template error/warning lists")
+    p.add_argument("--jobs", type=int, default=0, help="Worker processes for validating examples (default: CPU count, or serial below 8 uncached examples; 1 = serial)")
+    p.add_argument("--no-cache", action="store_true", help="Revalidate every example and do not update the result cache")
     args = p.parse_args(argv)
 
     start_path = Path(args.root).resolve()
@@ -455,8 +567,17 @@ def _cmd_self_check(argv: List[str]) -> int:
         print(json.dumps({"status": "ERROR", "message": "Template validation module not available"}, indent=2, ensure_ascii=False))
         return 1
 
-    results: List[Dict[str, object]] = []
-    overall_status = "PASS"
+    from .utils.cache import cache_file, digest, file_digest, load_cache, save_cache
+
+    # Results are cached by the digests of template, example and kit constraints.
+    cache_path = cache_file(project_root, "self-check")
+    cache = {} if args.no_cache else load_cache(cache_path)
+    used_cache: Dict[str, object] = {}
+
+    # (item, pre-validation warnings, cache key or None when there is no example)
+    checks: List[Tuple[Dict[str, object], List[Dict[str, object]], Optional[str]]] = []
+    jobs: List[Tuple[str, str, str]] = []
+    job_keys: List[str] = []
     kits_checked = 0
 
     for kit_id, kit_def in kits_cfg.items():
@@ -475,6 +596,7 @@ def _cmd_self_check(argv: List[str]) -> int:
             continue
 
         kits_checked += 1
+        constraints_digest = file_digest(kit_base / "constraints.json")
 
         for kind_dir in sorted(artifacts_dir.iterdir()):
             if not kind_dir.is_dir():
@@ -501,31 +623,57 @@ def _cmd_self_check(argv: List[str]) -> int:
                 "status": "PASS",
             }
 
-            errs: List[Dict[str, object]] = []
-            warns: List[Dict[str, object]] = []
-
             if not example_path:
-                warns.append({"type": "file", "message": "Example not found (skipped)", "path": (kind_dir / "examples").as_posix()})
-            else:
-                rep = validate_artifact_file_against_template(
-                    artifact_path=example_path,
-                    template_path=template_path,
-                    expected_kind=kind,
-                )
-                errs.extend(list(rep.get("errors", []) or []))
-                warns.extend(list(rep.get("warnings", []) or []))
+                warn = {"type": "file", "message": "Example not found (skipped)", "path": (kind_dir / "examples").as_posix()}
+                checks.append((item, [warn], None))
+                continue
 
-            if errs:
-                item["status"] = "FAIL"
-                item["error_count"] = len(errs)
-                item["errors"] = errs  # Always show errors on failure
-                overall_status = "FAIL"
-            if warns:
-                item["warning_count"] = len(warns)
-                if errs or bool(args.verbose):
-                    item["warnings"] = warns  # Show warnings on failure or verbose
+            key = digest(
+                kind,
+                template_path.as_posix(),
+                example_path.as_posix(),
+                file_digest(template_path),
+                file_digest(example_path),
+                constraints_digest,
+            )
+            checks.append((item, [], key))
+            if key in cache:
+                used_cache[key] = cache[key]
+            elif key not in job_keys:
+                jobs.append((example_path.as_posix(), template_path.as_posix(), kind))
+                job_keys.append(key)
+
+    cache_hits = sum(1 for _item, _warns, key in checks if key is not None and key in cache)
+    for key, rep in zip(job_keys, _run_self_check_jobs(jobs, args.jobs)):
+        used_cache[key] = rep
+
+    if not args.no_cache:
+        # A --kit run keeps the other kits' entries; a full run drops stale ones.
+        entries = dict(cache) if args.kit else {}
+        entries.update(used_cache)
+        save_cache(cache_path, entries)
 
-            results.append(item)
+    results: List[Dict[str, object]] = []
+    overall_status = "PASS"
+
+    for item, warns, key in checks:
+        errs: List[Dict[str, object]] = []
+        if key is not None:
+            rep = used_cache[key]
+            errs.extend(rep.get("errors", []))
+            warns = warns + list(rep.get("warnings", []))
+
+        if errs:
+            item["status"] = "FAIL"
+            item["error_count"] = len(errs)
+            item["errors"] = errs  # Always show errors on failure
+            overall_status = "FAIL"
+        if warns:
+            item["warning_count"] = len(warns)
+            if errs or bool(args.verbose):
+                item["warnings"] = warns  # Show warnings on failure or verbose
+
+        results.append(item)
 
     out = {
         "status": overall_status,
@@ -533,76 +681,57 @@ def _cmd_self_check(argv: List[str]) -> int:
         "adapter_dir": adapter_dir.as_posix(),
         "kits_checked": kits_checked,
         "templates_checked": len(results),
+        "cache_hits": cache_hits,
         "results": results,
     }
-    print(json.dumps(out, indent=2, ensure_ascii=False))
+    print(json.dumps(out, indent=2, ensure_ascii=False, default=json_default))
     return 0 if overall_status == "PASS" else 2
 
 
-def _cmd_agents(argv: List[str]) -> int:
-    """Unified command to register both workflows and skills for an agent."""
-    p = argparse.ArgumentParser(prog="agents", description="Generate/update agent-specific workflow proxies and skill outputs")
-    agent_group = p.add_mutually_exclusive_group(required=True)
-    agent_group.add_argument("--agent", help="Agent/IDE key (e.g., windsurf, cursor, claude, copilot, openai)")
-    agent_group.add_argument("--openai", action="store_true", help="Shortcut for --agent openai (OpenAI Codex)")
-    p.add_argument("--root", default=".", help="Project root directory (default: current directory)")
-    p.add_argument("--cypilot-root", default=None, help="Explicit Cypilot core root (optional override)")
-    p.add_argument("--config", default=None, help="Path to unified agents config JSON (default: cypilot-agents.json in project root)")
-    p.add_argument("--dry-run", action="store_true", help="Compute changes without writing files")
-    args = p.parse_args(argv)
-
-    agent = "openai" if bool(getattr(args, "openai", False)) else str(args.agent).strip()
-    if not agent:
-        raise SystemExit("--agent must be non-empty")
-
-    start_path = Path(args.root).resolve()
-    project_root = find_project_root(start_path)
-    if project_root is None:
-        print(json.dumps({
-            "status": "NOT_FOUND",
-            "message": "No project root found (no .git or .cypilot-config.json)",
-            "searched_from": start_path.as_posix(),
-        }, indent=2, ensure_ascii=False))
-        return 1
+class _AgentSources:
+    """Cypilot sources shared by every agent of one `agents` run, each read at most once."""
+
+    def __init__(self, cypilot_root: Path):
+        self.cypilot_root = cypilot_root
+        # Cypilot skill source is always located relative to this script.
+        # `.../skills/cypilot/scripts/cypilot/cli.py` -> `.../skills/cypilot/SKILL.md`
+        self.skill_path = (Path(__file__).resolve().parents[2] / "SKILL.md").resolve()
+        self._workflow_names: Optional[List[str]] = None
+        self._frontmatter: Dict[str, Dict[str, str]] = {}
+        self._digests: Dict[str, str] = {}
+
+    def workflow_names(self) -> List[str]:
+        if self._workflow_names is None:
+            self._workflow_names = [Path(p).stem for p in _list_workflow_files(self.cypilot_root)]
+        return self._workflow_names
+
+    def frontmatter(self, path: Path) -> Dict[str, str]:
+        key = path.as_posix()
+        if key not in self._frontmatter:
+            self._frontmatter[key] = _parse_frontmatter(path)
+        return self._frontmatter[key]
+
+    def digest(self, path: Path) -> str:
+        from .utils.cache import file_digest
+
+        key = path.as_posix()
+        if key not in self._digests:
+            self._digests[key] = file_digest(path)
+        return self._digests[key]
+
+
+def _sync_agent(
+    agent: str,
+    agent_cfg: dict,
+    project_root: Path,
+    sources: _AgentSources,
+    manifest: Dict[str, Any],
+    use_manifest: bool,
+    dry_run: bool,
+) -> Dict[str, Dict[str, Any]]:
+    """Generate/update one agent's workflow proxies and skill outputs."""
+    from .utils.cache import digest
 
-    cypilot_root = Path(args.cypilot_root).resolve() if args.cypilot_root else None
-    if cypilot_root is None:
-        cypilot_root = (Path(__file__).resolve().parents[4])
-        if not ((cypilot_root / "AGENTS.md").exists() and (cypilot_root / "workflows").is_dir()):
-            cypilot_root = Path(__file__).resolve().parents[6]
-
-    cfg_path = Path(args.config).resolve() if args.config else (project_root / "cypilot-agents.json")
-    cfg = _load_json_file(cfg_path)
-
-    recognized = agent in {"windsurf", "cursor", "claude", "copilot", "openai"}
-    if cfg is None:
-        cfg = _default_agents_config() if recognized else {"version": 1, "agents": {agent: {"workflows": {}, "skills": {}}}}
-        if not args.dry_run:
-            _write_json_file(cfg_path, cfg)
-
-    agents_cfg = cfg.get("agents") if isinstance(cfg, dict) else None
-    if isinstance(cfg, dict) and isinstance(agents_cfg, dict) and agent not in agents_cfg:
-        if recognized:
-            defaults = _default_agents_config()
-            default_agents = defaults.get("agents") if isinstance(defaults, dict) else None
-            if isinstance(default_agents, dict) and isinstance(default_agents.get(agent), dict):
-                agents_cfg[agent] = default_agents[agent]
-        else:
-            agents_cfg[agent] = {"workflows": {}, "skills": {}}
-        cfg["agents"] = agents_cfg
-        if not args.dry_run:
-            _write_json_file(cfg_path, cfg)
-
-    if not isinstance(agents_cfg, dict) or agent not in agents_cfg or not isinstance(agents_cfg.get(agent), dict):
-        print(json.dumps({
-            "status": "CONFIG_ERROR",
-            "message": "Agent config missing or invalid",
-            "config_path": cfg_path.as_posix(),
-            "agent": agent,
-        }, indent=2, ensure_ascii=False))
-        return 1
-
-    agent_cfg: dict = agents_cfg[agent]
     workflows_cfg = agent_cfg.get("workflows", {})
     skills_cfg = agent_cfg.get("skills", {})
 
@@ -631,16 +760,21 @@ def _cmd_agents(argv: List[str]) -> int:
         elif not isinstance(template, list) or not all(isinstance(x, str) for x in template):
             workflows_result["errors"].append("Missing or invalid template in workflows config")
         else:
+            template_key = json.dumps(template, ensure_ascii=False)
             workflow_dir = (project_root / workflow_dir_rel).resolve()
-            cypilot_workflow_files = _list_workflow_files(cypilot_root)
-            cypilot_workflow_names = [Path(p).stem for p in cypilot_workflow_files]
+            cypilot_workflow_names = sources.workflow_names()
 
+            # Get custom content from config (optional user-defined section)
+            custom_content = workflows_cfg.get("custom_content", "")
+
+            # Proxies are rendered lazily: only those whose inputs changed since the
+            # last run (per the manifest) have their source frontmatter parsed.
             desired: Dict[str, Dict[str, str]] = {}
             for wf_name in cypilot_workflow_names:
                 command = "cypilot" if wf_name == "cypilot" else f"{prefix}{wf_name}"
                 filename = filename_fmt.format(command=command, workflow_name=wf_name)
                 desired_path = (workflow_dir / filename).resolve()
-                target_workflow_path = (cypilot_root / "workflows" / f"{wf_name}.md").resolve()
+                target_workflow_path = (sources.cypilot_root / "workflows" / f"{wf_name}.md").resolve()
 
                 # If a skill output (e.g., /cypilot) already owns this path, do not generate a workflow proxy.
                 if desired_path.as_posix() in skill_output_paths:
@@ -649,30 +783,15 @@ def _cmd_agents(argv: List[str]) -> int:
                 # Paths inside generated proxy files must be relative to the proxy file location.
                 target_rel = _safe_relpath_from_dir(target_workflow_path, desired_path.parent)
 
-                # Parse frontmatter from source workflow
-                fm = _parse_frontmatter(target_workflow_path)
-                source_name = fm.get("name", command)
-                source_description = fm.get("description", f"Proxy to Cypilot workflow {wf_name}")
-
-                # Get custom content from config (optional user-defined section)
-                custom_content = workflows_cfg.get("custom_content", "")
-
-                content = _render_template(
-                    template,
-                    {
-                        "command": command,
-                        "workflow_name": wf_name,
-                        "target_workflow_path": target_rel,
-                        "name": source_name,
-                        "description": source_description,
-                        "custom_content": custom_content,
-                    },
-                )
                 desired[desired_path.as_posix()] = {
                     "command": command,
                     "workflow_name": wf_name,
                     "target_workflow_path": target_rel,
-                    "content": content,
+                    "source": target_workflow_path.as_posix(),
+                    "input": digest(
+                        "workflow", template_key, str(custom_content), command, wf_name, target_rel,
+                        sources.digest(target_workflow_path),
+                    ),
                 }
 
             existing_files: List[Path] = []
@@ -684,32 +803,24 @@ def _cmd_agents(argv: List[str]) -> int:
             for pth in existing_files:
                 if pth.as_posix() in desired:
                     continue
-                if not pth.name.startswith(prefix):
-                    try:
-                        head = "\n".join(pth.read_text(encoding="utf-8").splitlines()[:5])
-                    except Exception:
-                        continue
-                    if not head.lstrip().startswith("# /"):
-                        continue
-                try:
-                    txt = pth.read_text(encoding="utf-8")
-                except Exception:
+                scan = _proxy_scan(pth, manifest)
+                if scan is None:
                     continue
-                if "ALWAYS open and follow `" not in txt:
+                if not pth.name.startswith(prefix) and not scan["heading"]:
                     continue
-                m = re.search(r"ALWAYS open and follow `([^`]+)`", txt)
-                if not m:
+                target_rel = scan["target"]
+                if not target_rel:
                     continue
-                target_rel = m.group(1)
                 dst = desired_by_target.get(target_rel)
                 if not dst or pth.as_posix() == dst:
                     continue
                 if Path(dst).exists():
                     continue
-                if not args.dry_run:
+                if not dry_run:
                     workflow_dir.mkdir(parents=True, exist_ok=True)
                     Path(dst).parent.mkdir(parents=True, exist_ok=True)
                     pth.replace(Path(dst))
+                    manifest.pop(pth.as_posix(), None)
                 workflows_result["renamed"].append((pth.as_posix(), dst))
 
             existing_files = list(workflow_dir.glob("*.md")) if workflow_dir.is_dir() else []
@@ -717,20 +828,42 @@ def _cmd_agents(argv: List[str]) -> int:
             # Create/update desired files
             for p_str, meta in desired.items():
                 pth = Path(p_str)
+                if use_manifest and _output_unchanged(pth, manifest, meta["input"]):
+                    continue
+
+                # Parse frontmatter from source workflow
+                fm = sources.frontmatter(Path(meta["source"]))
+                command = meta["command"]
+                wf_name = meta["workflow_name"]
+                content = _render_template(
+                    template,
+                    {
+                        "command": command,
+                        "workflow_name": wf_name,
+                        "target_workflow_path": meta["target_workflow_path"],
+                        "name": fm.get("name", command),
+                        "description": fm.get("description", f"Proxy to Cypilot workflow {wf_name}"),
+                        "custom_content": custom_content,
+                    },
+                )
+
                 if not pth.exists():
                     workflows_result["created"].append(p_str)
-                    if not args.dry_run:
+                    if not dry_run:
                         pth.parent.mkdir(parents=True, exist_ok=True)
-                        pth.write_text(meta["content"], encoding="utf-8")
+                        pth.write_text(content, encoding="utf-8")
+                        _record_output(pth, manifest, meta["input"], content)
                     continue
                 try:
                     old = pth.read_text(encoding="utf-8")
                 except Exception:
                     old = ""
-                if old != meta["content"]:
+                if old != content:
                     workflows_result["updated"].append(p_str)
-                    if not args.dry_run:
-                        pth.write_text(meta["content"], encoding="utf-8")
+                    if not dry_run:
+                        pth.write_text(content, encoding="utf-8")
+                if not dry_run:
+                    _record_output(pth, manifest, meta["input"], content)
 
             # Delete stale proxies
             desired_paths = set(desired.keys())
@@ -740,14 +873,12 @@ def _cmd_agents(argv: List[str]) -> int:
                     continue
                 if not pth.name.startswith(prefix) and not pth.name.startswith("cypilot-"):
                     continue
-                try:
-                    txt = pth.read_text(encoding="utf-8")
-                except Exception:
+                scan = _proxy_scan(pth, manifest)
+                if scan is None:
                     continue
-                m = re.search(r"ALWAYS open and follow `([^`]+)`", txt)
-                if not m:
+                target_rel = scan["target"]
+                if not target_rel:
                     continue
-                target_rel = m.group(1)
                 if "workflows/" not in target_rel and "/workflows/" not in target_rel:
                     continue
                 if not target_rel.startswith("/"):
@@ -755,13 +886,13 @@ def _cmd_agents(argv: List[str]) -> int:
                 else:
                     expected = Path(target_rel)
                 try:
-                    expected.relative_to(cypilot_root / "workflows")
+                    expected.relative_to(sources.cypilot_root / "workflows")
                 except ValueError:
                     continue
                 if expected.exists():
                     continue
                 workflows_result["deleted"].append(p_str)
-                if not args.dry_run:
+                if not dry_run:
                     try:
                         pth.unlink()
                     except (PermissionError, FileNotFoundError, OSError):
@@ -778,19 +909,12 @@ def _cmd_agents(argv: List[str]) -> int:
             if not isinstance(outputs, list) or not all(isinstance(x, dict) for x in outputs):
                 skills_result["errors"].append("outputs must be an array of objects")
             else:
-                # Cypilot skill source is always located relative to this script.
-                # `.../skills/cypilot/scripts/cypilot/cli.py` -> `.../skills/cypilot/SKILL.md`
-                target_skill_abs = (Path(__file__).resolve().parents[2] / "SKILL.md").resolve()
+                target_skill_abs = sources.skill_path
                 if not target_skill_abs.is_file():
                     skills_result["errors"].append(
                         "Cypilot skill source not found (expected: " + target_skill_abs.as_posix() + ")"
                     )
 
-                # Parse frontmatter from source SKILL.md
-                skill_fm = _parse_frontmatter(target_skill_abs)
-                skill_source_name = skill_fm.get("name", skill_name)
-                skill_source_description = skill_fm.get("description", "Proxy to Cypilot core skill instructions")
-
                 # Get custom content from config (optional user-defined section)
                 custom_content = skills_cfg.get("custom_content", "")
 
@@ -809,17 +933,27 @@ def _cmd_agents(argv: List[str]) -> int:
 
                     # Support custom target path (e.g., for workflow outputs)
                     custom_target = out_cfg.get("target")
+                    target_abs = (sources.cypilot_root / custom_target).resolve() if custom_target else target_skill_abs
+                    target_rel = _safe_relpath_from_dir(target_abs, out_dir)
+
+                    input_key = digest(
+                        "skill", json.dumps(template, ensure_ascii=False), agent, str(skill_name), str(custom_content),
+                        target_rel, sources.digest(target_skill_abs), sources.digest(target_abs) if custom_target else "",
+                    )
+                    out_rel = _safe_relpath(out_path, project_root)
+                    if use_manifest and _output_unchanged(out_path, manifest, input_key):
+                        skills_result["outputs"].append({"path": out_rel, "action": "unchanged"})
+                        continue
+
+                    # Parse frontmatter from source SKILL.md
+                    skill_fm = sources.frontmatter(target_skill_abs)
+                    out_name = skill_fm.get("name", skill_name)
+                    out_description = skill_fm.get("description", "Proxy to Cypilot core skill instructions")
                     if custom_target:
-                        target_abs = (cypilot_root / custom_target).resolve()
-                        target_rel = _safe_relpath_from_dir(target_abs, out_dir)
                         # Parse frontmatter from custom target
-                        target_fm = _parse_frontmatter(target_abs)
-                        out_name = target_fm.get("name", skill_source_name)
-                        out_description = target_fm.get("description", skill_source_description)
-                    else:
-                        target_rel = _safe_relpath_from_dir(target_skill_abs, out_dir)
-                        out_name = skill_source_name
-                        out_description = skill_source_description
+                        target_fm = sources.frontmatter(target_abs)
+                        out_name = target_fm.get("name", out_name)
+                        out_description = target_fm.get("description", out_description)
 
                     content = _render_template(
                         template,
@@ -836,34 +970,33 @@ def _cmd_agents(argv: List[str]) -> int:
 
                     if not out_path.exists():
                         skills_result["created"].append(out_path.as_posix())
-                        if not args.dry_run:
+                        if not dry_run:
                             out_path.parent.mkdir(parents=True, exist_ok=True)
                             out_path.write_text(content, encoding="utf-8")
-                        skills_result["outputs"].append({"path": _safe_relpath(out_path, project_root), "action": "created"})
+                            _record_output(out_path, manifest, input_key, content)
+                        skills_result["outputs"].append({"path": out_rel, "action": "created"})
+                        continue
+                    try:
+                        old = out_path.read_text(encoding="utf-8")
+                    except Exception:
+                        old = ""
+                    if old != content:
+                        skills_result["updated"].append(out_path.as_posix())
+                        if not dry_run:
+                            out_path.write_text(content, encoding="utf-8")
+                        skills_result["outputs"].append({"path": out_rel, "action": "updated"})
                     else:
-                        try:
-                            old = out_path.read_text(encoding="utf-8")
-                        except Exception:
-                            old = ""
-                        if old != content:
-                            skills_result["updated"].append(out_path.as_posix())
-                            if not args.dry_run:
-                                out_path.write_text(content, encoding="utf-8")
-                            skills_result["outputs"].append({"path": _safe_relpath(out_path, project_root), "action": "updated"})
-                        else:
-                            skills_result["outputs"].append({"path": _safe_relpath(out_path, project_root), "action": "unchanged"})
+                        skills_result["outputs"].append({"path": out_rel, "action": "unchanged"})
+                    if not dry_run:
+                        _record_output(out_path, manifest, input_key, content)
 
-    # --- OUTPUT ---
-    all_errors = workflows_result.get("errors", []) + skills_result.get("errors", [])
-    status = "PASS" if not all_errors else "PARTIAL"
+    return {"workflows": workflows_result, "skills": skills_result}
 
-    print(json.dumps({
-        "status": status,
-        "agent": agent,
-        "project_root": project_root.as_posix(),
-        "cypilot_root": cypilot_root.as_posix(),
-        "config_path": cfg_path.as_posix(),
-        "dry_run": bool(args.dry_run),
+
+def _agent_sync_report(result: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    workflows_result = result["workflows"]
+    skills_result = result["skills"]
+    return {
         "workflows": {
             "created": workflows_result["created"],
             "updated": workflows_result["updated"],
@@ -885,8 +1018,129 @@ def _cmd_agents(argv: List[str]) -> int:
                 "updated": len(skills_result["updated"]),
             },
         },
-        "errors": all_errors if all_errors else None,
-    }, indent=2, ensure_ascii=False))
+    }
+
+
+def _cmd_agents(argv: List[str]) -> int:
+    """Unified command to register both workflows and skills for an agent (or all configured agents)."""
+    p = argparse.ArgumentParser(prog="agents", description="Generate/update agent-specific workflow proxies and skill outputs")
+    agent_group = p.add_mutually_exclusive_group(required=True)
+    agent_group.add_argument("--agent", help="Agent/IDE key (e.g., windsurf, cursor, claude, copilot, openai), or 'all' for every configured agent")
+    agent_group.add_argument("--openai", action="store_true", help="Shortcut for --agent openai (OpenAI Codex)")
+    p.add_argument("--root", default=".", help="Project root directory (default: current directory)")
+    p.add_argument("--cypilot-root", default=None, help="Explicit Cypilot core root (optional override)")
+    p.add_argument("--config", default=None, help="Path to unified agents config JSON (default: cypilot-agents.json in project root)")
+    p.add_argument("--dry-run", action="store_true", help="Compute changes without writing files")
+    p.add_argument("--no-cache", action="store_true", help="Re-render every output and do not update the agents manifest")
+    args = p.parse_args(argv)
+
+    agent = "openai" if bool(getattr(args, "openai", False)) else str(args.agent).strip()
+    if not agent:
+        raise SystemExit("--agent must be non-empty")
+    all_agents = agent == "all"
+
+    start_path = Path(args.root).resolve()
+    project_root = find_project_root(start_path)
+    if project_root is None:
+        print(json.dumps({
+            "status": "NOT_FOUND",
+            "message": "No project root found (no .git or .cypilot-config.json)",
+            "searched_from": start_path.as_posix(),
+        }, indent=2, ensure_ascii=False))
+        return 1
+
+    cypilot_root = Path(args.cypilot_root).resolve() if args.cypilot_root else None
+    if cypilot_root is None:
+        cypilot_root = (Path(__file__).resolve().parents[4])
+        if not ((cypilot_root / "AGENTS.md").exists() and (cypilot_root / "workflows").is_dir()):
+            cypilot_root = Path(__file__).resolve().parents[6]
+
+    cfg_path = Path(args.config).resolve() if args.config else (project_root / "cypilot-agents.json")
+    cfg = _load_json_file(cfg_path)
+
+    recognized = all_agents or agent in {"windsurf", "cursor", "claude", "copilot", "openai"}
+    if cfg is None:
+        cfg = _default_agents_config() if recognized else {"version": 1, "agents": {agent: {"workflows": {}, "skills": {}}}}
+        if not args.dry_run:
+            _write_json_file(cfg_path, cfg)
+
+    agents_cfg = cfg.get("agents") if isinstance(cfg, dict) else None
+    if not all_agents and isinstance(cfg, dict) and isinstance(agents_cfg, dict) and agent not in agents_cfg:
+        if recognized:
+            defaults = _default_agents_config()
+            default_agents = defaults.get("agents") if isinstance(defaults, dict) else None
+            if isinstance(default_agents, dict) and isinstance(default_agents.get(agent), dict):
+                agents_cfg[agent] = default_agents[agent]
+        else:
+            agents_cfg[agent] = {"workflows": {}, "skills": {}}
+        cfg["agents"] = agents_cfg
+        if not args.dry_run:
+            _write_json_file(cfg_path, cfg)
+
+    if all_agents:
+        config_ok = isinstance(agents_cfg, dict)
+    else:
+        config_ok = isinstance(agents_cfg, dict) and agent in agents_cfg and isinstance(agents_cfg.get(agent), dict)
+    if not config_ok:
+        print(json.dumps({
+            "status": "CONFIG_ERROR",
+            "message": "Agent config missing or invalid",
+            "config_path": cfg_path.as_posix(),
+            "agent": agent,
+        }, indent=2, ensure_ascii=False))
+        return 1
+
+    from .utils.cache import cache_file, load_cache, save_cache
+
+    # The manifest maps each generated or scanned file to its last known stamp,
+    # proxy markers and, for outputs, the digests of their inputs and content.
+    manifest_path = cache_file(project_root, "agents")
+    use_manifest = not args.no_cache
+    manifest: Dict[str, Any] = load_cache(manifest_path) if use_manifest else {}
+    # Workflow listing, frontmatter and source digests are shared by all agents.
+    sources = _AgentSources(cypilot_root)
+
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    all_errors: List[str] = []
+    for name in (list(agents_cfg) if all_agents else [agent]):
+        if not isinstance(agents_cfg[name], dict):
+            all_errors.append(f"{name}: agent config must be an object")
+            continue
+        result = _sync_agent(name, agents_cfg[name], project_root, sources, manifest, use_manifest, bool(args.dry_run))
+        results[name] = result
+        agent_errors = result["workflows"]["errors"] + result["skills"]["errors"]
+        if all_agents:
+            agent_errors = [f"{name}: {e}" for e in agent_errors]
+        all_errors.extend(agent_errors)
+
+    if use_manifest and not args.dry_run:
+        save_cache(manifest_path, {k: v for k, v in manifest.items() if isinstance(v, dict) and Path(k).exists()})
+
+    # --- OUTPUT ---
+    status = "PASS" if not all_errors else "PARTIAL"
+    out: Dict[str, Any] = {
+        "status": status,
+        "agent": agent,
+        "project_root": project_root.as_posix(),
+        "cypilot_root": cypilot_root.as_posix(),
+        "config_path": cfg_path.as_posix(),
+        "dry_run": bool(args.dry_run),
+    }
+    if all_agents:
+        agents_out: Dict[str, Any] = {}
+        for name, result in results.items():
+            agent_errors = result["workflows"]["errors"] + result["skills"]["errors"]
+            agents_out[name] = {
+                "status": "PASS" if not agent_errors else "PARTIAL",
+                **_agent_sync_report(result),
+                "errors": agent_errors if agent_errors else None,
+            }
+        out["agents"] = agents_out
+    else:
+        out.update(_agent_sync_report(results[agent]))
+    out["errors"] = all_errors if all_errors else None
+
+    print(json.dumps(out, indent=2, ensure_ascii=False))
     return 0 if not all_errors else 1
 
 
@@ -1175,6 +1429,48 @@ def _cmd_init(argv: List[str]) -> int:
     return 0
 
 
+def _in_system_scope(node: Optional["SystemNode"], scope: "SystemNode") -> bool:
+    while node is not None:
+        if node is scope:
+            return True
+        node = node.parent
+    return False
+
+
+def _referenced_system_artifacts(meta: ArtifactsMeta, scope: "SystemNode", ids: Set[str]) -> List[Tuple[Any, "SystemNode"]]:
+    """Registry artifacts owned by systems outside `scope` that define any of `ids` (by ID prefix)."""
+    owners: Set[int] = set()
+    for cpt_id in ids:
+        owner = meta.get_system_for_id(cpt_id)
+        if owner is not None and not _in_system_scope(owner, scope):
+            owners.add(id(owner))
+    return [(a, n) for a, n in meta.iter_all_artifacts() if id(n) in owners]
+
+
+def _referencing_system_artifacts(
+    meta: ArtifactsMeta,
+    scope: "SystemNode",
+    project_root: Path,
+    ids: Set[str],
+) -> List[Tuple[Any, "SystemNode"]]:
+    """Registry artifacts outside `scope` that reference any of `ids` (cheap markerless scan)."""
+    from .utils.document import scan_cpt_ids_markerless
+
+    found: List[Tuple[Any, "SystemNode"]] = []
+    for artifact_meta, system_node in meta.iter_all_artifacts():
+        if _in_system_scope(system_node, scope):
+            continue
+        art_path = (project_root / artifact_meta.path).resolve()
+        if not art_path.is_file():
+            continue
+        if any(
+            h.get("type") == "reference" and str(h.get("id", "")).strip() in ids
+            for h in scan_cpt_ids_markerless(art_path)
+        ):
+            found.append((artifact_meta, system_node))
+    return found
+
+
 # =============================================================================
 def _cmd_validate(argv: List[str]) -> int:
     """Validate Cypilot artifacts and code traceability.
@@ -1184,16 +1480,49 @@ def _cmd_validate(argv: List[str]) -> int:
     """
     from .utils.template import cross_validate_artifacts
     from .utils.context import get_context
+    from .utils.rules import (
+        NEED_ARTIFACTS,
+        NEED_CODE,
+        NEED_DEFINED_IDS,
+        ValidationBudget,
+        ValidationIndex,
+        needs_of,
+        rule_names,
+        run_code_rules,
+        select_rules,
+    )
     p = argparse.ArgumentParser(
         prog="validate",
         description="Validate Cypilot artifacts and code traceability (structure + cross-refs + traceability)",
     )
     p.add_argument("--artifact", default=None, help="Path to specific Cypilot artifact (if omitted, validates all registered Cypilot artifacts)")
+    p.add_argument("--system", default=None, help="Validate only the artifacts and codebase of this system slug (and its children)")
     p.add_argument("--skip-code", action="store_true", help="Skip code traceability validation")
     p.add_argument("--verbose", action="store_true", help="Print full validation report")
     p.add_argument("--output", default=None, help="Write report to file instead of stdout")
+    p.add_argument("--rules", default=None, help=f"Comma-separated rule passes to run (default: all). Available: {', '.join(rule_names())}")
+    p.add_argument("--skip-rules", default=None, help="Comma-separated rule passes to skip")
+    p.add_argument("--max-errors", type=int, default=None, help="Stop parsing/scanning further files once this many errors are collected")
+    p.add_argument("--time-budget", type=float, default=None, help="Stop after this many seconds and report unvisited files")
     args = p.parse_args(argv)
 
+    if args.artifact and args.system:
+        print(json.dumps({"status": "ERROR", "message": "--artifact and --system are mutually exclusive"}, indent=None, ensure_ascii=False))
+        return 1
+    if args.max_errors is not None and args.max_errors < 1:
+        print(json.dumps({"status": "ERROR", "message": "--max-errors must be >= 1"}, indent=None, ensure_ascii=False))
+        return 1
+    if args.time_budget is not None and args.time_budget <= 0:
+        print(json.dumps({"status": "ERROR", "message": "--time-budget must be > 0"}, indent=None, ensure_ascii=False))
+        return 1
+    budget = ValidationBudget.create(max_errors=args.max_errors, time_budget=args.time_budget)
+
+    selected_rules, rule_errs = select_rules(args.rules, args.skip_rules)
+    if rule_errs:
+        print(json.dumps({"status": "ERROR", "message": "; ".join(rule_errs), "available_rules": rule_names()}, indent=None, ensure_ascii=False))
+        return 1
+    rule_needs = needs_of(selected_rules)
+
     # Use pre-loaded context (templates already loaded on startup)
     ctx = get_context()
     if not ctx:
@@ -1220,6 +1549,17 @@ def _cmd_validate(argv: List[str]) -> int:
 
     # Collect artifacts to validate: (artifact_path, template_path, artifact_type, traceability, kit_id)
     artifacts_to_validate: List[Tuple[Path, Path, str, str, str]] = []
+    scope_system = None
+
+    if args.system:
+        scope_system = meta.get_system_by_slug(args.system)
+        if scope_system is None:
+            print(json.dumps({
+                "status": "ERROR",
+                "message": f"System not found: {args.system}",
+                "available_systems": sorted(n.slug for n in meta.iter_all_systems() if n.slug),
+            }, indent=None, ensure_ascii=False))
+            return 1
 
     if args.artifact:
         artifact_path = Path(args.artifact).resolve()
@@ -1266,8 +1606,12 @@ def _cmd_validate(argv: List[str]) -> int:
             print(json.dumps({"status": "ERROR", "message": f"Artifact not in Cypilot registry: {args.artifact}"}, indent=None, ensure_ascii=False))
             return 1
     else:
-        # Validate all Cypilot artifacts
-        for artifact_meta, system_node in meta.iter_all_artifacts():
+        # Validate all Cypilot artifacts (or only the selected system subtree)
+        if scope_system is not None:
+            registry_artifacts = meta.iter_system_artifacts(scope_system)
+        else:
+            registry_artifacts = meta.iter_all_artifacts()
+        for artifact_meta, system_node in registry_artifacts:
             pkg = meta.get_kit(system_node.kit)
             if not pkg or not pkg.is_cypilot_format():
                 continue
@@ -1289,11 +1633,29 @@ def _cmd_validate(argv: List[str]) -> int:
 
     if ctx_errors:
         all_errors.extend(ctx_errors)
+    ctx_errors_seen = len(ctx_errors)
+
+    from .utils.document import file_has_cypilot_markers, scan_cpt_ids_markerless, scan_cpt_ids_without_markers
+
+    # Files left unvisited when the early-exit budget runs out.
+    unvisited_artifacts: List[str] = []
+    unvisited_code: List[str] = []
+    budget_skipped_rules: List[str] = []
+
+    for pos, (artifact_path, template_path, artifact_type, traceability, kit_id) in enumerate(list(artifacts_to_validate)):
+        if budget.exhausted(len(all_errors)):
+            unvisited_artifacts = [str(a[0]) for a in artifacts_to_validate[pos:]]
+            artifacts_to_validate = artifacts_to_validate[:pos]
+            break
 
-    for artifact_path, template_path, artifact_type, traceability, kit_id in artifacts_to_validate:
         # Use pre-loaded template from context if available
         used_synthetic_template = False
         tmpl = ctx.get_template(str(kit_id), str(artifact_type)) or ctx.get_template_for_kind(artifact_type)
+        # Kit templates are parsed on first use; surface their load errors now.
+        live_ctx_errors = getattr(ctx, "_errors", None) or []
+        if len(live_ctx_errors) > ctx_errors_seen:
+            all_errors.extend(live_ctx_errors[ctx_errors_seen:])
+            ctx_errors_seen = len(live_ctx_errors)
         if tmpl is None:
             if template_path.exists():
                 # Fallback: load from disk
@@ -1330,8 +1692,6 @@ def _cmd_validate(argv: List[str]) -> int:
                 )
                 used_synthetic_template = True
 
-        from .utils.document import file_has_cypilot_markers
-
         is_markerless = used_synthetic_template or (not file_has_cypilot_markers(artifact_path))
         artifact: TemplateArtifact = tmpl.parse(artifact_path)
         parsed_artifacts.append(artifact)
@@ -1339,7 +1699,7 @@ def _cmd_validate(argv: List[str]) -> int:
         # Structure validation
         # If artifact has no `<!-- cpt:... -->` markers, skip template-structure validation
         # and rely on markerless checks + cross-artifact consistency.
-        if is_markerless:
+        if is_markerless or "structure" not in selected_rules:
             errors = []
             warnings = []
         else:
@@ -1366,44 +1726,83 @@ def _cmd_validate(argv: List[str]) -> int:
         all_errors.extend(errors)
         all_warnings.extend(warnings)
 
-    # Cross-reference validation - load ALL Cypilot artifacts for context
-    # When validating a single artifact, we still need all artifacts to check references
-    all_artifacts_for_cross: List[TemplateArtifact] = list(parsed_artifacts)
+    # Shared index for cross-artifact and code rule passes.
     validated_paths = {str(p) for p, _, _, _, _ in artifacts_to_validate}
+    index = ValidationIndex(artifacts=list(parsed_artifacts), validated_paths=validated_paths)
+    for artifact_path, _template_path, _artifact_type, traceability, _kit_id in artifacts_to_validate:
+        index.traceability_by_path[str(artifact_path)] = traceability
 
-    # Load remaining artifacts that weren't validated (for cross-reference context)
-    for artifact_meta, system_node in meta.iter_all_artifacts():
-        pkg = meta.get_kit(system_node.kit)
-        if not pkg or not pkg.is_cypilot_format():
-            continue
-        art_path = (project_root / artifact_meta.path).resolve()
-        if str(art_path) in validated_paths:
-            continue  # Already parsed
-        if not art_path.exists():
-            continue
-        tmpl = ctx.get_template_for_kind(artifact_meta.kind)
-        if tmpl is None:
-            constraints_for_kind = None
-            loaded_kit = (ctx.kits or {}).get(str(system_node.kit))
-            if loaded_kit and loaded_kit.constraints and str(artifact_meta.kind) in loaded_kit.constraints.by_kind:
-                constraints_for_kind = loaded_kit.constraints.by_kind[str(artifact_meta.kind)]
-            tmpl = Template(
-                path=Path("<synthetic-template>"),
-                kind=str(artifact_meta.kind),
-                version=None,
-                policy=None,
-                blocks=[],
-                constraints=constraints_for_kind,
-                _loaded=True,
-            )
-        try:
-            art = tmpl.parse(art_path)
-            all_artifacts_for_cross.append(art)
-        except Exception:
-            pass  # Silently skip unparseable artifacts for cross-ref
+    loaded_paths = set(validated_paths)
 
-    if len(all_artifacts_for_cross) > 0:
-        cross_result = cross_validate_artifacts(all_artifacts_for_cross, registered_systems=registered_systems, known_kinds=known_kinds)
+    def load_context_artifacts(context_artifacts: List[Tuple[Any, "SystemNode"]]) -> None:
+        for artifact_meta, system_node in context_artifacts:
+            pkg = meta.get_kit(system_node.kit)
+            if not pkg or not pkg.is_cypilot_format():
+                continue
+            art_path = (project_root / artifact_meta.path).resolve()
+            if str(art_path) in loaded_paths:
+                continue  # Already parsed
+            if not art_path.exists():
+                continue
+            if budget.exhausted(len(all_errors)):
+                return
+            loaded_paths.add(str(art_path))
+            tmpl = ctx.get_template_for_kind(artifact_meta.kind)
+            if tmpl is None:
+                constraints_for_kind = None
+                loaded_kit = (ctx.kits or {}).get(str(system_node.kit))
+                if loaded_kit and loaded_kit.constraints and str(artifact_meta.kind) in loaded_kit.constraints.by_kind:
+                    constraints_for_kind = loaded_kit.constraints.by_kind[str(artifact_meta.kind)]
+                tmpl = Template(
+                    path=Path("<synthetic-template>"),
+                    kind=str(artifact_meta.kind),
+                    version=None,
+                    policy=None,
+                    blocks=[],
+                    constraints=constraints_for_kind,
+                    _loaded=True,
+                )
+            try:
+                art = tmpl.parse(art_path)
+                index.artifacts.append(art)
+            except Exception:
+                pass  # Silently skip unparseable artifacts for cross-ref
+
+    # Cross-reference validation - load ALL Cypilot artifacts for context
+    # When validating a single artifact, we still need all artifacts to check references.
+    # A system-scoped run only loads the artifacts of systems its IDs reference,
+    # plus artifacts elsewhere that reference IDs defined in the scope.
+    if NEED_ARTIFACTS in rule_needs and not budget.exhausted(len(all_errors)):
+        if scope_system is not None:
+            mentioned_ids: Set[str] = set()
+            scope_defined_ids: Set[str] = set()
+            for path_str in validated_paths:
+                for h in scan_cpt_ids_markerless(Path(path_str)):
+                    if h.get("id"):
+                        mentioned_ids.add(str(h["id"]).strip())
+                        if h.get("type") == "definition":
+                            scope_defined_ids.add(str(h["id"]).strip())
+            load_context_artifacts(_referenced_system_artifacts(meta, scope_system, mentioned_ids))
+            if "reference-coverage" in selected_rules and scope_defined_ids:
+                # Scope IDs may be covered by references from other systems' artifacts.
+                load_context_artifacts(
+                    _referencing_system_artifacts(meta, scope_system, project_root, scope_defined_ids)
+                )
+        else:
+            load_context_artifacts(list(meta.iter_all_artifacts()))
+
+    cross_rules = [n for n in rule_names("cross") if n in selected_rules]
+    if cross_rules and budget.exhausted(len(all_errors)):
+        # Cross checks over a partial artifact set would report false positives.
+        budget_skipped_rules.extend(cross_rules)
+        cross_rules = []
+    if cross_rules and len(index.artifacts) > 0:
+        cross_result = cross_validate_artifacts(
+            index.artifacts,
+            registered_systems=registered_systems,
+            known_kinds=known_kinds,
+            rules=cross_rules,
+        )
         cross_errors = cross_result.get("errors", [])
         cross_warnings = cross_result.get("warnings", [])
         # Only include cross-ref errors for artifacts we're validating
@@ -1418,23 +1817,8 @@ def _cmd_validate(argv: List[str]) -> int:
 
     # Code traceability validation (unless skipped)
     code_files_scanned: List[Dict[str, object]] = []
-    parsed_code_files: List[CodeFile] = []
-    code_ids_found: Set[str] = set()
-    to_code_ids: Set[str] = set()
-    artifact_ids: Set[str] = set()
     markerless_full_ids_to_check: Set[str] = set()
 
-    # Build map of artifact path to traceability mode
-    traceability_by_path: Dict[str, str] = {}
-    for artifact_path, _template_path, _artifact_type, traceability, _kit_id in artifacts_to_validate:
-        traceability_by_path[str(artifact_path)] = traceability
-
-    from .utils.document import (
-        file_has_cypilot_markers,
-        scan_cdsl_instructions_without_markers,
-        scan_cpt_ids_without_markers,
-    )
-
     # Determine which markerless FULL-traceability IDs we might accept references from code for.
     for artifact_path, _template_path, artifact_kind, traceability, _kit_id in artifacts_to_validate:
         if traceability != "FULL":
@@ -1446,22 +1830,19 @@ def _cmd_validate(argv: List[str]) -> int:
                 markerless_full_ids_to_check.add(str(h["id"]))
 
     strict_code_validation = not args.artifact
-    should_scan_code = (not args.skip_code) and (strict_code_validation or bool(markerless_full_ids_to_check))
-
-    if strict_code_validation and len(all_artifacts_for_cross) > 0:
-        # Build complete set of defined artifact IDs (including markerless) for orphan checks.
-        for art in all_artifacts_for_cross:
-            if file_has_cypilot_markers(art.path):
-                art._extract_ids_and_refs()
-                for d in art.id_definitions:
-                    artifact_ids.add(d.id)
-                    art_traceability = traceability_by_path.get(str(art.path), "FULL")
-                    if d.to_code and art_traceability == "FULL":
-                        to_code_ids.add(d.id)
-            else:
-                for h in scan_cpt_ids_without_markers(art.path):
-                    if h.get("type") == "definition" and h.get("id"):
-                        artifact_ids.add(str(h["id"]))
+    # Orphan/coverage code passes only run against the whole registry.
+    code_rules = [
+        n for n in rule_names("code")
+        if n in selected_rules and (strict_code_validation or n == "markerless-covered-by")
+    ]
+    if code_rules and budget.exhausted(len(all_errors)):
+        budget_skipped_rules.extend(code_rules)
+        code_rules = []
+    should_scan_code = (
+        (not args.skip_code)
+        and NEED_CODE in needs_of(code_rules)
+        and (strict_code_validation or bool(markerless_full_ids_to_check))
+    )
 
     if should_scan_code:
         # Scan code files from all systems
@@ -1482,7 +1863,11 @@ def _cmd_validate(argv: List[str]) -> int:
                 for ext in extensions:
                     files_to_scan.extend(code_path.rglob(f"*{ext}"))
 
-            for file_path in files_to_scan:
+            for pos, file_path in enumerate(files_to_scan):
+                if budget.exhausted(len(all_errors) + len(index.code_load_errors)):
+                    unvisited_code.extend(str(fp) for fp in files_to_scan[pos:])
+                    return
+
                 # Apply registry root ignore rules as a hard visibility filter.
                 try:
                     rel = file_path.resolve().relative_to(project_root).as_posix()
@@ -1494,44 +1879,24 @@ def _cmd_validate(argv: List[str]) -> int:
                 cf, errs = CodeFile.from_path(file_path)
                 if errs or cf is None:
                     if strict_code_validation and errs:
-                        all_errors.extend(errs)
+                        index.add_code_load_errors(errs)
                     continue
 
-                parsed_code_files.append(cf)
-
-                if strict_code_validation:
-                    # Validate structure
-                    result = cf.validate()
-                    all_errors.extend(result.get("errors", []))
-                    all_warnings.extend(result.get("warnings", []))
-
-                # Track IDs found
-                file_ids = cf.list_ids()
-                code_ids_found.update(file_ids)
+                index.add_code_file(cf, traceability)
 
-                if file_ids or cf.scope_markers or cf.block_markers:
+                if cf.references or cf.scope_markers or cf.block_markers:
                     code_files_scanned.append({
                         "path": str(file_path),
                         "scope_markers": len(cf.scope_markers),
                         "block_markers": len(cf.block_markers),
-                        "ids_referenced": len(file_ids),
+                        "ids_referenced": len(cf.list_ids()),
                     })
 
-                if strict_code_validation:
-                    # Check for orphaned markers (IDs not in artifacts)
-                    if traceability == "FULL":
-                        for ref in cf.references:
-                            if ref.id not in artifact_ids:
-                                all_errors.append({
-                                    "type": "traceability",
-                                    "message": "Code marker references ID not defined in any artifact",
-                                    "path": str(file_path),
-                                    "line": ref.line,
-                                    "id": ref.id,
-                                })
-
         def scan_system_codebase(system_node: "SystemNode") -> None:
             for cb_entry in system_node.codebase:
+                if budget.exhausted(len(all_errors) + len(index.code_load_errors)):
+                    unvisited_code.append(str(resolve_code_path(cb_entry.path)))
+                    continue
                 # Determine traceability from system artifacts
                 traceability = "FULL"
                 for art in system_node.artifacts:
@@ -1545,194 +1910,36 @@ def _cmd_validate(argv: List[str]) -> int:
             for child in system_node.children:
                 scan_system_codebase(child)
 
-        for system_node in meta.systems:
+        for system_node in ([scope_system] if scope_system is not None else meta.systems):
             scan_system_codebase(system_node)
 
-        if strict_code_validation:
-            # Check for missing code markers (to_code IDs without markers)
-            missing_ids = to_code_ids - code_ids_found
-            for missing_id in sorted(missing_ids):
-                all_errors.append({
-                    "type": "coverage",
-                    "message": "ID marked to_code=\"true\" has no code marker",
-                    "id": missing_id,
-                })
-
-            # CDSL instruction-level coverage:
-            # For each checked ([x]) CDSL instruction under a to_code="true" ID in FULL traceability,
-            # require a code block marker pair: @cpt-begin:{id}:p{phase}:inst-{inst} ... @cpt-end...
-            code_block_keys: Set[Tuple[str, int, str]] = set()
-            for cf in parsed_code_files:
-                for bm in cf.block_markers:
-                    code_block_keys.add((bm.id, int(bm.phase), str(bm.inst)))
-
-            def find_parent_id_def(
-                defs: List[object],
-                line_no: int,
-            ) -> Optional[object]:
-                candidates = []
-                for d in defs:
-                    blk = getattr(d, "block", None)
-                    if not blk:
-                        continue
-                    if blk.start_line <= line_no <= blk.end_line:
-                        candidates.append(d)
-                if not candidates:
-                    return None
-                # Choose the tightest enclosing block.
-                candidates.sort(key=lambda x: (x.block.end_line - x.block.start_line))
-                return candidates[0]
-
-            for art in all_artifacts_for_cross:
-                art_path_str = str(art.path)
-                art_traceability = traceability_by_path.get(art_path_str, "FULL")
-                if art_traceability != "FULL":
-                    continue
-                if not file_has_cypilot_markers(art.path):
-                    continue
-
-                art._extract_ids_and_refs()
-                for inst in getattr(art, "cdsl_instructions", []) or []:
-                    if not getattr(inst, "checked", False):
-                        continue
-                    phase = getattr(inst, "phase", None)
-                    if phase is None:
-                        continue
-
-                    parent = find_parent_id_def(art.id_definitions, int(getattr(inst, "line", 1) or 1))
-                    if parent is None:
-                        continue
-                    if not getattr(parent, "to_code", False):
-                        continue
-
-                    key = (str(parent.id), int(phase), str(getattr(inst, "inst", "")))
-                    if key in code_block_keys:
-                        continue
-
-                    all_errors.append({
-                        "type": "coverage",
-                        "message": "Implemented CDSL instruction has no code block marker",
-                        "artifact": art_path_str,
-                        "line": int(getattr(inst, "line", 1) or 1),
-                        "id": str(parent.id),
-                        "phase": int(phase),
-                        "inst": f"inst-{getattr(inst, 'inst', '')}",
-                    })
-
-            # Markerless artifacts: best-effort scan for CDSL instructions by regex.
-            # Parent binding rule: nearest ID definition above the instruction.
-            for art in all_artifacts_for_cross:
-                art_path_str = str(art.path)
-                art_traceability = traceability_by_path.get(art_path_str, "FULL")
-                if art_traceability != "FULL":
-                    continue
-                if file_has_cypilot_markers(art.path):
-                    continue
-
-                for h in scan_cdsl_instructions_without_markers(art.path):
-                    if not bool(h.get("checked", False)):
-                        continue
-                    parent_id = str(h.get("parent_id") or "").strip()
-                    if not parent_id:
-                        continue
-                    phase = h.get("phase")
-                    inst = str(h.get("inst") or "").strip()
-                    if phase is None or not inst:
-                        continue
-
-                    key = (parent_id, int(phase), inst)
-                    if key in code_block_keys:
-                        continue
-
-                    all_errors.append({
-                        "type": "coverage",
-                        "message": "Implemented CDSL instruction has no code block marker",
-                        "artifact": art_path_str,
-                        "line": int(h.get("line", 1) or 1),
-                        "id": parent_id,
-                        "phase": int(phase),
-                        "inst": f"inst-{inst}",
-                    })
-
-    # Markerless covered-by (simplified):
-    # If an artifact has no markers, each `**ID**: ...` definition must be referenced
-    # from at least one OTHER artifact kind. If no other kinds exist in scope → warn.
-    #
-    # If traceability is FULL for this artifact, a code reference also satisfies coverage.
-    if len(all_artifacts_for_cross) > 0:
-        present_kinds: Set[str] = set()
-        refs_by_id: Dict[str, Set[str]] = {}
-
-        # Build reference index across ALL artifacts (including markerless).
-        for art in all_artifacts_for_cross:
-            kind = art.template.kind
-            present_kinds.add(kind)
-
-            if not file_has_cypilot_markers(art.path):
-                for h in scan_cpt_ids_without_markers(art.path):
-                    if h.get("type") != "reference":
-                        continue
-                    rid = str(h.get("id", "")).strip()
-                    if not rid:
-                        continue
-                    refs_by_id.setdefault(rid, set()).add(kind)
-                continue
-
-            art._extract_ids_and_refs()
-            for r in art.id_references:
-                refs_by_id.setdefault(r.id, set()).add(kind)
-
-        # Enforce rule for validated markerless artifacts.
-        for art in all_artifacts_for_cross:
-            art_path_str = str(art.path)
-            if art_path_str not in validated_paths:
-                continue
-            if file_has_cypilot_markers(art.path):
-                continue
-            if getattr(art.template, "constraints", None) is not None:
-                continue
-
-            kind = art.template.kind
-            other_kinds = sorted(k for k in present_kinds if k != kind)
-            art_traceability = traceability_by_path.get(art_path_str, "FULL")
-
-            for h in scan_cpt_ids_without_markers(art.path):
-                if h.get("type") != "definition":
-                    continue
-                did = str(h.get("id", "")).strip()
-                if not did:
-                    continue
-                line = int(h.get("line", 1) or 1)
-
-                if not other_kinds:
-                    all_warnings.append(Template.error(
-                        "structure",
-                        "ID not referenced (no other artifact kinds in scope)",
-                        path=art.path,
-                        line=line,
-                        id=did,
-                    ))
-                    continue
-
-                referenced_kinds = sorted(k for k in refs_by_id.get(did, set()) if k != kind)
-                if referenced_kinds:
-                    continue
-
-                # Allow code reference to satisfy coverage when FULL.
-                if art_traceability == "FULL" and did in code_ids_found:
-                    continue
+        if scope_system is not None and NEED_DEFINED_IDS in needs_of(code_rules):
+            # Code may reference IDs of systems outside the scope: load their artifacts too.
+            load_context_artifacts(_referenced_system_artifacts(meta, scope_system, index.code_ids))
 
-                all_errors.append(Template.error(
-                    "structure",
-                    "ID not referenced from other artifact kinds",
-                    path=art.path,
-                    line=line,
-                    id=did,
-                    other_kinds=other_kinds,
-                ))
+    defined_ids_built = strict_code_validation and NEED_DEFINED_IDS in needs_of(code_rules) and len(index.artifacts) > 0
+    if defined_ids_built:
+        # Build complete set of defined artifact IDs (including markerless) for orphan checks.
+        index.build_defined_ids()
+
+    if code_rules:
+        if not should_scan_code:
+            # Without a code scan only the artifact-only passes can run.
+            code_rules = [n for n in code_rules if n == "markerless-covered-by"]
+        elif unvisited_code:
+            # Coverage passes need the whole codebase; per-file marker checks stay valid.
+            budget_skipped_rules.extend(n for n in code_rules if n != "code-markers")
+            code_rules = [n for n in code_rules if n == "code-markers"]
+        code_result = run_code_rules(index, code_rules)
+        all_errors.extend(code_result.get("errors", []))
+        all_warnings.extend(code_result.get("warnings", []))
 
     # Build final report
-    overall_status = "PASS" if not all_errors else "FAIL"
+    if all_errors:
+        overall_status = "FAIL"
+    else:
+        # An exhausted budget without errors cannot claim a full PASS.
+        overall_status = "PARTIAL" if budget.stop_reason is not None else "PASS"
 
     report: Dict[str, object] = {
         "status": overall_status,
@@ -1740,14 +1947,26 @@ def _cmd_validate(argv: List[str]) -> int:
         "error_count": len(all_errors),
         "warning_count": len(all_warnings),
     }
+    if scope_system is not None:
+        report["system"] = scope_system.slug
+    if args.rules is not None or args.skip_rules is not None:
+        report["rules"] = [n for n in rule_names() if n in selected_rules]
+    if budget.stop_reason is not None:
+        report["partial"] = True
+        report["stop_reason"] = budget.stop_reason
+        report["unvisited_artifacts"] = unvisited_artifacts
+        report["unvisited_code"] = unvisited_code
+        if budget_skipped_rules:
+            report["skipped_rules"] = [n for n in rule_names() if n in set(budget_skipped_rules)]
 
     # Add code validation stats if code was validated
     if not args.skip_code and not args.artifact:
         report["code_files_scanned"] = len(code_files_scanned)
-        report["to_code_ids_total"] = len(to_code_ids)
-        report["code_ids_found"] = len(code_ids_found)
-        if to_code_ids:
-            report["coverage"] = f"{len(code_ids_found & to_code_ids)}/{len(to_code_ids)}"
+        if defined_ids_built:
+            report["to_code_ids_total"] = len(index.to_code_ids)
+        report["code_ids_found"] = len(index.code_ids)
+        if index.to_code_ids:
+            report["coverage"] = f"{len(index.code_ids & index.to_code_ids)}/{len(index.to_code_ids)}"
 
     # Add next step hint for agent
     if overall_status == "PASS":
@@ -1771,7 +1990,7 @@ def _cmd_validate(argv: List[str]) -> int:
                 for r in failed_artifacts
             ]
 
-    out = json.dumps(report, indent=2 if args.verbose else None, ensure_ascii=False)
+    out = json.dumps(report, indent=2 if args.verbose else None, ensure_ascii=False, default=json_default)
     if args.verbose:
         out += "\n"
 
@@ -1780,7 +1999,10 @@ def _cmd_validate(argv: List[str]) -> int:
     else:
         print(out)
 
-    return 0 if overall_status == "PASS" else 2
+    if overall_status == "FAIL":
+        return 2
+    # Not fully validated: callers such as pre-commit hooks must not treat it as a pass.
+    return 3 if overall_status == "PARTIAL" else 0
 
 
 # =============================================================================
@@ -2626,6 +2848,56 @@ def _cmd_where_used(argv: List[str]) -> int:
 # TEMPLATE VALIDATION COMMAND
 # =============================================================================
 
+def _validate_kit_template(
+    template_path: Path,
+    kit_root: Optional[Path],
+    kit_key: str,
+    constraints_by_root: Dict[str, object],
+) -> Dict[str, object]:
+    """Parse one kit template, apply its kit constraints, and return a JSON-ready result.
+
+    The result holds "errors", "constraints_errors" (invalid constraints.json) and, on
+    success, "kind"/"version"/"blocks"/"block_types". validate-kits stores it in its
+    manifest.
+    """
+    tmpl, errs = Template.from_path(template_path)
+    constraints_errors: List[Dict[str, object]] = []
+
+    # Apply kit-level constraints.json (if present) and surface contradictions.
+    try:
+        from .utils.constraints import load_constraints_json
+        from .utils.template import apply_kind_constraints
+
+        if kit_root and kit_key not in constraints_by_root:
+            kc, kc_errs = load_constraints_json(kit_root)
+            constraints_by_root[kit_key] = (kc, kc_errs)
+        if kit_root:
+            kc, kc_errs = constraints_by_root.get(kit_key, (None, []))
+            if kc_errs:
+                constraints_errors.append(Template.error(
+                    "constraints",
+                    "Invalid constraints.json",
+                    path=(kit_root / "constraints.json").resolve(),
+                    line=1,
+                    errors=list(kc_errs),
+                ))
+            if tmpl is not None and kc is not None and hasattr(kc, "by_kind") and tmpl.kind in kc.by_kind:
+                cerrs = apply_kind_constraints(tmpl, kc.by_kind[tmpl.kind])
+                if cerrs:
+                    errs = list(errs or []) + list(cerrs)
+    except Exception:
+        # constraints are best-effort for validate-kits; avoid crashing template validation.
+        pass
+
+    entry: Dict[str, object] = {"errors": list(errs or []), "constraints_errors": constraints_errors}
+    if not errs and tmpl is not None:
+        entry["kind"] = tmpl.kind
+        entry["version"] = f"{tmpl.version.major}.{tmpl.version.minor}" if tmpl.version else None
+        entry["blocks"] = len(tmpl.blocks) if tmpl.blocks else 0
+        entry["block_types"] = list(set(b.type for b in tmpl.blocks)) if tmpl.blocks else []
+    return json.loads(json.dumps(entry, ensure_ascii=False, default=json_default))
+
+
 def _cmd_validate_kits(argv: List[str]) -> int:
     """Validate Cypilot kit packages and template files.
 
@@ -2639,9 +2911,11 @@ def _cmd_validate_kits(argv: List[str]) -> int:
     p.add_argument("--kit", "--rule", dest="kit", default=None, help="Kit ID to validate (if omitted, validates all kits)")
     p.add_argument("--template", default=None, help="Path to specific template file to validate")
     p.add_argument("--verbose", action="store_true", help="Print full validation report")
+    p.add_argument("--force", action="store_true", help="Revalidate every template, ignoring the manifest of unchanged ones")
     args = p.parse_args(argv)
 
     templates_to_validate: List[Path] = []
+    project_root: Optional[Path] = None
 
     if args.template:
         template_path = Path(args.template).resolve()
@@ -2702,45 +2976,43 @@ def _cmd_validate_kits(argv: List[str]) -> int:
     template_reports: List[Dict[str, object]] = []
     overall_status = "PASS"
 
+    from .utils.cache import cache_file, digest, file_digest, load_cache, save_cache
+
+    # Manifest of template path -> input digest and last result. Only templates
+    # whose file or kit constraints.json changed are re-validated. --force skips
+    # lookups for the templates in scope but keeps other kits' entries.
+    manifest_path = cache_file(project_root, "validate-kits") if not args.template else None
+    manifest = load_cache(manifest_path) if manifest_path is not None else {}
+    cache_hits = 0
+
     # constraints.json cache by kit root
     constraints_by_root: Dict[str, object] = {}
+    constraints_digest_by_root: Dict[str, str] = {}
 
     for template_path in templates_to_validate:
-        tmpl, errs = Template.from_path(template_path)
+        kit_root: Optional[Path] = None
+        for parent in template_path.parents:
+            if parent.name == "artifacts":
+                kit_root = parent.parent
+                break
+        kit_key = kit_root.resolve().as_posix() if kit_root else ""
+        if kit_root and kit_key not in constraints_digest_by_root:
+            constraints_digest_by_root[kit_key] = file_digest(kit_root / "constraints.json")
+
+        input_digest = digest(file_digest(template_path), constraints_digest_by_root.get(kit_key, ""))
+        entry = manifest.get(str(template_path))
+        if not args.force and isinstance(entry, dict) and entry.get("digest") == input_digest:
+            cache_hits += 1
+        else:
+            entry = _validate_kit_template(template_path, kit_root, kit_key, constraints_by_root)
+            entry["digest"] = input_digest
+            manifest[str(template_path)] = entry
 
-        # Apply kit-level constraints.json (if present) and surface contradictions.
-        try:
-            from .utils.constraints import load_constraints_json
-            from .utils.template import apply_kind_constraints
-
-            kit_root: Optional[Path] = None
-            for parent in template_path.parents:
-                if parent.name == "artifacts":
-                    kit_root = parent.parent
-                    break
-
-            kit_key = kit_root.resolve().as_posix() if kit_root else ""
-            if kit_root and kit_key not in constraints_by_root:
-                kc, kc_errs = load_constraints_json(kit_root)
-                constraints_by_root[kit_key] = (kc, kc_errs)
-            if kit_root:
-                kc, kc_errs = constraints_by_root.get(kit_key, (None, []))
-                if kc_errs:
-                    all_errors.append(Template.error(
-                        "constraints",
-                        "Invalid constraints.json",
-                        path=(kit_root / "constraints.json").resolve(),
-                        line=1,
-                        errors=list(kc_errs),
-                    ))
-                    overall_status = "FAIL"
-                if tmpl is not None and kc is not None and hasattr(kc, "by_kind") and tmpl.kind in kc.by_kind:
-                    cerrs = apply_kind_constraints(tmpl, kc.by_kind[tmpl.kind])
-                    if cerrs:
-                        errs = list(errs or []) + list(cerrs)
-        except Exception:
-            # constraints are best-effort for validate-kits; avoid crashing template validation.
-            pass
+        kit_errs = list(entry.get("constraints_errors") or [])
+        if kit_errs:
+            all_errors.extend(kit_errs)
+            overall_status = "FAIL"
+        errs = list(entry.get("errors") or [])
 
         report: Dict[str, object] = {
             "template": str(template_path),
@@ -2753,22 +3025,26 @@ def _cmd_validate_kits(argv: List[str]) -> int:
             if args.verbose:
                 report["errors"] = errs
             all_errors.extend(errs)
-        else:
+        elif "kind" in entry:
             # Template parsed successfully - add metadata
-            if tmpl is not None:
-                report["kind"] = tmpl.kind
-                report["version"] = f"{tmpl.version.major}.{tmpl.version.minor}" if tmpl.version else None
-                report["blocks"] = len(tmpl.blocks) if tmpl.blocks else 0
-                if args.verbose and tmpl.blocks:
-                    report["block_types"] = list(set(b.type for b in tmpl.blocks))
+            report["kind"] = entry["kind"]
+            report["version"] = entry.get("version")
+            report["blocks"] = entry.get("blocks", 0)
+            if args.verbose and entry.get("block_types"):
+                report["block_types"] = entry["block_types"]
 
         template_reports.append(report)
 
+    if manifest_path is not None:
+        # Drop entries for templates that no longer exist.
+        save_cache(manifest_path, {k: v for k, v in manifest.items() if Path(k).exists()})
+
     # Build final report
     result: Dict[str, object] = {
         "status": overall_status,
         "templates_validated": len(template_reports),
         "error_count": len(all_errors),
+        "cache_hits": cache_hits,
     }
 
     if args.verbose:
@@ -2788,7 +3064,7 @@ def _cmd_validate_kits(argv: List[str]) -> int:
             if len(all_errors) > 10:
                 result["errors_truncated"] = len(all_errors) - 10
 
-    out = json.dumps(result, indent=2 if args.verbose else None, ensure_ascii=False)
+    out = json.dumps(result, indent=2 if args.verbose else None, ensure_ascii=False, default=json_default)
     if args.verbose:
         out += "\n"
     print(out)
@@ -2796,6 +3072,77 @@ def _cmd_validate_kits(argv: List[str]) -> int:
     return 0 if overall_status == "PASS" else 2
 
 
+# =============================================================================
+# KIT COMMAND
+# =============================================================================
+
+def _cmd_kit(argv: List[str]) -> int:
+    """Kit maintenance commands.
+
+    `kit compile` parses each kit's templates and constraints.json once and writes
+    `<kit>/kit.bundle.json`, which CypilotContext.load uses while it is up to date.
+    """
+    p = argparse.ArgumentParser(prog="kit", description="Kit maintenance commands")
+    sub = p.add_subparsers(dest="action", required=True)
+    pc = sub.add_parser("compile", help="Write a precompiled bundle for each Cypilot kit")
+    pc.add_argument("--kit", default=None, help="Kit ID to compile (if omitted, compiles all kits)")
+    args = p.parse_args(argv)
+
+    from .utils.context import get_context, kit_artifacts_dir, load_kit_from_sources
+    from .utils.kit_bundle import write_kit_bundle
+
+    ctx = get_context()
+    if not ctx:
+        print(json.dumps({"status": "ERROR", "message": "No adapter found. Run 'init' first."}, indent=None, ensure_ascii=False))
+        return 1
+
+    kit_ids = [k for k, kit in (ctx.meta.kits or {}).items() if kit.is_cypilot_format()]
+    if args.kit:
+        if args.kit not in kit_ids:
+            print(json.dumps({
+                "status": "ERROR",
+                "message": f"Unknown Cypilot kit: {args.kit}",
+                "available_kits": kit_ids,
+            }, indent=None, ensure_ascii=False))
+            return 1
+        kit_ids = [args.kit]
+
+    project_root = ctx.project_root
+    reports: List[Dict[str, object]] = []
+    all_errors: List[Dict[str, object]] = []
+    for kit_id in kit_ids:
+        kit = ctx.meta.kits[kit_id]
+        kit_root = (project_root / str(kit.path or "").strip().strip("/")).resolve()
+        if not kit_root.is_dir():
+            all_errors.append(Template.error("kit", "Kit directory not found", path=kit_root, line=1, kit=kit_id))
+            continue
+        lazy_templates, constraints, errors = load_kit_from_sources(kit_id, kit, project_root)
+        templates = lazy_templates.load_all()
+        try:
+            bundle_path = write_kit_bundle(kit_root, kit_id, kit_artifacts_dir(project_root, kit), (templates, constraints, errors))
+        except OSError as e:
+            all_errors.append(Template.error("kit", f"Failed to write kit bundle: {e}", path=kit_root, line=1, kit=kit_id))
+            continue
+        all_errors.extend(errors)
+        reports.append({
+            "kit": kit_id,
+            "bundle": bundle_path.as_posix(),
+            "kinds": sorted(templates.keys()),
+            "error_count": len(errors),
+        })
+
+    status = "PASS" if not all_errors else "FAIL"
+    result: Dict[str, object] = {
+        "status": status,
+        "kits_compiled": len(reports),
+        "kits": reports,
+    }
+    if all_errors:
+        result["errors"] = all_errors
+    print(json.dumps(result, indent=None, ensure_ascii=False, default=json_default))
+    return 0 if status == "PASS" else 2
+
+
 # =============================================================================
 # ADAPTER COMMAND
 # =============================================================================
@@ -3017,6 +3364,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         "adapter-info",
         "self-check",
         "agents",
+        "kit",
     ]
     all_commands = analysis_commands + search_commands + legacy_aliases
 
@@ -3084,6 +3432,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         return _cmd_self_check(rest)
     elif cmd == "agents":
         return _cmd_agents(rest)
+    elif cmd == "kit":
+        return _cmd_kit(rest)
     else:
         print(json.dumps({
             "status": "ERROR",
@@ -786,6 +786,35 @@ class ArtifactsMeta:
                 return node
         return None
 
+    def iter_system_artifacts(self, system: SystemNode) -> Iterator[Tuple[Artifact, SystemNode]]:
+        """Iterate over artifacts owned by a system node and its descendants."""
+        def _iter_nodes(node: SystemNode) -> Iterator[SystemNode]:
+            yield node
+            for child in node.children:
+                yield from _iter_nodes(child)
+
+        subtree = {id(n) for n in _iter_nodes(system)}
+        for artifact, owner in self._artifacts_by_path.values():
+            if id(owner) in subtree:
+                yield artifact, owner
+
+    def get_system_for_id(self, cpt_id: str) -> Optional[SystemNode]:
+        """Find the system node owning a Cypilot ID (longest hierarchy prefix match)."""
+        cid = str(cpt_id).strip().lower()
+        if not cid.startswith("cpt-"):
+            return None
+        matched: Optional[SystemNode] = None
+        matched_len = -1
+        for node in self.iter_all_systems():
+            try:
+                prefix = node.get_hierarchy_prefix().lower()
+            except Exception:
+                continue
+            if prefix and cid.startswith(f"cpt-{prefix}-") and len(prefix) > matched_len:
+                matched = node
+                matched_len = len(prefix)
+        return matched
+
     def validate_all_slugs(self) -> List[str]:
         """Validate all slugs in the registry. Returns list of error messages."""
         errors = []
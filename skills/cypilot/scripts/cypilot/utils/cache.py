@@ -0,0 +1,97 @@
+"""
+Result caches for kit-level checks and generated files.
+
+Commands that re-check or re-render unchanged inputs (self-check, validate-kits,
+agents) keep a JSON file per command under `<project_root>/.cypilot-cache/`.
+Entries are keyed by content digests of their inputs plus `tool_fingerprint()`,
+so editing either the inputs or the cypilot sources invalidates them. A missing or unreadable cache is
+treated as empty.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from .errors import json_default
+
+CACHE_DIRNAME = ".cypilot-cache"
+# Bump when the layout of cache files changes.
+CACHE_VERSION = 1
+
+_TOOL_FINGERPRINT: Optional[str] = None
+
+
+def cache_file(project_root: Path, name: str) -> Path:
+    return project_root / CACHE_DIRNAME / f"{name}.json"
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's bytes, or "" if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def digest(*parts: str) -> str:
+    """sha256 over string parts (NUL-separated)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def tool_fingerprint() -> str:
+    """Stamp of the cypilot package sources (names, sizes, mtimes)."""
+    global _TOOL_FINGERPRINT
+    if _TOOL_FINGERPRINT is None:
+        pkg_root = Path(__file__).resolve().parent.parent
+        parts = [str(CACHE_VERSION)]
+        for p in sorted(pkg_root.rglob("*.py")):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            parts.append(f"{p.relative_to(pkg_root).as_posix()}:{st.st_size}:{st.st_mtime_ns}")
+        _TOOL_FINGERPRINT = digest(*parts)
+    return _TOOL_FINGERPRINT
+
+
+def load_cache(path: Path) -> Dict[str, object]:
+    """Return the cache entries stored at `path` (empty if missing or stale)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("tool") != tool_fingerprint():
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(path: Path, entries: Dict[str, object]) -> None:
+    """Atomically write cache entries; failures are ignored (the cache is optional)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        payload = {"tool": tool_fingerprint(), "entries": entries}
+        tmp.write_text(json.dumps(payload, indent=None, ensure_ascii=False, default=json_default), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+__all__ = [
+    "CACHE_DIRNAME",
+    "cache_file",
+    "digest",
+    "file_digest",
+    "load_cache",
+    "save_cache",
+    "tool_fingerprint",
+]
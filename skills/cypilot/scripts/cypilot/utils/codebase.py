@@ -17,31 +17,32 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Set, Tuple
 
-# Scope marker: @cpt-{kind}:{full-id}:p{N}
-# {kind} is kit-defined; parser accepts any lowercase slug.
-_SCOPE_MARKER_RE = re.compile(
-    r"@cpt-(?!begin:)(?!end:)(?P<kind>[a-z][a-z0-9-]*):(?P<id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<phase>\d+)"
-)
-
-# Block begin marker: @cpt-begin:{full-id}:ph-{N}:inst-{local}
-_BLOCK_BEGIN_RE = re.compile(
-    r"@cpt-begin:(?P<id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<phase>\d+):inst-(?P<inst>[a-z0-9-]+)"
-)
-
-# Block end marker: @cpt-end:{full-id}:ph-{N}:inst-{local}
-_BLOCK_END_RE = re.compile(
-    r"@cpt-end:(?P<id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<phase>\d+):inst-(?P<inst>[a-z0-9-]+)"
+from .errors import ErrorRecord
+
+# Substring shared by every marker; used as a cheap whole-file prefilter.
+_MARKER_PREFIX = "@cpt-"
+_MARKER_PREFIX_BYTES = _MARKER_PREFIX.encode("ascii")
+
+# Single tokenizer for all marker types; the matched alternative is dispatched on
+# `m.lastgroup` ("begin", "end" or "scope").
+# - Block begin marker: @cpt-begin:{full-id}:ph-{N}:inst-{local}
+# - Block end marker:   @cpt-end:{full-id}:ph-{N}:inst-{local}
+# - Scope marker:       @cpt-{kind}:{full-id}:p{N}
+#   {kind} is kit-defined; parser accepts any lowercase slug.
+_MARKER_RE = re.compile(
+    r"@cpt-(?:"
+    r"begin:(?P<b_id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<b_phase>\d+):inst-(?P<begin>[a-z0-9-]+)"
+    r"|end:(?P<e_id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<e_phase>\d+):inst-(?P<end>[a-z0-9-]+)"
+    r"|(?!begin:)(?!end:)(?P<kind>[a-z][a-z0-9-]*):(?P<s_id>cpt-[a-z0-9][a-z0-9-]+):(?:p|ph-)(?P<scope>\d+)"
+    r")"
 )
 
 # Generic SID reference (backticked or in markers)
 _SID_RE = re.compile(r"cpt-[a-z0-9][a-z0-9-]+")
 
-def error(kind: str, message: str, *, path: Path, line: int = 1, **extra) -> Dict[str, object]:
-    """Uniform error factory for code validation."""
-    out: Dict[str, object] = {"type": kind, "message": message, "line": int(line), "path": str(path)}
-    extra = {k: v for k, v in extra.items() if v is not None}
-    out.update(extra)
-    return out
+def error(kind: str, message: str, *, path: Path, line: int = 1, **extra) -> ErrorRecord:
+    """Uniform error factory for code validation (lazy `ErrorRecord`)."""
+    return ErrorRecord(kind, message, line, path, extra)
 
 
 @dataclass(frozen=True)
@@ -105,14 +106,16 @@ class CodeFile:
             return list(self._errors)
 
         try:
-            text = self.path.read_text(encoding="utf-8")
+            data = self.path.read_bytes()
+            text = data.decode("utf-8")
         except Exception as e:
             err = error("file", f"Failed to read code file: {e}", path=self.path, line=1)
             self._errors.append(err)
             return [err]
 
-        lines = text.splitlines()
-        self._parse_markers(lines)
+        # Fast path: most code files carry no markers at all.
+        if data.find(_MARKER_PREFIX_BYTES) != -1:
+            self._parse_markers(text.splitlines())
         self._loaded = True
         return list(self._errors)
 
@@ -122,53 +125,62 @@ class CodeFile:
         open_blocks: Dict[str, Tuple[int, str, int, str]] = {}  # key -> (line, id, phase, inst)
 
         for idx, line in enumerate(lines):
+            if _MARKER_PREFIX not in line:
+                continue
             line_no = idx + 1
+            matches = list(_MARKER_RE.finditer(line))
 
             # Check for scope markers
-            for m in _SCOPE_MARKER_RE.finditer(line):
+            for m in matches:
+                if m.lastgroup != "scope":
+                    continue
                 marker = ScopeMarker(
                     kind=m.group("kind"),
-                    id=m.group("id"),
-                    phase=int(m.group("phase")),
+                    id=m.group("s_id"),
+                    phase=int(m.group("scope")),
                     line=line_no,
                     raw=line,
                 )
                 self.scope_markers.append(marker)
                 self.references.append(CodeReference(
-                    id=m.group("id"),
+                    id=marker.id,
                     line=line_no,
-                    kind=m.group("kind"),
-                    phase=int(m.group("phase")),
+                    kind=marker.kind,
+                    phase=marker.phase,
                     inst=None,
                     marker_type="scope",
                 ))
 
             # Check for block begin markers
-            for m in _BLOCK_BEGIN_RE.finditer(line):
-                key = f"{m.group('id')}:{m.group('phase')}:{m.group('inst')}"
+            for m in matches:
+                if m.lastgroup != "begin":
+                    continue
+                key = f"{m.group('b_id')}:{m.group('b_phase')}:{m.group('begin')}"
                 if key in open_blocks:
                     self._errors.append(error(
                         "marker",
                         f"Duplicate @cpt-begin without matching @cpt-end",
                         path=self.path,
                         line=line_no,
-                        id=m.group("id"),
-                        inst=m.group("inst"),
+                        id=m.group("b_id"),
+                        inst=m.group("begin"),
                     ))
                 else:
-                    open_blocks[key] = (line_no, m.group("id"), int(m.group("phase")), m.group("inst"))
+                    open_blocks[key] = (line_no, m.group("b_id"), int(m.group("b_phase")), m.group("begin"))
 
             # Check for block end markers
-            for m in _BLOCK_END_RE.finditer(line):
-                key = f"{m.group('id')}:{m.group('phase')}:{m.group('inst')}"
+            for m in matches:
+                if m.lastgroup != "end":
+                    continue
+                key = f"{m.group('e_id')}:{m.group('e_phase')}:{m.group('end')}"
                 if key not in open_blocks:
                     self._errors.append(error(
                         "marker",
                         f"@cpt-end without matching @cpt-begin",
                         path=self.path,
                         line=line_no,
-                        id=m.group("id"),
-                        inst=m.group("inst"),
+                        id=m.group("e_id"),
+                        inst=m.group("end"),
                     ))
                 else:
                     start_line, cpt, phase, inst = open_blocks.pop(key)
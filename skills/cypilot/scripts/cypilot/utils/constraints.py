@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -41,11 +41,60 @@ def _parse_tri_state(v: object, field: str) -> Tuple[Optional[str], Optional[str
     return None, f"Constraint field '{field}' must be string (required|allowed|prohibited)"
 
 
+def _heading_set(headings: Optional[List[str]]) -> FrozenSet[str]:
+    return frozenset(h.strip() for h in (headings or []) if isinstance(h, str) and h.strip())
+
+
+@dataclass(frozen=True)
+class ReferenceLookup:
+    """Normalized reference rule for one target artifact kind."""
+    target_kind: str  # upper-case artifact kind
+    coverage: str  # required|optional|prohibited
+    task: str  # required|allowed|prohibited
+    priority: str  # required|allowed|prohibited
+    headings: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class IdKindLookup:
+    """Normalized defined-id constraint, as read by cross-artifact validation."""
+    kind: str  # lower-case ID kind
+    required: bool
+    headings: FrozenSet[str]
+    references: Tuple[ReferenceLookup, ...]
+
+
+def _id_kind_lookup(ic: IdConstraint) -> IdKindLookup:
+    refs: List[ReferenceLookup] = []
+    for target_kind, rule in (ic.references or {}).items():
+        refs.append(ReferenceLookup(
+            target_kind=str(target_kind).strip().upper(),
+            coverage=str(rule.coverage or "optional").strip().lower(),
+            task=str(rule.task or "allowed").strip().lower(),
+            priority=str(rule.priority or "allowed").strip().lower(),
+            headings=_heading_set(rule.headings),
+        ))
+    return IdKindLookup(
+        kind=str(ic.kind).strip().lower(),
+        required=bool(ic.required),
+        headings=_heading_set(ic.headings),
+        references=tuple(refs),
+    )
+
+
 @dataclass(frozen=True)
 class ArtifactKindConstraints:
     name: Optional[str]
     description: Optional[str]
     defined_id: List[IdConstraint]
+    # Lookup tables derived from defined_id, built once at construction.
+    id_kinds: Tuple[IdKindLookup, ...] = field(init=False, repr=False, compare=False)
+    id_kind_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        id_kinds = tuple(_id_kind_lookup(ic) for ic in self.defined_id or [])
+        object.__setattr__(self, "id_kinds", id_kinds)
+        object.__setattr__(self, "id_kind_names", frozenset(ik.kind for ik in id_kinds))
 
 
 @dataclass(frozen=True)
@@ -283,6 +332,8 @@ def load_constraints_json(kit_root: Path) -> Tuple[Optional[KitConstraints], Lis
 __all__ = [
     "ReferenceRule",
     "IdConstraint",
+    "ReferenceLookup",
+    "IdKindLookup",
     "ArtifactKindConstraints",
     "KitConstraints",
     "load_constraints_json",
@@ -4,29 +4,207 @@ Cypilot Context - Global context for Cypilot tooling.
 Loads and caches:
 - Adapter directory and project root
 - ArtifactsMeta from artifacts.json
-- All templates for each kit
+- All templates for each kit (from a fresh `kit compile` bundle when present;
+  otherwise as lazy handles parsed on first use)
 - Registered system names
 
 Use CypilotContext.load() to initialize on CLI startup.
 """
 
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from .artifacts_meta import ArtifactsMeta, Kit, load_artifacts_meta
 from .constraints import KitConstraints, load_constraints_json
+from .kit_bundle import read_kit_bundle
 from .template import Template
 
 
+# Opening or closing `<!-- cpt:id:<kind> ... -->` marker (same shape as template markers).
+_ID_MARKER_RE = re.compile(r"<!--\s*cpt:id:(?P<name>[^>\s]+)")
+
+
+class TemplateHandle:
+    """A kit template whose kind and ID kinds are known, but which is parsed on first use.
+
+    Parse errors and constraint contradictions are appended to the shared `errors`
+    list when the template is loaded.
+    """
+
+    __slots__ = ("path", "kind", "id_kinds", "_constraints", "_errors", "_template", "_loaded")
+
+    def __init__(
+        self,
+        path: Path,
+        kind: str,
+        id_kinds: Set[str],
+        constraints: Optional[KitConstraints],
+        errors: List[Dict[str, object]],
+    ):
+        self.path = path
+        self.kind = kind
+        self.id_kinds = id_kinds
+        self._constraints = constraints
+        self._errors = errors
+        self._template: Optional[Template] = None
+        self._loaded = False
+
+    @classmethod
+    def scan(
+        cls,
+        template_file: Path,
+        constraints: Optional[KitConstraints],
+        errors: List[Dict[str, object]],
+    ) -> "TemplateHandle":
+        """Read the kind from frontmatter/path and prefilter `cpt:id:` markers, without parsing blocks."""
+        try:
+            text = template_file.read_text(encoding="utf-8")
+        except Exception:
+            text = ""
+        kind = Template.peek_kind(template_file, text) or template_file.parent.name.upper()
+        id_kinds = {m.group("name").lower() for m in _ID_MARKER_RE.finditer(text)}
+        return cls(template_file, kind, id_kinds, constraints, errors)
+
+    def load(self) -> Optional[Template]:
+        """Parse the template (once) and apply kit constraints; None if it failed to load."""
+        if self._loaded:
+            return self._template
+        self._loaded = True
+        tmpl, tmpl_errs = Template.from_path(self.path)
+        if tmpl:
+            kc = self._constraints
+            if kc and tmpl.kind in kc.by_kind:
+                from .template import apply_kind_constraints
+                ce = apply_kind_constraints(tmpl, kc.by_kind[tmpl.kind])
+                if ce:
+                    self._errors.extend(ce)
+            self._template = tmpl
+        else:
+            self._errors.extend(tmpl_errs)
+        return self._template
+
+
+class KitTemplates(Mapping):
+    """Kind -> Template mapping backed by `TemplateHandle`s (or bundled handles).
+
+    Membership and iteration only look at the scanned kinds; reading a value parses
+    that template. A template that fails to load reads as missing.
+    """
+
+    def __init__(self, handles: Dict[str, TemplateHandle]):
+        self._handles = handles
+
+    def __getitem__(self, kind: str) -> Template:
+        handle = self._handles[kind]
+        tmpl = handle.load()
+        if tmpl is None:
+            raise KeyError(kind)
+        return tmpl
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._handles)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, kind: object) -> bool:
+        return kind in self._handles
+
+    def handles(self) -> Dict[str, TemplateHandle]:
+        return dict(self._handles)
+
+    def id_kinds(self) -> Set[str]:
+        """ID kinds from the marker prefilter (no parsing)."""
+        out: Set[str] = set()
+        for handle in self._handles.values():
+            out |= handle.id_kinds
+        return out
+
+    def load_all(self) -> Dict[str, Template]:
+        """Parse every template; returns the ones that loaded."""
+        out: Dict[str, Template] = {}
+        for kind, handle in self._handles.items():
+            tmpl = handle.load()
+            if tmpl is not None:
+                out[kind] = tmpl
+        return out
+
+    def values(self):
+        return self.load_all().values()
+
+    def items(self):
+        return self.load_all().items()
+
+
 @dataclass
 class LoadedKit:
-    """A kit with all its templates loaded."""
+    """A kit with its templates (parsed, or lazy `KitTemplates`)."""
     kit: Kit
-    templates: Dict[str, Template]  # kind -> Template
+    templates: Mapping  # kind -> Template
     constraints: Optional[KitConstraints] = None
 
 
+def kit_artifacts_dir(project_root: Path, kit: Kit) -> Optional[Path]:
+    """Return the kit's `artifacts/` directory (each subdirectory is a KIND), if configured."""
+    kit_path = str(kit.path or "").strip().strip("/")
+    if not kit_path:
+        return None
+    return project_root / kit_path / "artifacts"
+
+
+def load_kit_from_sources(
+    kit_id: str,
+    kit: Kit,
+    project_root: Path,
+    errors: Optional[List[Dict[str, object]]] = None,
+) -> Tuple[KitTemplates, Optional[KitConstraints], List[Dict[str, object]]]:
+    """Load a kit's constraints.json and scan its artifacts/<KIND>/template.md files.
+
+    Templates are returned as lazy handles; each is parsed (and constraints are
+    applied) on first access. Errors, including later template load errors, are
+    appended to `errors` (a new list when not given). Returns (templates by kind,
+    constraints, errors).
+    """
+    handles: Dict[str, TemplateHandle] = {}
+    if errors is None:
+        errors = []
+
+    kit_root = (project_root / str(kit.path or "").strip().strip("/")).resolve()
+    kit_constraints: Optional[KitConstraints] = None
+    constraints_errs: List[str] = []
+    if kit_root.is_dir():
+        kit_constraints, constraints_errs = load_constraints_json(kit_root)
+    if constraints_errs:
+        constraints_path = (kit_root / "constraints.json").resolve()
+        errors.append(Template.error(
+            "constraints",
+            "Invalid constraints.json",
+            path=constraints_path,
+            line=1,
+            errors=list(constraints_errs),
+            kit=kit_id,
+        ))
+
+    artifacts_dir = kit_artifacts_dir(project_root, kit)
+    if artifacts_dir is None or not artifacts_dir.is_dir():
+        return KitTemplates(handles), kit_constraints, errors
+
+    # Scan for template directories (each dir is a KIND)
+    for kind_dir in artifacts_dir.iterdir():
+        if not kind_dir.is_dir():
+            continue
+        template_file = kind_dir / "template.md"
+        if not template_file.is_file():
+            continue
+        handle = TemplateHandle.scan(template_file, kit_constraints, errors)
+        handles[handle.kind] = handle
+
+    return KitTemplates(handles), kit_constraints, errors
+
+
 @dataclass
 class CypilotContext:
     """Global Cypilot context with loaded metadata and templates."""
@@ -69,62 +247,14 @@ class CypilotContext:
             if not kit.is_cypilot_format():
                 continue
 
-            templates: Dict[str, Template] = {}
-
             kit_root = (project_root / str(kit.path or "").strip().strip("/")).resolve()
-            kit_constraints: Optional[KitConstraints] = None
-            constraints_errs: List[str] = []
-            if kit_root.is_dir():
-                kit_constraints, constraints_errs = load_constraints_json(kit_root)
-            if constraints_errs:
-                constraints_path = (kit_root / "constraints.json").resolve()
-                errors.append(Template.error(
-                    "constraints",
-                    "Invalid constraints.json",
-                    path=constraints_path,
-                    line=1,
-                    errors=list(constraints_errs),
-                    kit=kit_id,
-                ))
-
-            kit_path = str(kit.path or "").strip().strip("/")
-            candidates: List[Path] = []
-            if kit_path:
-                # Primary: whatever is in artifacts.json
-                candidates.append(project_root / kit_path / "artifacts")
-
-            # De-dupe while preserving order
-            seen: Set[str] = set()
-            for artifacts_dir in candidates:
-                key = artifacts_dir.resolve().as_posix() if artifacts_dir.exists() else artifacts_dir.as_posix()
-                if key in seen:
-                    continue
-                seen.add(key)
-
-                if not artifacts_dir.is_dir():
-                    continue
-
-                # Scan for template directories (each dir is a KIND)
-                for kind_dir in artifacts_dir.iterdir():
-                    if not kind_dir.is_dir():
-                        continue
-                    template_file = kind_dir / "template.md"
-                    if not template_file.is_file():
-                        continue
-                    tmpl, tmpl_errs = Template.from_path(template_file)
-                    if tmpl:
-                        if kit_constraints and tmpl.kind in kit_constraints.by_kind:
-                            from .template import apply_kind_constraints
-                            ce = apply_kind_constraints(tmpl, kit_constraints.by_kind[tmpl.kind])
-                            if ce:
-                                errors.extend(ce)
-                        templates[tmpl.kind] = tmpl
-                    else:
-                        errors.extend(tmpl_errs)
-
-                # Stop at the first candidate that yields any templates.
-                if templates:
-                    break
+            bundle = read_kit_bundle(kit_root, kit_id, kit_artifacts_dir(project_root, kit)) if kit_root.is_dir() else None
+            if bundle is not None:
+                handles, kit_constraints, kit_errors = bundle
+                templates = KitTemplates(handles)
+                errors.extend(kit_errors)
+            else:
+                templates, kit_constraints, _ = load_kit_from_sources(kit_id, kit, project_root, errors)
 
             kits[kit_id] = LoadedKit(kit=kit, templates=templates, constraints=kit_constraints)
 
@@ -191,18 +321,23 @@ class CypilotContext:
     def get_template_for_kind(self, kind: str) -> Optional[Template]:
         """Get template for a kind from any kit."""
         for loaded_kit in self.kits.values():
-            if kind in loaded_kit.templates:
-                return loaded_kit.templates[kind]
+            tmpl = loaded_kit.templates.get(kind)
+            if tmpl is not None:
+                return tmpl
         return None
 
     def get_known_id_kinds(self) -> Set[str]:
         """Get all known ID kinds from template markers.
 
         Scans all templates for cpt:id:<kind> markers and returns the set of kinds.
-        This is useful for parsing composite Cypilot IDs.
+        This is useful for parsing composite Cypilot IDs. Lazy kit templates answer
+        from their marker prefilter without being parsed.
         """
         kinds: Set[str] = set()
         for loaded_kit in self.kits.values():
+            if isinstance(loaded_kit.templates, KitTemplates):
+                kinds |= loaded_kit.templates.id_kinds()
+                continue
             for tmpl in loaded_kit.templates.values():
                 for block in tmpl.blocks or []:
                     if block.type == "id":
@@ -237,6 +372,10 @@ def ensure_context(start_path: Optional[Path] = None) -> Optional[CypilotContext
 __all__ = [
     "CypilotContext",
     "LoadedKit",
+    "TemplateHandle",
+    "KitTemplates",
+    "kit_artifacts_dir",
+    "load_kit_from_sources",
     "get_context",
     "set_context",
     "ensure_context",
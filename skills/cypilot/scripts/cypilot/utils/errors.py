@@ -0,0 +1,94 @@
+"""Compact validation error records.
+
+`Template.error` / `codebase.error` return `ErrorRecord` objects instead of dicts.
+A record keeps the raw fields (the `Path` object, the keyword extras as passed) and
+builds its dict form only when it is read or emitted. Very broken artifacts can
+produce tens of thousands of findings; compact reports materialize only the ones
+they print.
+
+Records behave as read-only mappings (`e["id"]`, `e.get("path")`, `dict(e)`, `==`
+against dicts), so existing consumers keep working. Use `json_default` (or
+`to_dict`) when serializing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+
+class ErrorRecord(Mapping):
+    """A validation finding: type, message, line, optional path, extra fields."""
+
+    __slots__ = ("kind", "message", "line", "path", "extra", "_dict")
+
+    def __init__(
+        self,
+        kind: str,
+        message: str,
+        line: int = 1,
+        path: Optional[object] = None,
+        extra: Optional[Dict[str, object]] = None,
+    ):
+        self.kind = kind
+        self.message = message
+        self.line = line
+        self.path = path
+        self.extra = extra
+        self._dict: Optional[Dict[str, object]] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the JSON-ready dict form (built once, on first use)."""
+        d = self._dict
+        if d is None:
+            d = {"type": self.kind, "message": self.message, "line": int(self.line)}
+            if self.path is not None:
+                d["path"] = str(self.path)
+            if self.extra:
+                for k, v in self.extra.items():
+                    if v is not None:
+                        d[k] = v
+            self._dict = d
+        return d
+
+    def __getitem__(self, key: str) -> object:
+        # Fast paths for the fields filters look at, without building the dict.
+        if self._dict is None:
+            if key == "type":
+                return self.kind
+            if key == "path":
+                if self.path is None:
+                    raise KeyError(key)
+                return str(self.path)
+        return self.to_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ErrorRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+def json_default(obj: Any) -> Any:
+    """`json.dumps(default=...)` hook that serializes error records."""
+    if isinstance(obj, ErrorRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+__all__ = [
+    "ErrorRecord",
+    "json_default",
+]
@@ -0,0 +1,273 @@
+"""
+Precompiled kit bundles.
+
+`cypilot kit compile` writes one `kit.bundle.json` per kit holding everything
+`CypilotContext.load` would otherwise rebuild on every invocation: the parsed
+TemplateBlock lists of each artifacts/<KIND>/template.md (with kit constraints
+already applied), template kind/version/policy, the parsed constraints.json, and
+any load errors.
+
+A bundle records the cypilot `tool_fingerprint()` and, per source file, its
+content digest plus an (mtime_ns, size) stamp. The loader uses it only while the
+set of sources, their contents and the tool sources are unchanged; otherwise it
+falls back to parsing the sources. Bundles from a different BUNDLE_VERSION are
+ignored.
+
+Checking a fresh bundle costs a stat per source: digests are computed only for
+files whose stamp differs, or whose mtime is too close to when the stamps were
+taken to rule out a same-size edit within mtime granularity. If the digests
+still match, the stamps are rewritten so the next load takes the fast path.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .cache import file_digest, tool_fingerprint
+from .constraints import ArtifactKindConstraints, IdConstraint, KitConstraints, ReferenceRule
+from .errors import ErrorRecord, json_default
+from .template import Template, TemplateBlock, TemplatePolicy, TemplateVersion
+
+BUNDLE_FILENAME = "kit.bundle.json"
+BUNDLE_FORMAT = "cypilot-kit-bundle"
+# Bump when the bundle layout changes (parser changes are caught by tool_fingerprint).
+BUNDLE_VERSION = 3
+# Sources modified this close to the stamp time are always re-digested (coarse mtimes).
+_RACY_WINDOW_NS = 2_000_000_000
+
+KitLoadResult = Tuple[Dict[str, Template], Optional[KitConstraints], List[Dict[str, object]]]
+BundleLoadResult = Tuple[Dict[str, "BundledTemplateHandle"], Optional[KitConstraints], List[Dict[str, object]]]
+
+
+def kit_bundle_path(kit_root: Path) -> Path:
+    return kit_root / BUNDLE_FILENAME
+
+
+def kit_bundle_sources(kit_root: Path, artifacts_dir: Optional[Path]) -> Dict[str, Path]:
+    """Return the files a kit bundle is built from, keyed by kit-relative name."""
+    sources: Dict[str, Path] = {}
+    constraints_path = kit_root / "constraints.json"
+    if constraints_path.is_file():
+        sources["constraints.json"] = constraints_path
+    if artifacts_dir is not None and artifacts_dir.is_dir():
+        for kind_dir in sorted(artifacts_dir.iterdir(), key=lambda p: p.name):
+            template_file = kind_dir / "template.md"
+            if template_file.is_file():
+                sources[f"artifacts/{kind_dir.name}/template.md"] = template_file
+    return sources
+
+
+def _stamp(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _source_entries(sources: Dict[str, Path]) -> Dict[str, Dict[str, object]]:
+    # Stat before hashing: a write in between leaves a stale stamp, never a stale digest.
+    entries: Dict[str, Dict[str, object]] = {}
+    for name, src in sources.items():
+        entries[name] = {"stamp": _stamp(src), "sha256": file_digest(src)}
+    return entries
+
+
+def _write_bundle_data(kit_root: Path, data: Dict[str, object]) -> Path:
+    out = kit_bundle_path(kit_root)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=None, ensure_ascii=False, default=json_default), encoding="utf-8")
+    os.replace(tmp, out)
+    return out
+
+
+def _template_to_dict(tmpl: Template) -> Dict[str, object]:
+    return {
+        "dir": tmpl.path.parent.name,
+        "kind": tmpl.kind,
+        "version": [tmpl.version.major, tmpl.version.minor] if tmpl.version else None,
+        "unknown_sections": tmpl.policy.unknown_sections if tmpl.policy else None,
+        "blocks": [
+            [b.type, b.name, b.required, b.repeat, b.attrs, b.start_line, b.end_line]
+            for b in (tmpl.blocks or [])
+        ],
+    }
+
+
+def _template_from_dict(
+    data: Dict[str, object],
+    artifacts_dir: Path,
+    constraints: Optional[KitConstraints],
+) -> Template:
+    kind = str(data["kind"])
+    version = data.get("version")
+    unknown_sections = data.get("unknown_sections")
+    kind_constraints = constraints.by_kind.get(kind) if constraints else None
+    return Template(
+        path=artifacts_dir / str(data["dir"]) / "template.md",
+        kind=kind,
+        version=TemplateVersion(int(version[0]), int(version[1])) if version else None,
+        policy=TemplatePolicy(unknown_sections=str(unknown_sections)) if unknown_sections else None,
+        blocks=[
+            TemplateBlock(
+                type=t, name=n, required=bool(req), repeat=rep, attrs=dict(attrs),
+                start_line=int(start), end_line=int(end),
+            )
+            for t, n, req, rep, attrs, start, end in data.get("blocks") or []
+        ],
+        constraints=kind_constraints,
+        _loaded=True,
+    )
+
+
+class BundledTemplateHandle:
+    """A bundled kit template whose blocks are decoded on first use.
+
+    Same interface as `context.TemplateHandle`, so `KitTemplates` can wrap it.
+    """
+
+    __slots__ = ("path", "kind", "id_kinds", "_data", "_artifacts_dir", "_constraints", "_template")
+
+    def __init__(self, data: Dict[str, object], artifacts_dir: Path, constraints: Optional[KitConstraints]):
+        self.path = artifacts_dir / str(data["dir"]) / "template.md"
+        self.kind = str(data["kind"])
+        self.id_kinds = {str(b[1]).lower() for b in data.get("blocks") or [] if b[0] == "id"}
+        self._data: Optional[Dict[str, object]] = data
+        self._artifacts_dir = artifacts_dir
+        self._constraints = constraints
+        self._template: Optional[Template] = None
+
+    def load(self) -> Optional[Template]:
+        if self._data is not None:
+            self._template = _template_from_dict(self._data, self._artifacts_dir, self._constraints)
+            self._data = None
+        return self._template
+
+
+def _constraints_to_dict(constraints: KitConstraints) -> Dict[str, object]:
+    # Only the parsed fields; lookup tables are rebuilt by ArtifactKindConstraints.
+    return {
+        "by_kind": {
+            kind: {
+                "name": kc.name,
+                "description": kc.description,
+                "defined_id": [dataclasses.asdict(ic) for ic in kc.defined_id],
+            }
+            for kind, kc in constraints.by_kind.items()
+        },
+    }
+
+
+def _constraints_from_dict(data: Dict[str, object]) -> KitConstraints:
+    by_kind: Dict[str, ArtifactKindConstraints] = {}
+    for kind, raw in (data.get("by_kind") or {}).items():
+        defined_id: List[IdConstraint] = []
+        for c in raw.get("defined_id") or []:
+            refs = c.get("references")
+            if refs is not None:
+                refs = {k: ReferenceRule(**v) for k, v in refs.items()}
+            defined_id.append(IdConstraint(**{**c, "references": refs}))
+        by_kind[kind] = ArtifactKindConstraints(
+            name=raw.get("name"),
+            description=raw.get("description"),
+            defined_id=defined_id,
+        )
+    return KitConstraints(by_kind=by_kind)
+
+
+def _error_from_dict(data: Dict[str, object]) -> ErrorRecord:
+    extra = dict(data)
+    kind = str(extra.pop("type", ""))
+    message = str(extra.pop("message", ""))
+    line = extra.pop("line", 1)
+    path = extra.pop("path", None)
+    return ErrorRecord(kind, message, line, path, extra)
+
+
+def write_kit_bundle(
+    kit_root: Path,
+    kit_id: str,
+    artifacts_dir: Optional[Path],
+    loaded: KitLoadResult,
+) -> Path:
+    """Serialize a kit loaded from its sources into `<kit_root>/kit.bundle.json`."""
+    templates, constraints, errors = loaded
+    stamped_at = time.time_ns()
+    data = {
+        "format": BUNDLE_FORMAT,
+        "bundle_version": BUNDLE_VERSION,
+        "kit": kit_id,
+        "tool": tool_fingerprint(),
+        "stamped_at": stamped_at,
+        "sources": _source_entries(kit_bundle_sources(kit_root, artifacts_dir)),
+        "constraints": _constraints_to_dict(constraints) if constraints is not None else None,
+        "templates": [_template_to_dict(t) for t in templates.values()],
+        "errors": list(errors),
+    }
+    return _write_bundle_data(kit_root, data)
+
+
+def read_kit_bundle(kit_root: Path, kit_id: str, artifacts_dir: Optional[Path]) -> Optional[BundleLoadResult]:
+    """Load a kit from its bundle, or return None if there is none or it is stale.
+
+    Templates are returned as `BundledTemplateHandle`s, decoded on first use.
+    """
+    path = kit_bundle_path(kit_root)
+    if not path.is_file():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("format") != BUNDLE_FORMAT or data.get("bundle_version") != BUNDLE_VERSION:
+            return None
+        if data.get("kit") != kit_id or data.get("tool") != tool_fingerprint():
+            return None
+
+        recorded = data.get("sources") or {}
+        sources = kit_bundle_sources(kit_root, artifacts_dir)
+        if set(recorded) != set(sources):
+            return None
+        racy_after = int(data.get("stamped_at") or 0) - _RACY_WINDOW_NS
+        stamped_at = time.time_ns()
+        restamp = False
+        for name, src in sources.items():
+            stamp = _stamp(src)
+            if stamp is not None and stamp == recorded[name].get("stamp") and stamp[0] < racy_after:
+                continue
+            if recorded[name].get("sha256") != file_digest(src):
+                return None
+            recorded[name] = {"stamp": stamp, "sha256": recorded[name]["sha256"]}
+            restamp = True
+
+        raw_constraints = data.get("constraints")
+        constraints = _constraints_from_dict(raw_constraints) if raw_constraints is not None else None
+        templates: Dict[str, BundledTemplateHandle] = {}
+        if artifacts_dir is not None:
+            for t in data.get("templates") or []:
+                handle = BundledTemplateHandle(t, artifacts_dir, constraints)
+                templates[handle.kind] = handle
+        errors: List[Dict[str, object]] = [_error_from_dict(e) for e in data.get("errors") or []]
+    except Exception:
+        return None
+    if restamp:
+        data["stamped_at"] = stamped_at
+        try:
+            _write_bundle_data(kit_root, data)
+        except OSError:
+            pass
+    return templates, constraints, errors
+
+
+__all__ = [
+    "BUNDLE_FILENAME",
+    "BUNDLE_VERSION",
+    "BundledTemplateHandle",
+    "kit_bundle_path",
+    "kit_bundle_sources",
+    "read_kit_bundle",
+    "write_kit_bundle",
+]
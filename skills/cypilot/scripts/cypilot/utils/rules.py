@@ -0,0 +1,456 @@
+"""
+Cypilot Validator - Validation Rule Passes
+
+Validation is split into named rule passes that run over a shared, prebuilt index.
+Each pass declares the index data it needs; the validator builds only the data
+required by the selected passes (see `select_rules` / `needs_of`).
+
+Pass scopes:
+- artifact: per-artifact template structure checks
+- cross: cross-artifact checks (implemented by `template.cross_validate_artifacts`)
+- code: code traceability and coverage checks (implemented here)
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .codebase import CodeFile
+    from .template import Artifact
+
+# === INDEX DATA ===
+
+NEED_ARTIFACTS = "artifacts"  # all registered artifacts parsed for cross-reference context
+NEED_IDS = "ids"  # markerless ID definition/reference index across artifacts
+NEED_HEADINGS = "headings"  # active heading titles per artifact line
+NEED_DEFINED_IDS = "defined-ids"  # IDs defined in artifacts (+ to_code subset)
+NEED_CODE = "code"  # scanned code files
+
+
+@dataclass(frozen=True)
+class RulePass:
+    """A named validation pass and the index data it needs."""
+
+    name: str
+    scope: str  # artifact|cross|code
+    needs: FrozenSet[str]
+    description: str
+
+
+# Execution order matters: reports list errors in this order.
+RULE_PASSES: Tuple[RulePass, ...] = (
+    RulePass("structure", "artifact", frozenset(), "Artifact blocks match the template structure"),
+    RulePass("constraints-present", "cross", frozenset({NEED_ARTIFACTS}), "Every artifact kind has kit constraints"),
+    RulePass("id-kinds", "cross", frozenset({NEED_ARTIFACTS, NEED_IDS}), "ID kinds are defined in constraints/templates"),
+    RulePass("ref-definitions", "cross", frozenset({NEED_ARTIFACTS, NEED_IDS}), "References resolve to a definition"),
+    RulePass("ref-task-status", "cross", frozenset({NEED_ARTIFACTS, NEED_IDS}), "Done references point to done definitions"),
+    RulePass(
+        "defined-id-constraints",
+        "cross",
+        frozenset({NEED_ARTIFACTS, NEED_IDS, NEED_HEADINGS}),
+        "Defined IDs satisfy per-kind constraints and heading scopes",
+    ),
+    RulePass(
+        "reference-coverage",
+        "cross",
+        frozenset({NEED_ARTIFACTS, NEED_IDS, NEED_HEADINGS}),
+        "Reference coverage rules (required|optional|prohibited)",
+    ),
+    RulePass(
+        "code-markers",
+        "code",
+        frozenset({NEED_ARTIFACTS, NEED_DEFINED_IDS, NEED_CODE}),
+        "Code markers are well-formed and reference defined IDs",
+    ),
+    RulePass(
+        "to-code-coverage",
+        "code",
+        frozenset({NEED_ARTIFACTS, NEED_DEFINED_IDS, NEED_CODE}),
+        "IDs marked to_code=\"true\" have code markers",
+    ),
+    RulePass("cdsl-coverage", "code", frozenset({NEED_ARTIFACTS, NEED_CODE}), "Implemented CDSL instructions have code blocks"),
+    RulePass(
+        "markerless-covered-by",
+        "code",
+        frozenset({NEED_ARTIFACTS, NEED_CODE}),
+        "Markerless IDs are referenced from other artifact kinds (or code)",
+    ),
+)
+
+_RULES_BY_NAME: Dict[str, RulePass] = {r.name: r for r in RULE_PASSES}
+
+
+def rule_names(scope: Optional[str] = None) -> List[str]:
+    """Return rule pass names in execution order, optionally filtered by scope."""
+    return [r.name for r in RULE_PASSES if scope is None or r.scope == scope]
+
+
+def _split_names(raw: Optional[str]) -> List[str]:
+    return [p.strip() for p in str(raw or "").split(",") if p.strip()]
+
+
+def select_rules(rules: Optional[str] = None, skip_rules: Optional[str] = None) -> Tuple[FrozenSet[str], List[str]]:
+    """Resolve comma-separated `--rules` / `--skip-rules` values.
+
+    Returns (selected rule names, error messages). Without `rules`, all passes are selected.
+    """
+    include = _split_names(rules)
+    exclude = _split_names(skip_rules)
+    unknown = sorted({n for n in include + exclude if n not in _RULES_BY_NAME})
+    if unknown:
+        return frozenset(), [f"Unknown rule: {n}" for n in unknown]
+    selected = set(include) if rules is not None else set(_RULES_BY_NAME)
+    selected.difference_update(exclude)
+    return frozenset(selected), []
+
+
+def needs_of(selected: Iterable[str]) -> FrozenSet[str]:
+    """Union of index data needed by the selected passes."""
+    out: Set[str] = set()
+    for name in selected:
+        rp = _RULES_BY_NAME.get(name)
+        if rp is not None:
+            out.update(rp.needs)
+    return frozenset(out)
+
+
+# === EARLY-EXIT BUDGET ===
+
+STOP_MAX_ERRORS = "max-errors"
+STOP_TIME_BUDGET = "time-budget"
+
+
+@dataclass
+class ValidationBudget:
+    """Early-exit limits for a `validate` run (`--max-errors`, `--time-budget`).
+
+    Once exhausted, the validator stops scheduling further parsing and code scanning
+    and reports the unvisited files instead.
+    """
+
+    max_errors: Optional[int] = None
+    deadline: Optional[float] = None  # time.monotonic() value
+    stop_reason: Optional[str] = None
+
+    @classmethod
+    def create(cls, max_errors: Optional[int] = None, time_budget: Optional[float] = None) -> "ValidationBudget":
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        return cls(max_errors=max_errors, deadline=deadline)
+
+    def exhausted(self, error_count: int) -> bool:
+        """Return True (and latch the stop reason) once a limit is reached."""
+        if self.stop_reason is not None:
+            return True
+        if self.max_errors is not None and error_count >= self.max_errors:
+            self.stop_reason = STOP_MAX_ERRORS
+        elif self.deadline is not None and time.monotonic() >= self.deadline:
+            self.stop_reason = STOP_TIME_BUDGET
+        return self.stop_reason is not None
+
+
+# === SHARED INDEX ===
+
+@dataclass
+class ValidationIndex:
+    """Shared index consumed by code-scope rule passes.
+
+    Built once per `validate` run; fields are populated only when a selected
+    pass declares the corresponding need.
+    """
+
+    artifacts: List["Artifact"] = field(default_factory=list)
+    validated_paths: Set[str] = field(default_factory=set)
+    traceability_by_path: Dict[str, str] = field(default_factory=dict)
+    artifact_ids: Set[str] = field(default_factory=set)
+    to_code_ids: Set[str] = field(default_factory=set)
+    code_files: List[Tuple["CodeFile", str]] = field(default_factory=list)  # (file, system traceability)
+    # (position in code_files, error): load errors are reported in scan order.
+    code_load_errors: List[Tuple[int, Dict[str, object]]] = field(default_factory=list)
+    code_ids: Set[str] = field(default_factory=set)
+
+    def build_defined_ids(self) -> None:
+        """Collect IDs defined in artifacts (including markerless) and the validated to_code subset."""
+        from .document import file_has_cypilot_markers, scan_cpt_ids_without_markers
+
+        for art in self.artifacts:
+            if file_has_cypilot_markers(art.path):
+                art._extract_ids_and_refs()
+                art_traceability = self.traceability_by_path.get(str(art.path), "FULL")
+                for d in art.id_definitions:
+                    self.artifact_ids.add(d.id)
+                    if d.to_code and art_traceability == "FULL" and str(art.path) in self.validated_paths:
+                        self.to_code_ids.add(d.id)
+            else:
+                for h in scan_cpt_ids_without_markers(art.path):
+                    if h.get("type") == "definition" and h.get("id"):
+                        self.artifact_ids.add(str(h["id"]))
+
+    def add_code_file(self, cf: "CodeFile", traceability: str) -> None:
+        self.code_files.append((cf, traceability))
+        self.code_ids.update(cf.list_ids())
+
+    def add_code_load_errors(self, errs: Iterable[Dict[str, object]]) -> None:
+        pos = len(self.code_files)
+        self.code_load_errors.extend((pos, e) for e in errs)
+
+
+# === CODE-SCOPE PASSES ===
+
+def _rule_code_markers(ix: ValidationIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    load_errors = ix.code_load_errors
+    li = 0
+    for pos, (cf, traceability) in enumerate(ix.code_files):
+        while li < len(load_errors) and load_errors[li][0] <= pos:
+            errors.append(load_errors[li][1])
+            li += 1
+        result = cf.validate()
+        errors.extend(result.get("errors", []))
+        warnings.extend(result.get("warnings", []))
+        if traceability != "FULL":
+            continue
+        for ref in cf.references:
+            if ref.id not in ix.artifact_ids:
+                errors.append({
+                    "type": "traceability",
+                    "message": "Code marker references ID not defined in any artifact",
+                    "path": str(cf.path),
+                    "line": ref.line,
+                    "id": ref.id,
+                })
+    errors.extend(e for _pos, e in load_errors[li:])
+
+
+def _rule_to_code_coverage(ix: ValidationIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    for missing_id in sorted(ix.to_code_ids - ix.code_ids):
+        errors.append({
+            "type": "coverage",
+            "message": "ID marked to_code=\"true\" has no code marker",
+            "id": missing_id,
+        })
+
+
+def _find_parent_id_def(defs: List[object], line_no: int) -> Optional[object]:
+    """Return the tightest ID definition block enclosing line_no."""
+    candidates = []
+    for d in defs:
+        blk = getattr(d, "block", None)
+        if not blk:
+            continue
+        if blk.start_line <= line_no <= blk.end_line:
+            candidates.append(d)
+    if not candidates:
+        return None
+    candidates.sort(key=lambda x: (x.block.end_line - x.block.start_line))
+    return candidates[0]
+
+
+def _rule_cdsl_coverage(ix: ValidationIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    """Checked CDSL instructions under to_code IDs (FULL traceability) need code block markers."""
+    from .document import file_has_cypilot_markers, scan_cdsl_instructions_without_markers
+
+    code_block_keys: Set[Tuple[str, int, str]] = set()
+    for cf, _traceability in ix.code_files:
+        for bm in cf.block_markers:
+            code_block_keys.add((bm.id, int(bm.phase), str(bm.inst)))
+
+    for art in ix.artifacts:
+        art_path_str = str(art.path)
+        if art_path_str not in ix.validated_paths:
+            continue
+        if ix.traceability_by_path.get(art_path_str, "FULL") != "FULL":
+            continue
+        if not file_has_cypilot_markers(art.path):
+            continue
+
+        art._extract_ids_and_refs()
+        for inst in getattr(art, "cdsl_instructions", []) or []:
+            if not getattr(inst, "checked", False):
+                continue
+            phase = getattr(inst, "phase", None)
+            if phase is None:
+                continue
+
+            parent = _find_parent_id_def(art.id_definitions, int(getattr(inst, "line", 1) or 1))
+            if parent is None:
+                continue
+            if not getattr(parent, "to_code", False):
+                continue
+
+            key = (str(parent.id), int(phase), str(getattr(inst, "inst", "")))
+            if key in code_block_keys:
+                continue
+
+            errors.append({
+                "type": "coverage",
+                "message": "Implemented CDSL instruction has no code block marker",
+                "artifact": art_path_str,
+                "line": int(getattr(inst, "line", 1) or 1),
+                "id": str(parent.id),
+                "phase": int(phase),
+                "inst": f"inst-{getattr(inst, 'inst', '')}",
+            })
+
+    # Markerless artifacts: best-effort scan for CDSL instructions by regex.
+    # Parent binding rule: nearest ID definition above the instruction.
+    for art in ix.artifacts:
+        art_path_str = str(art.path)
+        if art_path_str not in ix.validated_paths:
+            continue
+        if ix.traceability_by_path.get(art_path_str, "FULL") != "FULL":
+            continue
+        if file_has_cypilot_markers(art.path):
+            continue
+
+        for h in scan_cdsl_instructions_without_markers(art.path):
+            if not bool(h.get("checked", False)):
+                continue
+            parent_id = str(h.get("parent_id") or "").strip()
+            if not parent_id:
+                continue
+            phase = h.get("phase")
+            inst = str(h.get("inst") or "").strip()
+            if phase is None or not inst:
+                continue
+
+            key = (parent_id, int(phase), inst)
+            if key in code_block_keys:
+                continue
+
+            errors.append({
+                "type": "coverage",
+                "message": "Implemented CDSL instruction has no code block marker",
+                "artifact": art_path_str,
+                "line": int(h.get("line", 1) or 1),
+                "id": parent_id,
+                "phase": int(phase),
+                "inst": f"inst-{inst}",
+            })
+
+
+def _rule_markerless_covered_by(ix: ValidationIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    """Markerless covered-by (simplified).
+
+    If an artifact has no markers, each `**ID**: ...` definition must be referenced
+    from at least one OTHER artifact kind. If no other kinds exist in scope → warn.
+    If traceability is FULL for this artifact, a code reference also satisfies coverage.
+    """
+    from .document import file_has_cypilot_markers, scan_cpt_ids_without_markers
+    from .template import Template
+
+    if not ix.artifacts:
+        return
+
+    present_kinds: Set[str] = set()
+    refs_by_id: Dict[str, Set[str]] = {}
+
+    # Build reference index across ALL artifacts (including markerless).
+    for art in ix.artifacts:
+        kind = art.template.kind
+        present_kinds.add(kind)
+
+        if not file_has_cypilot_markers(art.path):
+            for h in scan_cpt_ids_without_markers(art.path):
+                if h.get("type") != "reference":
+                    continue
+                rid = str(h.get("id", "")).strip()
+                if not rid:
+                    continue
+                refs_by_id.setdefault(rid, set()).add(kind)
+            continue
+
+        art._extract_ids_and_refs()
+        for r in art.id_references:
+            refs_by_id.setdefault(r.id, set()).add(kind)
+
+    # Enforce rule for validated markerless artifacts.
+    for art in ix.artifacts:
+        art_path_str = str(art.path)
+        if art_path_str not in ix.validated_paths:
+            continue
+        if file_has_cypilot_markers(art.path):
+            continue
+        if getattr(art.template, "constraints", None) is not None:
+            continue
+
+        kind = art.template.kind
+        other_kinds = sorted(k for k in present_kinds if k != kind)
+        art_traceability = ix.traceability_by_path.get(art_path_str, "FULL")
+
+        for h in scan_cpt_ids_without_markers(art.path):
+            if h.get("type") != "definition":
+                continue
+            did = str(h.get("id", "")).strip()
+            if not did:
+                continue
+            line = int(h.get("line", 1) or 1)
+
+            if not other_kinds:
+                warnings.append(Template.error(
+                    "structure",
+                    "ID not referenced (no other artifact kinds in scope)",
+                    path=art.path,
+                    line=line,
+                    id=did,
+                ))
+                continue
+
+            referenced_kinds = sorted(k for k in refs_by_id.get(did, set()) if k != kind)
+            if referenced_kinds:
+                continue
+
+            # Allow code reference to satisfy coverage when FULL.
+            if art_traceability == "FULL" and did in ix.code_ids:
+                continue
+
+            errors.append(Template.error(
+                "structure",
+                "ID not referenced from other artifact kinds",
+                path=art.path,
+                line=line,
+                id=did,
+                other_kinds=other_kinds,
+            ))
+
+
+_CODE_RULES = {
+    "code-markers": _rule_code_markers,
+    "to-code-coverage": _rule_to_code_coverage,
+    "cdsl-coverage": _rule_cdsl_coverage,
+    "markerless-covered-by": _rule_markerless_covered_by,
+}
+
+
+def run_code_rules(
+    ix: ValidationIndex,
+    selected: Iterable[str],
+) -> Dict[str, List[Dict[str, object]]]:
+    """Run the selected code-scope passes over the shared index (in registry order)."""
+    chosen = set(selected)
+    errors: List[Dict[str, object]] = []
+    warnings: List[Dict[str, object]] = []
+    for name in rule_names("code"):
+        if name in chosen:
+            _CODE_RULES[name](ix, errors, warnings)
+    return {"errors": errors, "warnings": warnings}
+
+
+__all__ = [
+    "NEED_ARTIFACTS",
+    "NEED_IDS",
+    "NEED_HEADINGS",
+    "NEED_DEFINED_IDS",
+    "NEED_CODE",
+    "RulePass",
+    "RULE_PASSES",
+    "STOP_MAX_ERRORS",
+    "STOP_TIME_BUDGET",
+    "ValidationBudget",
+    "ValidationIndex",
+    "rule_names",
+    "select_rules",
+    "needs_of",
+    "run_code_rules",
+]
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from .errors import ErrorRecord
 
 SUPPORTED_VERSION = {"major": 2, "minor": 0}
 
@@ -38,7 +40,7 @@ _CDSL_LINE_RE = re.compile(r"^\s*(?:\d+\.\s+|-\s+)\[\s*[xX ]\s*\]\s*-\s*`p[a-z0-
 _CDSL_PHASE_RE = re.compile(r"`p(?P<phase>\d+)`")
 _CDSL_INST_RE = re.compile(r"`inst-(?P<inst>[a-z0-9-]+)`")
 
-# Valid marker types (must match validate_block_content handlers)
+# Valid marker types (must match _CONTENT_VALIDATORS handlers)
 VALID_MARKER_TYPES = frozenset({
     "free", "id", "id-ref",
     "list", "numbered-list", "task-list",
@@ -249,6 +251,7 @@ class Template:
     blocks: List[TemplateBlock] = None  # populated on load()
     constraints: Optional["ArtifactKindConstraints"] = None
     _loaded: bool = False
+    _compiled: Optional["CompiledTemplate"] = field(default=None, repr=False, compare=False)
 
     @staticmethod
     def first_nonempty(lines: List[str]) -> Optional[Tuple[int, str]]:
@@ -259,14 +262,12 @@ class Template:
         return None
 
     @staticmethod
-    def error(kind: str, message: str, *, path: Path | int, line: int = 1, **extra) -> Dict[str, object]:
-        """Uniform error factory used across template/artifact validation."""
-        out: Dict[str, object] = {"type": kind, "message": message, "line": int(line)}
-        if isinstance(path, Path):
-            out["path"] = str(path)
-        extra = {k: v for k, v in extra.items() if v is not None}
-        out.update(extra)
-        return out
+    def error(kind: str, message: str, *, path: Path | int, line: int = 1, **extra) -> ErrorRecord:
+        """Uniform error factory used across template/artifact validation.
+
+        Returns a lazy `ErrorRecord`; its dict form is built only when read or emitted.
+        """
+        return ErrorRecord(kind, message, line, path if isinstance(path, Path) else None, extra)
 
     @staticmethod
     def parse_attrs(raw: str) -> Dict[str, str]:
@@ -329,6 +330,29 @@ class Template:
             cur[key] = Template.parse_scalar(val_raw)
         return root, end
 
+    @staticmethod
+    def kind_from_path(path: Path) -> Optional[str]:
+        """Infer KIND from a `.../artifacts/{KIND}/template.md` path."""
+        parts = path.parts
+        for i, part in enumerate(parts):
+            if part == "artifacts" and i + 1 < len(parts):
+                return parts[i + 1].upper()
+        return None
+
+    @staticmethod
+    def peek_kind(path: Path, text: str) -> Optional[str]:
+        """Return the kind `load` would assign, reading only the frontmatter."""
+        try:
+            fm, _fm_end = Template.parse_frontmatter_yaml(text)
+        except Exception:
+            fm = None
+        if isinstance(fm, dict):
+            ft = fm.get("cypilot-template")
+            if isinstance(ft, dict) and ft.get("kind"):
+                return str(ft.get("kind")).strip()
+        kind = Template.kind_from_path(path)
+        return kind.strip() if kind else None
+
     @classmethod
     def from_path(cls, template_path: Path) -> Tuple[Optional["Template"], List[Dict[str, object]]]:
         """Convenience: instantiate Template and load immediately."""
@@ -368,13 +392,8 @@ class Template:
                     template_version = TemplateVersion(int(ver["major"]), int(ver["minor"]))
 
         # Infer kind from path if not in frontmatter
-        # Path pattern: .../artifacts/{KIND}/template.md
         if not kind:
-            parts = self.path.parts
-            for i, part in enumerate(parts):
-                if part == "artifacts" and i + 1 < len(parts):
-                    kind = parts[i + 1].upper()
-                    break
+            kind = Template.kind_from_path(self.path)
 
         if not kind:
             return [Template.error("template", "Cannot determine template kind (no frontmatter and path doesn't match .../artifacts/{KIND}/template.md)", path=self.path, line=1)]
@@ -404,6 +423,14 @@ class Template:
         object.__setattr__(self, "_loaded", True)
         return []
 
+    def compiled(self) -> "CompiledTemplate":
+        """Lookup tables for this template's blocks, built once and shared by all artifacts."""
+        ct = self._compiled
+        if ct is None or ct.blocks is not self.blocks:
+            ct = CompiledTemplate.build(self.blocks)
+            object.__setattr__(self, "_compiled", ct)
+        return ct
+
     def parse(self, artifact_path: Path) -> "Artifact":
         # Ensure template is loaded before parsing artifact.
         errs = self.load()
@@ -469,169 +496,274 @@ class Template:
             errors.append(Template.error("template", "Unclosed marker", path=0, line=open_line, id=open_name, marker_type=open_type))
         return blocks, errors
 
-    @staticmethod
-    def validate_block_content(artifact_path: Path, tpl: TemplateBlock, inst: ArtifactBlock, errors: List[Dict[str, object]]):
-        """Validate an artifact block's content against its template block type."""
-        content = inst.content
-        first = Template.first_nonempty(content)
-        if tpl.type == "free":
+
+# === BLOCK CONTENT VALIDATORS ===
+# One validator per template block type ("free" blocks are not validated).
+
+def _validate_id_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    if not content:
+        errors.append(Template.error("structure", "ID block missing content", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    has_attr = tpl.attrs.get("has", "")
+    require_priority = "priority" in has_attr
+    # Only check lines that start with **ID**: (ID blocks may wrap additional content)
+    # Filter out content inside code fences (examples shouldn't trigger validation)
+    filtered_content = filter_code_fences(content)
+    id_candidates = [line for line in filtered_content if _ID_LABEL_RE.search(line)]
+    if not id_candidates:
+        errors.append(Template.error("structure", "ID block missing **ID**: line", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    id_lines = [line for line in id_candidates if _ID_DEF_RE.match(line.strip())]
+    if not id_lines:
+        errors.append(Template.error("structure", "Invalid ID format", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    for line in id_lines:
+        if require_priority and "`p" not in line:
+            errors.append(Template.error("structure", "ID definition missing priority", path=artifact_path, line=inst.start_line, id=tpl.name))
             return
-        if tpl.type == "id":
-            if not content:
-                errors.append(Template.error("structure", "ID block missing content", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
-            has_attr = tpl.attrs.get("has", "")
-            require_priority = "priority" in has_attr
-            # Only check lines that start with **ID**: (ID blocks may wrap additional content)
-            # Filter out content inside code fences (examples shouldn't trigger validation)
-            filtered_content = filter_code_fences(content)
-            id_candidates = [line for line in filtered_content if _ID_LABEL_RE.search(line)]
-            if not id_candidates:
-                errors.append(Template.error("structure", "ID block missing **ID**: line", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
-            id_lines = [line for line in id_candidates if _ID_DEF_RE.match(line.strip())]
-            if not id_lines:
-                errors.append(Template.error("structure", "Invalid ID format", path=artifact_path, line=inst.start_line, id=tpl.name))
+        # If line has a checkbox, it must be a list item
+        stripped = line.lstrip()
+        has_checkbox = stripped.startswith("[") or "[ ]" in stripped or "[x]" in stripped.lower()
+        if has_checkbox:
+            is_list_item = stripped.startswith("- ") or stripped.startswith("* ") or _ORDERED_NUMERIC_RE.match(stripped)
+            if not is_list_item:
+                errors.append(Template.error("structure", "Task checkbox must be in a list item", path=artifact_path, line=inst.start_line, id=tpl.name))
                 return
-            for line in id_lines:
-                if require_priority and "`p" not in line:
-                    errors.append(Template.error("structure", "ID definition missing priority", path=artifact_path, line=inst.start_line, id=tpl.name))
-                    return
-                # If line has a checkbox, it must be a list item
-                stripped = line.lstrip()
-                has_checkbox = stripped.startswith("[") or "[ ]" in stripped or "[x]" in stripped.lower()
-                if has_checkbox:
-                    is_list_item = stripped.startswith("- ") or stripped.startswith("* ") or _ORDERED_NUMERIC_RE.match(stripped)
-                    if not is_list_item:
-                        errors.append(Template.error("structure", "Task checkbox must be in a list item", path=artifact_path, line=inst.start_line, id=tpl.name))
-                        return
+
+
+def _validate_id_ref_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    if not content:
+        errors.append(Template.error("structure", "ID ref block missing content", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    has_attr = tpl.attrs.get("has", "")
+    require_priority = "priority" in has_attr
+    tokens: List[str] = []
+    for line in content:
+        # Strip list markers (- or *) before processing
+        stripped = line.lstrip()
+        is_list_item = stripped.startswith("- ") or stripped.startswith("* ") or _ORDERED_NUMERIC_RE.match(stripped)
+        # If line has a checkbox, it must be a list item
+        has_checkbox = "[ ]" in stripped or "[x]" in stripped.lower()
+        if has_checkbox and not is_list_item:
+            errors.append(Template.error("structure", "Task checkbox must be in a list item", path=artifact_path, line=inst.start_line, id=tpl.name))
             return
-        if tpl.type == "id-ref":
-            if not content:
-                errors.append(Template.error("structure", "ID ref block missing content", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
-            has_attr = tpl.attrs.get("has", "")
-            require_priority = "priority" in has_attr
-            tokens: List[str] = []
-            for line in content:
-                # Strip list markers (- or *) before processing
-                stripped = line.lstrip()
-                is_list_item = stripped.startswith("- ") or stripped.startswith("* ") or _ORDERED_NUMERIC_RE.match(stripped)
-                # If line has a checkbox, it must be a list item
-                has_checkbox = "[ ]" in stripped or "[x]" in stripped.lower()
-                if has_checkbox and not is_list_item:
-                    errors.append(Template.error("structure", "Task checkbox must be in a list item", path=artifact_path, line=inst.start_line, id=tpl.name))
-                    return
-                if stripped.startswith("- "):
-                    stripped = stripped[2:]
-                elif stripped.startswith("* "):
-                    stripped = stripped[2:]
-                for part in [p.strip() for p in stripped.split(",")]:
-                    if part:
-                        tokens.append(part)
-            for tok in tokens:
-                if not _ID_REF_RE.match(tok):
-                    errors.append(Template.error("structure", "Invalid ID ref format", path=artifact_path, line=inst.start_line, id=tpl.name, value=tok))
-                    return
-                if require_priority and "`p" not in tok:
-                    errors.append(Template.error("structure", "ID ref missing priority", path=artifact_path, line=inst.start_line, id=tpl.name, value=tok))
-                    return
+        if stripped.startswith("- "):
+            stripped = stripped[2:]
+        elif stripped.startswith("* "):
+            stripped = stripped[2:]
+        for part in [p.strip() for p in stripped.split(",")]:
+            if part:
+                tokens.append(part)
+    for tok in tokens:
+        if not _ID_REF_RE.match(tok):
+            errors.append(Template.error("structure", "Invalid ID ref format", path=artifact_path, line=inst.start_line, id=tpl.name, value=tok))
             return
-        if tpl.type in {"list", "numbered-list", "task-list"}:
-            if not content or not first:
-                errors.append(Template.error("structure", "List block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
-            for line in content:
-                if not line.strip():
-                    continue
-                if tpl.type == "list" and not (line.lstrip().startswith("- ") or line.lstrip().startswith("* ")):
-                    errors.append(Template.error("structure", "Expected bullet list", path=artifact_path, line=inst.start_line, id=tpl.name))
-                    return
-                if tpl.type == "numbered-list" and not _ORDERED_NUMERIC_RE.match(line.lstrip()):
-                    errors.append(Template.error("structure", "Expected numbered list", path=artifact_path, line=inst.start_line, id=tpl.name))
-                    return
-                if tpl.type == "task-list":
-                    if not line.lstrip().startswith("- ["):
-                        errors.append(Template.error("structure", "Expected task list", path=artifact_path, line=inst.start_line, id=tpl.name))
-                        return
-                    if tpl.attrs.get("has", "").find("priority") != -1 and "`p" not in line:
-                        errors.append(Template.error("structure", "Task item missing priority", path=artifact_path, line=inst.start_line, id=tpl.name))
-                        return
+        if require_priority and "`p" not in tok:
+            errors.append(Template.error("structure", "ID ref missing priority", path=artifact_path, line=inst.start_line, id=tpl.name, value=tok))
             return
-        if tpl.type == "table":
-            nonempty = [ln for ln in content if ln.strip()]
-            if len(nonempty) < 2:
-                errors.append(Template.error("structure", "Table must have header and separator", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
-            header = nonempty[0]
-            sep = nonempty[1] if len(nonempty) > 1 else ""
-            header_cols = header.count("|") - 1 if "|" in header else 0
-            if header_cols < 1 or "|" not in sep:
-                errors.append(Template.error("structure", "Invalid table header/separator", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
-            # separator must have same columns and dashes
-            sep_cells = [p.strip() for p in sep.strip().strip("|").split("|")]
-            if len(sep_cells) != header_cols or any(not set(c) <= set("-:") for c in sep_cells):
-                errors.append(Template.error("structure", "Table separator column count mismatch", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
-            data_rows = 0
-            for ln in nonempty[2:]:
-                if ln.strip().startswith("|"):
-                    cells = [p.strip() for p in ln.strip().strip("|").split("|")]
-                    if len(cells) != header_cols:
-                        errors.append(Template.error("structure", "Table row column count mismatch", path=artifact_path, line=inst.start_line, id=tpl.name))
-                        return
-                    data_rows += 1
-            if data_rows == 0:
-                errors.append(Template.error("structure", "Table must have at least one data row", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
+
+
+def _validate_list_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    first = Template.first_nonempty(content)
+    if not content or not first:
+        errors.append(Template.error("structure", "List block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    for line in content:
+        if not line.strip():
+            continue
+        if tpl.type == "list" and not (line.lstrip().startswith("- ") or line.lstrip().startswith("* ")):
+            errors.append(Template.error("structure", "Expected bullet list", path=artifact_path, line=inst.start_line, id=tpl.name))
             return
-        if tpl.type == "paragraph":
-            if not first:
-                errors.append(Template.error("structure", "Paragraph block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
-                return
+        if tpl.type == "numbered-list" and not _ORDERED_NUMERIC_RE.match(line.lstrip()):
+            errors.append(Template.error("structure", "Expected numbered list", path=artifact_path, line=inst.start_line, id=tpl.name))
             return
-        if tpl.type == "code":
-            if not first or not _CODE_FENCE_RE.match(first[1]):
-                errors.append(Template.error("structure", "Code block must start with ```", path=artifact_path, line=inst.start_line, id=tpl.name))
+        if tpl.type == "task-list":
+            if not line.lstrip().startswith("- ["):
+                errors.append(Template.error("structure", "Expected task list", path=artifact_path, line=inst.start_line, id=tpl.name))
                 return
-            closing = False
-            for line in content[1:]:
-                if _CODE_FENCE_RE.match(line):
-                    closing = True
-                    break
-            if not closing:
-                errors.append(Template.error("structure", "Code fence must be closed", path=artifact_path, line=inst.start_line, id=tpl.name))
-            return
-        if tpl.type in {"#", "##", "###", "####", "#####", "######"}:
-            level = len(tpl.type)
-            if not first:
-                errors.append(Template.error("structure", "Heading block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
+            if tpl.attrs.get("has", "").find("priority") != -1 and "`p" not in line:
+                errors.append(Template.error("structure", "Task item missing priority", path=artifact_path, line=inst.start_line, id=tpl.name))
                 return
-            if not first[1].lstrip().startswith("#" * level + " "):
-                errors.append(Template.error("structure", "Heading level mismatch", path=artifact_path, line=inst.start_line, id=tpl.name))
-            return
-        if tpl.type == "link":
-            if not first or "[" not in first[1] or "](" not in first[1]:
-                errors.append(Template.error("structure", "Invalid link", path=artifact_path, line=inst.start_line, id=tpl.name))
-            return
-        if tpl.type == "image":
-            if not first or not first[1].lstrip().startswith("!"):
-                errors.append(Template.error("structure", "Invalid image", path=artifact_path, line=inst.start_line, id=tpl.name))
-            return
-        if tpl.type == "cdsl":
-            if not content or not first:
-                errors.append(Template.error("structure", "CDSL block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
+
+
+def _validate_table_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    nonempty = [ln for ln in content if ln.strip()]
+    if len(nonempty) < 2:
+        errors.append(Template.error("structure", "Table must have header and separator", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    header = nonempty[0]
+    sep = nonempty[1] if len(nonempty) > 1 else ""
+    header_cols = header.count("|") - 1 if "|" in header else 0
+    if header_cols < 1 or "|" not in sep:
+        errors.append(Template.error("structure", "Invalid table header/separator", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    # separator must have same columns and dashes
+    sep_cells = [p.strip() for p in sep.strip().strip("|").split("|")]
+    if len(sep_cells) != header_cols or any(not set(c) <= set("-:") for c in sep_cells):
+        errors.append(Template.error("structure", "Table separator column count mismatch", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    data_rows = 0
+    for ln in nonempty[2:]:
+        if ln.strip().startswith("|"):
+            cells = [p.strip() for p in ln.strip().strip("|").split("|")]
+            if len(cells) != header_cols:
+                errors.append(Template.error("structure", "Table row column count mismatch", path=artifact_path, line=inst.start_line, id=tpl.name))
                 return
-            for line in content:
-                if not line.strip():
-                    continue
-                if not _CDSL_LINE_RE.match(line):
-                    errors.append(Template.error("structure", "Invalid CDSL line", path=artifact_path, line=inst.start_line, id=tpl.name, value=line.strip()))
-                    return
+            data_rows += 1
+    if data_rows == 0:
+        errors.append(Template.error("structure", "Table must have at least one data row", path=artifact_path, line=inst.start_line, id=tpl.name))
+
+
+def _validate_paragraph_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    first = Template.first_nonempty(content)
+    if not first:
+        errors.append(Template.error("structure", "Paragraph block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
+
+
+def _validate_code_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    first = Template.first_nonempty(content)
+    if not first or not _CODE_FENCE_RE.match(first[1]):
+        errors.append(Template.error("structure", "Code block must start with ```", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    closing = False
+    for line in content[1:]:
+        if _CODE_FENCE_RE.match(line):
+            closing = True
+            break
+    if not closing:
+        errors.append(Template.error("structure", "Code fence must be closed", path=artifact_path, line=inst.start_line, id=tpl.name))
+
+
+def _validate_heading_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    first = Template.first_nonempty(content)
+    level = len(tpl.type)
+    if not first:
+        errors.append(Template.error("structure", "Heading block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    if not first[1].lstrip().startswith("#" * level + " "):
+        errors.append(Template.error("structure", "Heading level mismatch", path=artifact_path, line=inst.start_line, id=tpl.name))
+
+
+def _validate_link_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    first = Template.first_nonempty(content)
+    if not first or "[" not in first[1] or "](" not in first[1]:
+        errors.append(Template.error("structure", "Invalid link", path=artifact_path, line=inst.start_line, id=tpl.name))
+
+
+def _validate_image_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    first = Template.first_nonempty(content)
+    if not first or not first[1].lstrip().startswith("!"):
+        errors.append(Template.error("structure", "Invalid image", path=artifact_path, line=inst.start_line, id=tpl.name))
+
+
+def _validate_cdsl_content(artifact_path: Path, tpl: TemplateBlock, inst: "ArtifactBlock", errors: List[Dict[str, object]]) -> None:
+    content = inst.content
+    first = Template.first_nonempty(content)
+    if not content or not first:
+        errors.append(Template.error("structure", "CDSL block empty", path=artifact_path, line=inst.start_line, id=tpl.name))
+        return
+    for line in content:
+        if not line.strip():
+            continue
+        if not _CDSL_LINE_RE.match(line):
+            errors.append(Template.error("structure", "Invalid CDSL line", path=artifact_path, line=inst.start_line, id=tpl.name, value=line.strip()))
             return
 
 
+_CONTENT_VALIDATORS = {
+    "id": _validate_id_content,
+    "id-ref": _validate_id_ref_content,
+    "list": _validate_list_content,
+    "numbered-list": _validate_list_content,
+    "task-list": _validate_list_content,
+    "table": _validate_table_content,
+    "paragraph": _validate_paragraph_content,
+    "code": _validate_code_content,
+    "#": _validate_heading_content,
+    "##": _validate_heading_content,
+    "###": _validate_heading_content,
+    "####": _validate_heading_content,
+    "#####": _validate_heading_content,
+    "######": _validate_heading_content,
+    "link": _validate_link_content,
+    "image": _validate_image_content,
+    "cdsl": _validate_cdsl_content,
+}
+
+
+BlockKey = Tuple[str, str]  # (marker type, name)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Precomputed lookup tables over a template's blocks.
+
+    Built once per loaded template (see `Template.compiled`) so per-artifact parsing
+    and validation do not rescan the template. Block attrs are not copied:
+    constraints applied later (`apply_kind_constraints`) stay visible.
+    """
+
+    blocks: Optional[List[TemplateBlock]]
+    by_key: Dict[BlockKey, List[TemplateBlock]]
+    first_by_key: Dict[BlockKey, TemplateBlock]
+    parents: Dict[int, Optional[TemplateBlock]]  # id(block) -> innermost enclosing block
+    ambiguous_keys: FrozenSet[BlockKey]  # keys declared more than once
+    validators: Dict[BlockKey, Callable[..., None]]
+
+    @classmethod
+    def build(cls, blocks: Optional[List[TemplateBlock]]) -> "CompiledTemplate":
+        tpl_blocks = list(blocks or [])
+        by_key: Dict[BlockKey, List[TemplateBlock]] = {}
+        for b in tpl_blocks:
+            by_key.setdefault((b.type, b.name), []).append(b)
+
+        parents: Dict[int, Optional[TemplateBlock]] = {id(b): _innermost_enclosing(tpl_blocks, b) for b in tpl_blocks}
+
+        validators: Dict[BlockKey, Callable[..., None]] = {}
+        for key in by_key:
+            v = _CONTENT_VALIDATORS.get(key[0])
+            if v is not None:
+                validators[key] = v
+
+        return cls(
+            blocks=blocks,
+            by_key=by_key,
+            first_by_key={k: v[0] for k, v in by_key.items()},
+            parents=parents,
+            ambiguous_keys=frozenset(k for k, v in by_key.items() if len(v) > 1),
+            validators=validators,
+        )
+
+    def parent_of(self, block: TemplateBlock) -> Optional[TemplateBlock]:
+        """Innermost template block enclosing `block` (None at root level)."""
+        bid = id(block)
+        if bid in self.parents:
+            return self.parents[bid]
+        # Synthetic blocks for unknown artifact markers are not part of the template.
+        return _innermost_enclosing(self.blocks or [], block)
+
+
+def _innermost_enclosing(blocks: Sequence[TemplateBlock], blk: TemplateBlock) -> Optional[TemplateBlock]:
+    """Find the innermost template block strictly containing `blk`."""
+    best: Optional[TemplateBlock] = None
+    for other in blocks:
+        if other is blk:
+            continue
+        if other.start_line < blk.start_line and blk.end_line < other.end_line:
+            if best is None or other.start_line > best.start_line:
+                best = other
+    return best
+
+
 @dataclass
 class IdDefinition:
     id: str
@@ -716,19 +848,17 @@ class Artifact:
         art_blocks: List[ArtifactBlock] = []
         stack: List[Tuple[TemplateBlock, int]] = []
 
-        tpl_by_key: Dict[Tuple[str, str], List[TemplateBlock]] = {}
-        for b in self.template.blocks:
-            tpl_by_key.setdefault((b.type, b.name), []).append(b)
+        first_by_key = self.template.compiled().first_by_key
 
         for idx0, line in enumerate(lines):
             line_no = idx0 + 1
             for m in _MARKER_RE.finditer(line):
                 m_type = m.group("type") or "free"
                 name = m.group("name")
-                attrs = Template.parse_attrs(m.group("attrs") or "")
-                key = (m_type, name)
-                matching_tpl = tpl_by_key.get(key, [])
-                tpl_ref = matching_tpl[0] if matching_tpl else TemplateBlock(m_type, name, True, "one", attrs, line_no, line_no)
+                tpl_ref = first_by_key.get((m_type, name))
+                if tpl_ref is None:
+                    attrs = Template.parse_attrs(m.group("attrs") or "")
+                    tpl_ref = TemplateBlock(m_type, name, True, "one", attrs, line_no, line_no)
 
                 if stack and stack[-1][0].type == m_type and stack[-1][0].name == name:
                     open_tpl, open_idx = stack.pop()
@@ -799,9 +929,7 @@ class Artifact:
         for b in self.blocks:
             art_by_key.setdefault((b.template_block.type, b.template_block.name), []).append(b)
 
-        tpl_by_key: Dict[Tuple[str, str], List[TemplateBlock]] = {}
-        for b in self.template.blocks:
-            tpl_by_key.setdefault((b.type, b.name), []).append(b)
+        ct = self.template.compiled()
 
         # Get all repeat="many" blocks as potential parent containers
         repeat_many_blocks = [b for b in self.blocks if b.template_block.repeat == "many"]
@@ -816,17 +944,6 @@ class Artifact:
                         best = parent
             return best
 
-        def find_template_parent(tpl_blk: TemplateBlock) -> Optional[TemplateBlock]:
-            """Find the innermost template block containing this block."""
-            best: Optional[TemplateBlock] = None
-            for other in self.template.blocks:
-                if other is tpl_blk:
-                    continue
-                if other.start_line < tpl_blk.start_line and tpl_blk.end_line < other.end_line:
-                    if best is None or other.start_line > best.start_line:
-                        best = other
-            return best
-
         def find_artifact_parent(art_blk: ArtifactBlock) -> Optional[ArtifactBlock]:
             """Find the innermost artifact block containing this block."""
             best: Optional[ArtifactBlock] = None
@@ -838,8 +955,9 @@ class Artifact:
                         best = other
             return best
 
-        for key, tpl_list in tpl_by_key.items():
+        for key, tpl_list in ct.by_key.items():
             instances = art_by_key.get(key, [])
+            validator = ct.validators.get(key)
             for tpl in tpl_list:
                 if tpl.required and not instances:
                     errors.append(Template.error("structure", "Required block missing", path=self.path, line=tpl.start_line, id=tpl.name, marker_type=tpl.type))
@@ -855,8 +973,9 @@ class Artifact:
                     for parent_key, group in by_parent.items():
                         if len(group) > 1:
                             errors.append(Template.error("structure", "Block must appear once", path=self.path, line=group[1].start_line, id=tpl.name, marker_type=tpl.type))
-                for inst in instances:
-                    Template.validate_block_content(self.path, tpl, inst, errors)
+                if validator is not None:
+                    for inst in instances:
+                        validator(self.path, tpl, inst, errors)
 
         # Validate nesting structure: artifact blocks must be nested inside the same parent type as in template
         # Skip nesting validation for blocks inside repeat="many" parents (structure varies by instance)
@@ -865,11 +984,10 @@ class Artifact:
 
             # Skip nesting check if this block type appears multiple times in template
             # (can't reliably match which occurrence an artifact block corresponds to)
-            key = (tpl_blk.type, tpl_blk.name)
-            if len(tpl_by_key.get(key, [])) > 1:
+            if (tpl_blk.type, tpl_blk.name) in ct.ambiguous_keys:
                 continue
 
-            tpl_parent = find_template_parent(tpl_blk)
+            tpl_parent = ct.parent_of(tpl_blk)
 
             # Skip nesting check if parent has repeat="many" (flexible structure)
             if tpl_parent is not None and tpl_parent.repeat == "many":
@@ -922,7 +1040,7 @@ class Artifact:
 
         # Unknown markers are always errors (markers in artifact not defined in template)
         for key, inst_list in art_by_key.items():
-            if key not in tpl_by_key:
+            if key not in ct.by_key:
                 errors.append(Template.error("structure", "Unknown marker", path=self.path, line=inst_list[0].start_line, marker_type=key[0], id=key[1]))
 
         return {"errors": errors, "warnings": warnings}
@@ -1379,67 +1497,79 @@ class Artifact:
                 check_spec_id(r.id, r.line)
 
 
-def cross_validate_artifacts(
-    artifacts: Sequence[Artifact],
-    registered_systems: Optional[Iterable[str]] = None,
-    known_kinds: Optional[Iterable[str]] = None,
-) -> Dict[str, List[Dict[str, object]]]:
-    """Cross-artifact validation (markerless-first).
+class _CrossIndex:
+    """Shared markerless index for cross-artifact rule passes.
 
-    The validator intentionally ignores template markers and performs a markerless
-    scan of all artifacts (even if markers are present). This yields a stable set of
-    ID definitions and references.
-
-    Primary rules are derived from `constraints.json` attached to templates.
+    Built once per `cross_validate_artifacts` call. The ID index and heading
+    stacks are only computed when a selected pass needs them.
     """
-    errors: List[Dict[str, object]] = []
-    warnings: List[Dict[str, object]] = []
 
-    # Normalize known_kinds to lowercase set (if provided)
-    kinds_set: Optional[set] = None
-    if known_kinds is not None:
-        kinds_set = {k.lower() for k in known_kinds}
-
-    from .document import headings_by_line_markerless, scan_cpt_ids_markerless
-
-    # Collected markerless hits
-    defs_by_id: Dict[str, List[Dict[str, object]]] = {}
-    refs_by_id: Dict[str, List[Dict[str, object]]] = {}
-
-    # Per-system scoping
-    present_kinds_by_system: Dict[str, set[str]] = {}
-    refs_by_system_kind: Dict[str, Dict[str, List[Dict[str, object]]]] = {}
-    defs_by_system_kind: Dict[str, Dict[str, List[Dict[str, object]]]] = {}
-
-    # Constraints by artifact kind
-    constraints_by_artifact_kind: Dict[str, object] = {}
-    missing_constraints_kinds: set[str] = set()
-    all_constrained_id_kinds: set[str] = set()
-    spec_constrained_id_kinds: set[str] = set()
+    def __init__(
+        self,
+        artifacts: Sequence[Artifact],
+        registered_systems: Optional[Iterable[str]],
+        known_kinds: Optional[Iterable[str]],
+    ):
+        self.artifacts = artifacts
+
+        # Normalize known_kinds to lowercase set (if provided)
+        self.kinds_set: Optional[set] = None
+        if known_kinds is not None:
+            self.kinds_set = {k.lower() for k in known_kinds}
+
+        # Normalize registered_systems to lowercase for matching
+        self.systems_set: set[str] = set()
+        if registered_systems is not None:
+            self.systems_set = {str(s).lower() for s in registered_systems}
+
+        # Collected markerless hits
+        self.defs_by_id: Dict[str, List[Dict[str, object]]] = {}
+        self.refs_by_id: Dict[str, List[Dict[str, object]]] = {}
+
+        # Per-system scoping
+        self.present_kinds_by_system: Dict[str, set[str]] = {}
+        self.refs_by_system_kind: Dict[str, Dict[str, List[Dict[str, object]]]] = {}
+        self.defs_by_system_kind: Dict[str, Dict[str, List[Dict[str, object]]]] = {}
+
+        # Constraints by artifact kind
+        self.constraints_by_artifact_kind: Dict[str, "ArtifactKindConstraints"] = {}
+        self.missing_constraints_kinds: set[str] = set()
+        self.all_constrained_id_kinds: set[str] = set()
+        self.spec_constrained_id_kinds: set[str] = set()
+
+        # Collect constraints and build global set of known ID kinds from constraints
+        for art in artifacts:
+            ak = str(art.template.kind)
+            c = getattr(art.template, "constraints", None)
+            if c is None:
+                self.missing_constraints_kinds.add(ak)
+                continue
+            self.constraints_by_artifact_kind[ak] = c
+            self.all_constrained_id_kinds.update(c.id_kind_names)
 
-    # Normalize registered_systems to lowercase for matching
-    systems_set: set[str] = set()
-    if registered_systems is not None:
-        systems_set = {str(s).lower() for s in registered_systems}
+        # Capture SPEC-only constrained kinds for composite SPEC IDs.
+        spec_c = self.constraints_by_artifact_kind.get("SPEC") or self.constraints_by_artifact_kind.get("spec")
+        if spec_c is not None:
+            self.spec_constrained_id_kinds.update(spec_c.id_kind_names)
 
-    def _match_system_from_id(cpt: str) -> Optional[str]:
+    def match_system_from_id(self, cpt: str) -> Optional[str]:
         """Match system slug using registered systems (longest prefix match)."""
         if not cpt.lower().startswith("cpt-"):
             return None
-        if not systems_set:
+        if not self.systems_set:
             # Fallback: best-effort second segment
             parts = cpt.split("-")
             return parts[1].lower() if len(parts) >= 3 else None
 
         matched: Optional[str] = None
-        for sys in systems_set:
+        for sys in self.systems_set:
             prefix = f"cpt-{sys}-"
             if cpt.lower().startswith(prefix):
                 if matched is None or len(sys) > len(matched):
                     matched = sys
         return matched
 
-    def _extract_kind_from_id(cpt: str, system: Optional[str]) -> Optional[str]:
+    def extract_kind_from_id(self, cpt: str, system: Optional[str]) -> Optional[str]:
         if not cpt.lower().startswith("cpt-"):
             return None
         if system is None:
@@ -1459,137 +1589,102 @@ def cross_validate_artifacts(
 
         # Composite IDs are only supported for SPEC-scoped nested kinds:
         # cpt-{system}-spec-{spec-slug}-{kind}-{slug}
-        if base == "spec" and spec_constrained_id_kinds:
+        if base == "spec" and self.spec_constrained_id_kinds:
             for p in reversed(parts[1:]):
                 pp = p.strip().lower()
-                if pp in spec_constrained_id_kinds and pp != "spec":
+                if pp in self.spec_constrained_id_kinds and pp != "spec":
                     return pp
 
         return base
 
-    # Collect constraints and build global set of known ID kinds from constraints
-    for art in artifacts:
-        ak = str(art.template.kind)
-        c = getattr(art.template, "constraints", None)
-        if c is None:
-            missing_constraints_kinds.add(ak)
-            continue
-        constraints_by_artifact_kind[ak] = c
-        for ic in getattr(c, "defined_id", []) or []:
-            try:
-                all_constrained_id_kinds.add(str(getattr(ic, "kind", "")).strip().lower())
-            except Exception:
-                pass
-
-    # Capture SPEC-only constrained kinds for composite SPEC IDs.
-    spec_c = constraints_by_artifact_kind.get("SPEC") or constraints_by_artifact_kind.get("spec")
-    if spec_c is not None:
-        for ic in getattr(spec_c, "defined_id", []) or []:
-            try:
-                spec_constrained_id_kinds.add(str(getattr(ic, "kind", "")).strip().lower())
-            except Exception:
-                pass
-
-    if missing_constraints_kinds:
-        errors.append(Template.error(
-            "constraints",
-            "Missing constraints for artifact kinds",
-            path=Path("<constraints.json>"),
-            line=1,
-            kinds=sorted(missing_constraints_kinds),
-        ))
-
-    # Build markerless indexes
-    headings_cache: Dict[str, List[List[str]]] = {}
-    for art in artifacts:
-        kind = str(art.template.kind)
-        hits = scan_cpt_ids_markerless(art.path)
-        hkey = str(art.path)
-        if hkey not in headings_cache:
-            headings_cache[hkey] = headings_by_line_markerless(art.path)
-        headings_at = headings_cache[hkey]
-
-        for h in hits:
-            hid = str(h.get("id", "")).strip()
-            if not hid:
-                continue
-            line = int(h.get("line", 1) or 1)
-            checked = bool(h.get("checked", False))
-            system = _match_system_from_id(hid)
-            id_kind = _extract_kind_from_id(hid, system)
-            active_headings = headings_at[line] if 0 <= line < len(headings_at) else []
-
-            row = {
-                "id": hid,
-                "line": line,
-                "checked": checked,
-                "priority": h.get("priority"),
-                "has_task": bool(h.get("has_task", False)),
-                "has_priority": bool(h.get("has_priority", False)),
-                "artifact_kind": kind,
-                "artifact_path": art.path,
-                "system": system,
-                "id_kind": id_kind,
-                "headings": active_headings,
-            }
-
-            if str(h.get("type")) == "definition":
-                defs_by_id.setdefault(hid, []).append(row)
-                if system:
-                    present_kinds_by_system.setdefault(system, set()).add(kind)
-                    defs_by_system_kind.setdefault(system, {}).setdefault(kind, []).append(row)
-            elif str(h.get("type")) == "reference":
-                refs_by_id.setdefault(hid, []).append(row)
-                if system:
-                    present_kinds_by_system.setdefault(system, set()).add(kind)
-                    refs_by_system_kind.setdefault(system, {}).setdefault(kind, []).append(row)
-
-    # Helper to check if a reference's system is registered
-    def _is_external_system_ref(cpt: str) -> bool:
+    def is_external_system_ref(self, cpt: str) -> bool:
         """Check if this ID references an external (non-registered) system.
 
         If no registered_systems provided, we cannot determine external refs,
         so treat all as internal (will error if no definition).
         """
-        if not systems_set:
+        if not self.systems_set:
             return False  # no systems known, can't distinguish external
         if not cpt.lower().startswith("cpt-"):
             return False
         # Try to find if any registered system matches as prefix
-        for sys in systems_set:
+        for sys in self.systems_set:
             prefix = f"cpt-{sys}-"
             if cpt.lower().startswith(prefix):
                 return False  # system is registered, not external
         return True  # no registered system matched → external
 
-    # Helper to extract kind from Cypilot ID (first segment after system)
-    def _extract_kind_from_id(cpt: str) -> Optional[str]:
-        """Extract the kind segment from an Cypilot ID."""
-        if not cpt.lower().startswith("cpt-"):
-            return None
-        # Find matching system (longest match)
-        matched_sys: Optional[str] = None
-        for sys in systems_set:
-            prefix = f"cpt-{sys}-"
-            if cpt.lower().startswith(prefix.lower()):
-                if matched_sys is None or len(sys) > len(matched_sys):
-                    matched_sys = sys
-        if matched_sys is None:
-            return None
-        prefix_len = len(f"cpt-{matched_sys}-")
-        remainder = cpt[prefix_len:]
-        if not remainder:
-            return None
-        return remainder.split("-", 1)[0].lower()
+    def build_ids(self, with_headings: bool) -> None:
+        """Build markerless definition/reference indexes (optionally with heading stacks)."""
+        from .document import headings_by_line_markerless, scan_cpt_ids_markerless
+
+        headings_cache: Dict[str, List[List[str]]] = {}
+        for art in self.artifacts:
+            kind = str(art.template.kind)
+            hits = scan_cpt_ids_markerless(art.path)
+            headings_at: List[List[str]] = []
+            if with_headings:
+                hkey = str(art.path)
+                if hkey not in headings_cache:
+                    headings_cache[hkey] = headings_by_line_markerless(art.path)
+                headings_at = headings_cache[hkey]
+
+            for h in hits:
+                hid = str(h.get("id", "")).strip()
+                if not hid:
+                    continue
+                line = int(h.get("line", 1) or 1)
+                checked = bool(h.get("checked", False))
+                system = self.match_system_from_id(hid)
+                id_kind = self.extract_kind_from_id(hid, system)
+                active_headings = headings_at[line] if 0 <= line < len(headings_at) else []
+
+                row = {
+                    "id": hid,
+                    "line": line,
+                    "checked": checked,
+                    "priority": h.get("priority"),
+                    "has_task": bool(h.get("has_task", False)),
+                    "has_priority": bool(h.get("has_priority", False)),
+                    "artifact_kind": kind,
+                    "artifact_path": art.path,
+                    "system": system,
+                    "id_kind": id_kind,
+                    "headings": active_headings,
+                }
+
+                if str(h.get("type")) == "definition":
+                    self.defs_by_id.setdefault(hid, []).append(row)
+                    if system:
+                        self.present_kinds_by_system.setdefault(system, set()).add(kind)
+                        self.defs_by_system_kind.setdefault(system, {}).setdefault(kind, []).append(row)
+                elif str(h.get("type")) == "reference":
+                    self.refs_by_id.setdefault(hid, []).append(row)
+                    if system:
+                        self.present_kinds_by_system.setdefault(system, set()).add(kind)
+                        self.refs_by_system_kind.setdefault(system, {}).setdefault(kind, []).append(row)
+
+
+def _rule_constraints_present(ix: _CrossIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    if ix.missing_constraints_kinds:
+        errors.append(Template.error(
+            "constraints",
+            "Missing constraints for artifact kinds",
+            path=Path("<constraints.json>"),
+            line=1,
+            kinds=sorted(ix.missing_constraints_kinds),
+        ))
+
 
-    # Validate ID kinds against constraints (authoritative) and known_kinds (secondary)
-    for did, rows in defs_by_id.items():
+def _rule_id_kinds(ix: _CrossIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    """Validate ID kinds against constraints (authoritative) and known_kinds (secondary)."""
+    for did, rows in ix.defs_by_id.items():
         for r in rows:
             sys = r.get("system")
             if sys is None:
                 continue
             k = r.get("id_kind")
-            if k and all_constrained_id_kinds and str(k).lower() not in all_constrained_id_kinds:
+            if k and ix.all_constrained_id_kinds and str(k).lower() not in ix.all_constrained_id_kinds:
                 errors.append(Template.error(
                     "constraints",
                     "ID uses kind not defined in constraints",
@@ -1599,13 +1694,13 @@ def cross_validate_artifacts(
                     unknown_kind=k,
                 ))
 
-    for rid, rows in refs_by_id.items():
+    for rid, rows in ix.refs_by_id.items():
         for r in rows:
             sys = r.get("system")
             if sys is None:
                 continue
             k = r.get("id_kind")
-            if k and all_constrained_id_kinds and str(k).lower() not in all_constrained_id_kinds:
+            if k and ix.all_constrained_id_kinds and str(k).lower() not in ix.all_constrained_id_kinds:
                 errors.append(Template.error(
                     "constraints",
                     "Reference uses kind not defined in constraints",
@@ -1615,11 +1710,11 @@ def cross_validate_artifacts(
                     unknown_kind=k,
                 ))
 
-    if kinds_set:
-        for did, rows in defs_by_id.items():
+    if ix.kinds_set:
+        for did, rows in ix.defs_by_id.items():
             for r in rows:
                 k = r.get("id_kind")
-                if k and str(k).lower() not in kinds_set:
+                if k and str(k).lower() not in ix.kinds_set:
                     warnings.append(Template.error(
                         "structure",
                         f"ID uses unknown kind '{k}'",
@@ -1629,10 +1724,12 @@ def cross_validate_artifacts(
                         unknown_kind=k,
                     ))
 
-    # refs must have definitions (but only error if system is registered)
-    for rid, rows in refs_by_id.items():
-        if rid not in defs_by_id:
-            if _is_external_system_ref(rid):
+
+def _rule_ref_definitions(ix: _CrossIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    """References must have definitions (but only error if system is registered)."""
+    for rid, rows in ix.refs_by_id.items():
+        if rid not in ix.defs_by_id:
+            if ix.is_external_system_ref(rid):
                 continue
             for r in rows:
                 errors.append(Template.error(
@@ -1643,15 +1740,19 @@ def cross_validate_artifacts(
                     id=rid,
                 ))
 
-    # checked ref implies checked def
-    # Only enforce when both sides explicitly track task status.
-    for rid, rows in refs_by_id.items():
+
+def _rule_ref_task_status(ix: _CrossIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    """Checked reference implies checked definition.
+
+    Only enforced when both sides explicitly track task status.
+    """
+    for rid, rows in ix.refs_by_id.items():
         for r in rows:
             if not bool(r.get("checked", False)):
                 continue
             if not bool(r.get("has_task", False)):
                 continue
-            defs = defs_by_id.get(rid, [])
+            defs = ix.defs_by_id.get(rid, [])
             for d in defs:
                 if not bool(d.get("has_task", False)):
                     continue
@@ -1665,20 +1766,26 @@ def cross_validate_artifacts(
                     id=rid,
                 ))
 
-    # Constraints: per-artifact kind strict definition requirements and headings scoping.
-    for art in artifacts:
+
+def _rule_defined_id_constraints(ix: _CrossIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    """Per-artifact kind strict definition requirements and headings scoping."""
+    defs_by_path: Dict[str, List[Dict[str, object]]] = {}
+    for rows in ix.defs_by_id.values():
+        for r in rows:
+            if r.get("system") is not None:
+                defs_by_path.setdefault(str(r.get("artifact_path")), []).append(r)
+
+    for art in ix.artifacts:
         ak = str(art.template.kind)
-        c = constraints_by_artifact_kind.get(ak)
+        c = ix.constraints_by_artifact_kind.get(ak)
         if c is None:
             continue
 
-        allowed_kinds = {str(getattr(ic, "kind", "")).strip().lower() for ic in getattr(c, "defined_id", []) or []}
-        defs_in_file = [r for r in defs_by_id.values() for r in r if str(r.get("artifact_path")) == str(art.path) and r.get("system") is not None]
-        seen_kinds: set[str] = set()
+        allowed_kinds = c.id_kind_names
+        defs_in_file = defs_by_path.get(str(art.path), [])
         for d in defs_in_file:
             k = str(d.get("id_kind") or "").lower()
             if k:
-                seen_kinds.add(k)
                 if allowed_kinds and k not in allowed_kinds:
                     errors.append(Template.error(
                         "constraints",
@@ -1690,14 +1797,13 @@ def cross_validate_artifacts(
                         id=str(d.get("id")),
                     ))
 
-        for ic in getattr(c, "defined_id", []) or []:
-            k = str(getattr(ic, "kind", "")).strip().lower()
+        for ik in c.id_kinds:
+            k = ik.kind
 
             # Required presence: every constrained kind must appear at least once,
             # unless explicitly marked as required=false.
-            is_required = bool(getattr(ic, "required", True))
             defs_of_kind = [d for d in defs_in_file if str(d.get("id_kind") or "").lower() == k]
-            if is_required and k and not defs_of_kind:
+            if ik.required and k and not defs_of_kind:
                 errors.append(Template.error(
                     "constraints",
                     "Required ID kind missing in artifact",
@@ -1709,18 +1815,12 @@ def cross_validate_artifacts(
                 continue
 
             # heading scope for definitions
-            allowed_headings = set([h.strip() for h in (getattr(ic, "headings", None) or []) if isinstance(h, str) and h.strip()])
+            allowed_headings = ik.headings
             if not allowed_headings:
                 continue
-            if not defs_of_kind:
-                continue
-            ok_any = False
             for d in defs_of_kind:
                 active = d.get("headings") or []
-                ok = any(h in allowed_headings for h in active)
-                if ok:
-                    ok_any = True
-                else:
+                if not any(h in allowed_headings for h in active):
                     errors.append(Template.error(
                         "constraints",
                         "ID definition not under required headings",
@@ -1733,169 +1833,213 @@ def cross_validate_artifacts(
                         found_headings=active,
                     ))
 
-    # Constraints: reference coverage rules (required|optional|prohibited)
-    for ak, c in constraints_by_artifact_kind.items():
-        for ic in getattr(c, "defined_id", []) or []:
-            id_kind = str(getattr(ic, "kind", "")).strip().lower()
-            refs_rules = getattr(ic, "references", None) or {}
-            if not isinstance(refs_rules, dict):
-                continue
 
-            # Iterate definitions of this kind
-            for did, rows in defs_by_id.items():
-                for drow in rows:
-                    if str(drow.get("artifact_kind")) != ak:
-                        continue
-                    if str(drow.get("id_kind") or "").lower() != id_kind:
-                        continue
-                    system = drow.get("system")
-                    if system is None:
-                        continue
+def _rule_reference_coverage(ix: _CrossIndex, errors: List[Dict[str, object]], warnings: List[Dict[str, object]]) -> None:
+    """Reference coverage rules (required|optional|prohibited)."""
+    # Definitions grouped by (artifact kind, ID kind), in defs_by_id order.
+    defs_by_kinds: Dict[Tuple[str, str], List[Tuple[str, Dict[str, object]]]] = {}
+    for did, rows in ix.defs_by_id.items():
+        for drow in rows:
+            if drow.get("system") is None:
+                continue
+            key = (str(drow.get("artifact_kind")), str(drow.get("id_kind") or "").lower())
+            defs_by_kinds.setdefault(key, []).append((did, drow))
 
-                    system_present_kinds = present_kinds_by_system.get(system, set())
-                    system_refs_by_kind = refs_by_system_kind.get(system, {})
+    for ak, c in ix.constraints_by_artifact_kind.items():
+        for ik in c.id_kinds:
+            if not ik.references:
+                continue
 
-                    for target_kind, rule in refs_rules.items():
-                        tk = str(target_kind).strip().upper()
-                        cov = str(getattr(rule, "coverage", "optional")).strip().lower()
-                        task_rule = str(getattr(rule, "task", "allowed") or "allowed").strip().lower()
-                        prio_rule = str(getattr(rule, "priority", "allowed") or "allowed").strip().lower()
-                        allowed_headings = set([h.strip() for h in (getattr(rule, "headings", None) or []) if isinstance(h, str) and h.strip()])
+            # Iterate definitions of this kind
+            for did, drow in defs_by_kinds.get((ak, ik.kind), []):
+                system = drow.get("system")
+                system_present_kinds = ix.present_kinds_by_system.get(system, set())
+                system_refs_by_kind = ix.refs_by_system_kind.get(system, {})
+
+                for rule in ik.references:
+                    tk = rule.target_kind
+                    cov = rule.coverage
+                    task_rule = rule.task
+                    prio_rule = rule.priority
+                    allowed_headings = rule.headings
+
+                    refs_in_kind = [r for r in system_refs_by_kind.get(tk, []) if str(r.get("id")) == did]
+
+                    if cov == "required":
+                        if tk not in system_present_kinds:
+                            warnings.append(Template.error(
+                                "constraints",
+                                "Required reference target kind not in scope",
+                                path=drow.get("artifact_path"),
+                                line=int(drow.get("line", 1) or 1),
+                                id=did,
+                                artifact_kind=ak,
+                                target_kind=tk,
+                            ))
+                            continue
+                        if not refs_in_kind:
+                            errors.append(Template.error(
+                                "constraints",
+                                "ID not referenced from required artifact kind",
+                                path=drow.get("artifact_path"),
+                                line=int(drow.get("line", 1) or 1),
+                                id=did,
+                                artifact_kind=ak,
+                                target_kind=tk,
+                            ))
+                            continue
 
-                        refs_in_kind = [r for r in system_refs_by_kind.get(tk, []) if str(r.get("id")) == did]
+                    if cov == "prohibited" and refs_in_kind:
+                        first = refs_in_kind[0]
+                        errors.append(Template.error(
+                            "constraints",
+                            "ID referenced from prohibited artifact kind",
+                            path=first.get("artifact_path"),
+                            line=int(first.get("line", 1) or 1),
+                            id=did,
+                            artifact_kind=ak,
+                            target_kind=tk,
+                        ))
+                        continue
 
-                        if cov == "required":
-                            if tk not in system_present_kinds:
-                                warnings.append(Template.error(
+                    if refs_in_kind:
+                        if task_rule == "required":
+                            for rr in refs_in_kind:
+                                if bool(rr.get("has_task", False)):
+                                    continue
+                                errors.append(Template.error(
                                     "constraints",
-                                    "Required reference target kind not in scope",
-                                    path=drow.get("artifact_path"),
-                                    line=int(drow.get("line", 1) or 1),
+                                    "ID reference missing required task checkbox",
+                                    path=rr.get("artifact_path"),
+                                    line=int(rr.get("line", 1) or 1),
                                     id=did,
                                     artifact_kind=ak,
                                     target_kind=tk,
                                 ))
-                                continue
-                            if not refs_in_kind:
+                                break
+                        elif task_rule == "prohibited":
+                            for rr in refs_in_kind:
+                                if not bool(rr.get("has_task", False)):
+                                    continue
                                 errors.append(Template.error(
                                     "constraints",
-                                    "ID not referenced from required artifact kind",
-                                    path=drow.get("artifact_path"),
-                                    line=int(drow.get("line", 1) or 1),
+                                    "ID reference has prohibited task checkbox",
+                                    path=rr.get("artifact_path"),
+                                    line=int(rr.get("line", 1) or 1),
                                     id=did,
                                     artifact_kind=ak,
                                     target_kind=tk,
                                 ))
-                                continue
+                                break
 
-                        if cov == "prohibited" and refs_in_kind:
-                            first = refs_in_kind[0]
-                            errors.append(Template.error(
-                                "constraints",
-                                "ID referenced from prohibited artifact kind",
-                                path=first.get("artifact_path"),
-                                line=int(first.get("line", 1) or 1),
-                                id=did,
-                                artifact_kind=ak,
-                                target_kind=tk,
-                            ))
-                            continue
-
-                        if refs_in_kind:
-                            if task_rule == "required":
-                                for rr in refs_in_kind:
-                                    if bool(rr.get("has_task", False)):
-                                        continue
-                                    errors.append(Template.error(
-                                        "constraints",
-                                        "ID reference missing required task checkbox",
-                                        path=rr.get("artifact_path"),
-                                        line=int(rr.get("line", 1) or 1),
-                                        id=did,
-                                        artifact_kind=ak,
-                                        target_kind=tk,
-                                    ))
-                                    break
-                            elif task_rule == "prohibited":
-                                for rr in refs_in_kind:
-                                    if not bool(rr.get("has_task", False)):
-                                        continue
-                                    errors.append(Template.error(
-                                        "constraints",
-                                        "ID reference has prohibited task checkbox",
-                                        path=rr.get("artifact_path"),
-                                        line=int(rr.get("line", 1) or 1),
-                                        id=did,
-                                        artifact_kind=ak,
-                                        target_kind=tk,
-                                    ))
-                                    break
-
-                            if prio_rule == "required":
-                                for rr in refs_in_kind:
-                                    if bool(rr.get("has_priority", False)):
-                                        continue
-                                    errors.append(Template.error(
-                                        "constraints",
-                                        "ID reference missing required priority",
-                                        path=rr.get("artifact_path"),
-                                        line=int(rr.get("line", 1) or 1),
-                                        id=did,
-                                        artifact_kind=ak,
-                                        target_kind=tk,
-                                    ))
-                                    break
-                            elif prio_rule == "prohibited":
-                                for rr in refs_in_kind:
-                                    if not bool(rr.get("has_priority", False)):
-                                        continue
-                                    errors.append(Template.error(
-                                        "constraints",
-                                        "ID reference has prohibited priority",
-                                        path=rr.get("artifact_path"),
-                                        line=int(rr.get("line", 1) or 1),
-                                        id=did,
-                                        artifact_kind=ak,
-                                        target_kind=tk,
-                                    ))
-                                    break
-
-                        if allowed_headings and refs_in_kind:
-                            ok_any = False
+                        if prio_rule == "required":
+                            for rr in refs_in_kind:
+                                if bool(rr.get("has_priority", False)):
+                                    continue
+                                errors.append(Template.error(
+                                    "constraints",
+                                    "ID reference missing required priority",
+                                    path=rr.get("artifact_path"),
+                                    line=int(rr.get("line", 1) or 1),
+                                    id=did,
+                                    artifact_kind=ak,
+                                    target_kind=tk,
+                                ))
+                                break
+                        elif prio_rule == "prohibited":
                             for rr in refs_in_kind:
-                                active = rr.get("headings") or []
-                                ok = any(h in allowed_headings for h in active)
-                                if ok:
-                                    ok_any = True
-                                else:
-                                    errors.append(Template.error(
-                                        "constraints",
-                                        "ID reference not under required headings",
-                                        path=rr.get("artifact_path"),
-                                        line=int(rr.get("line", 1) or 1),
-                                        id=did,
-                                        artifact_kind=ak,
-                                        target_kind=tk,
-                                        headings=sorted(allowed_headings),
-                                        found_headings=active,
-                                    ))
-                            if cov == "required" and not ok_any:
+                                if not bool(rr.get("has_priority", False)):
+                                    continue
                                 errors.append(Template.error(
                                     "constraints",
-                                    "Required headings contain no ID references",
-                                    path=drow.get("artifact_path"),
-                                    line=int(drow.get("line", 1) or 1),
+                                    "ID reference has prohibited priority",
+                                    path=rr.get("artifact_path"),
+                                    line=int(rr.get("line", 1) or 1),
+                                    id=did,
+                                    artifact_kind=ak,
+                                    target_kind=tk,
+                                ))
+                                break
+
+                    if allowed_headings and refs_in_kind:
+                        ok_any = False
+                        for rr in refs_in_kind:
+                            active = rr.get("headings") or []
+                            ok = any(h in allowed_headings for h in active)
+                            if ok:
+                                ok_any = True
+                            else:
+                                errors.append(Template.error(
+                                    "constraints",
+                                    "ID reference not under required headings",
+                                    path=rr.get("artifact_path"),
+                                    line=int(rr.get("line", 1) or 1),
                                     id=did,
                                     artifact_kind=ak,
                                     target_kind=tk,
                                     headings=sorted(allowed_headings),
+                                    found_headings=active,
                                 ))
+                        if cov == "required" and not ok_any:
+                            errors.append(Template.error(
+                                "constraints",
+                                "Required headings contain no ID references",
+                                path=drow.get("artifact_path"),
+                                line=int(drow.get("line", 1) or 1),
+                                id=did,
+                                artifact_kind=ak,
+                                target_kind=tk,
+                                headings=sorted(allowed_headings),
+                            ))
 
     # Note: References decide their own has= attributes (task, priority).
     # A reference without has="task" is valid even if the definition has it.
     # This allows flexible cross-artifact references where downstream artifacts
     # may not need to track task status for upstream IDs.
 
+
+_CROSS_RULES = {
+    "constraints-present": _rule_constraints_present,
+    "id-kinds": _rule_id_kinds,
+    "ref-definitions": _rule_ref_definitions,
+    "ref-task-status": _rule_ref_task_status,
+    "defined-id-constraints": _rule_defined_id_constraints,
+    "reference-coverage": _rule_reference_coverage,
+}
+
+
+def cross_validate_artifacts(
+    artifacts: Sequence[Artifact],
+    registered_systems: Optional[Iterable[str]] = None,
+    known_kinds: Optional[Iterable[str]] = None,
+    rules: Optional[Iterable[str]] = None,
+) -> Dict[str, List[Dict[str, object]]]:
+    """Cross-artifact validation (markerless-first).
+
+    The validator intentionally ignores template markers and performs a markerless
+    scan of all artifacts (even if markers are present). This yields a stable set of
+    ID definitions and references.
+
+    Primary rules are derived from `constraints.json` attached to templates.
+    `rules` limits the run to the named cross-scope passes (see `rules.RULE_PASSES`);
+    the shared index is built only to the extent the selected passes need it.
+    """
+    from .rules import NEED_HEADINGS, NEED_IDS, needs_of, rule_names
+
+    names = rule_names("cross")
+    if rules is not None:
+        chosen = set(rules)
+        names = [n for n in names if n in chosen]
+    needs = needs_of(names)
+
+    ix = _CrossIndex(artifacts, registered_systems, known_kinds)
+    if NEED_IDS in needs:
+        ix.build_ids(with_headings=NEED_HEADINGS in needs)
+
+    errors: List[Dict[str, object]] = []
+    warnings: List[Dict[str, object]] = []
+    for name in names:
+        _CROSS_RULES[name](ix, errors, warnings)
     return {"errors": errors, "warnings": warnings}
 
 
@@ -2046,6 +2190,7 @@ def validate_artifact_file_against_template(
 
 __all__ = [
     "Template",
+    "CompiledTemplate",
     "Artifact",
     "ParsedCypilotId",
     "apply_kind_constraints",
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Fake `gh` – replay gh CLI responses recorded by pr.py.
+
+Lets pr.py run without network (benchmarks, regression tests):
+
+    # 1. Record: every gh call is snapshotted into DIR
+    python3 pr.py status ALL --record DIR
+
+    # 2. Replay: PR_GH replaces the gh command
+    PR_GH="python3 fake_gh.py --fixtures DIR --latency 0.2" \\
+        python3 pr.py status ALL
+
+Each fixture is one JSON file ({args, stdout, stderr, returncode})
+named after a digest of the gh arguments. A call with no fixture
+fails like gh would (exit 1). Options may also be given as
+FAKE_GH_FIXTURES / FAKE_GH_LATENCY environment variables.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+
+def fixture_path(fixtures_dir, args):
+    """Return the fixture file for a gh call (args without `gh`)."""
+    key = hashlib.sha256(
+        json.dumps(list(args)).encode("utf-8"),
+    ).hexdigest()[:20]
+    return os.path.join(fixtures_dir, f"{key}.json")
+
+
+def record(fixtures_dir, args, result):
+    """Snapshot a completed gh call (a CompletedProcess) as a fixture."""
+    os.makedirs(fixtures_dir, exist_ok=True)
+    path = fixture_path(fixtures_dir, args)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({
+            "args": list(args),
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "returncode": result.returncode,
+        }, f, indent=2)
+    os.replace(tmp, path)
+
+
+def record_file(fixtures_dir, args, stdout_path, stderr, returncode):
+    """Snapshot a gh call whose stdout was streamed to stdout_path.
+
+    The file is JSON-escaped in chunks, so a large diff is never held
+    in memory as a whole.
+    """
+    os.makedirs(fixtures_dir, exist_ok=True)
+    path = fixture_path(fixtures_dir, args)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f, open(
+        stdout_path, encoding="utf-8", errors="replace", newline="",
+    ) as src:
+        f.write('{"args": ' + json.dumps(list(args)) + ', "stdout": "')
+        for chunk in iter(lambda: src.read(1 << 16), ""):
+            f.write(json.dumps(chunk)[1:-1])
+        f.write('", "stderr": ' + json.dumps(stderr))
+        f.write(', "returncode": ' + json.dumps(returncode) + "}\n")
+    os.replace(tmp, path)
+
+
+def _pop_options(args):
+    """Strip leading `--fixtures DIR` / `--latency SECONDS` from args."""
+    options = {
+        "fixtures": os.environ.get("FAKE_GH_FIXTURES", "."),
+        "latency": float(os.environ.get("FAKE_GH_LATENCY", 0) or 0),
+    }
+    while len(args) >= 2 and args[0] in ("--fixtures", "--latency"):
+        name = args[0][2:]
+        options[name] = (
+            float(args[1]) if name == "latency" else args[1]
+        )
+        args = args[2:]
+    return args, options
+
+
+def main():
+    args, opts = _pop_options(sys.argv[1:])
+    if opts["latency"] > 0:
+        time.sleep(opts["latency"])
+    path = fixture_path(opts["fixtures"], args)
+    if not os.path.exists(path):
+        print(
+            "fake gh: no fixture for: gh " + " ".join(args)[:200],
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    with open(path) as f:
+        fx = json.load(f)
+    sys.stdout.write(fx.get("stdout") or "")
+    sys.stderr.write(fx.get("stderr") or "")
+    sys.exit(fx.get("returncode", 0))
+
+
+if __name__ == "__main__":
+    main()
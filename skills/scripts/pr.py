@@ -8,11 +8,19 @@ All review is done in read-only mode: the script downloads diffs and
 metadata from GitHub but never modifies the local working tree.
 """
 
+import contextlib
+import functools
+import hashlib
 import json
+import mmap
 import os
 import re
+import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 
 def _find_project_root():
@@ -97,10 +105,28 @@ TEMPLATES_DIR = os.path.join(
 )
 # Local config path (exclude list, etc.)
 CONFIG_PATH = os.path.join(PRS_DIR, "config.yaml")
+# Max concurrent gh calls (overridable in pr-review.json or via --jobs)
+DEFAULT_JOBS = int(_PR_CFG.get("fetchJobs", 8))
+# "rest" (per-PR gh calls) or "graphql" (batched; also via --graphql)
+FETCH_MODE = _PR_CFG.get("fetchMode", "rest")
+# PRs per batched GraphQL request
+GRAPHQL_BATCH = int(_PR_CFG.get("graphqlBatch", 10))
+
+
+# gh command; PR_GH swaps it, e.g. for the fake_gh.py fixture replayer
+GH = shlex.split(os.environ.get("PR_GH", "")) or ["gh"]
+# Snapshot every gh response into this directory (also via --record DIR)
+RECORD_DIR = os.environ.get("PR_GH_RECORD") or None
 
 
 def _run(cmd, **kwargs):
+    gh_args = cmd[1:] if cmd[0] == "gh" else None
+    if gh_args is not None:
+        cmd = GH + gh_args
     result = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, **kwargs)
+    if gh_args is not None and RECORD_DIR:
+        from fake_gh import record
+        record(RECORD_DIR, gh_args, result)
     if result.returncode != 0 and kwargs.get("check", False):
         print(result.stderr, file=sys.stderr)
         sys.exit(result.returncode)
@@ -137,7 +163,8 @@ def _list_open_prs():
     """Return list of open PR numbers via gh CLI."""
     result = _run([
         "gh", "pr", "list",
-        "--json", "number,title,author,state,url",
+        "--json",
+        "number,title,author,state,url,updatedAt,headRefOid",
         "--limit", "100",
     ])
     if result.returncode != 0:
@@ -149,8 +176,9 @@ def _list_open_prs():
     return json.loads(result.stdout)
 
 
+@functools.lru_cache(maxsize=None)
 def _owner_repo():
-    """Return (owner, repo) from gh CLI."""
+    """Return (owner, repo) from gh CLI (resolved once per run)."""
     r = _run([
         "gh", "repo", "view",
         "--json", "nameWithOwner",
@@ -166,7 +194,7 @@ _META_FIELDS = ",".join([
     "title", "body", "files", "comments",
     "reviews", "labels", "author", "state",
     "baseRefName", "headRefName",
-    "url", "createdAt", "updatedAt",
+    "url", "createdAt", "updatedAt", "headRefOid",
     "reviewRequests", "statusCheckRollup",
     "mergeStateStatus", "reviewDecision",
 ])
@@ -184,6 +212,132 @@ _REVIEW_THREADS_QUERY = (
 )
 
 
+# Batched mode: one aliased pullRequest(number:) field per PR. The
+# connections in _BATCH_PAGED are paginated by cursor (page queries).
+_BATCH_PR_FIELDS = (
+    "title body url state createdAt updatedAt headRefOid "
+    "baseRefName headRefName mergeStateStatus reviewDecision "
+    "author{login} "
+    "labels(first:100){nodes{name color description}} "
+    "files(first:100){nodes{path additions deletions}} "
+    "reviews(first:100){nodes{author{login}state submittedAt}} "
+    "reviewRequests(first:100){nodes{requestedReviewer{"
+    "__typename ...on User{login}...on Team{name slug}}}} "
+    "commits(last:1){nodes{commit{statusCheckRollup{"
+    "contexts(first:100){nodes{__typename "
+    "...on CheckRun{name status conclusion}"
+    "...on StatusContext{context state}}}}}}} "
+)
+_BATCH_PAGED = {
+    "comments": (
+        "comments(first:100{after}){{"
+        "pageInfo{{hasNextPage endCursor}}"
+        "nodes{{id author{{login}}body createdAt url}}}}"
+    ),
+    "reviewThreads": (
+        "reviewThreads(first:100{after}){{"
+        "pageInfo{{hasNextPage endCursor}}"
+        "nodes{{id isResolved isOutdated path line startLine "
+        "comments(first:100){{nodes{{"
+        "id author{{login}}body createdAt url diffHunk"
+        "}}}}}}}}"
+    ),
+}
+
+
+def _paged(connection, cursor=None):
+    after = f",after:{json.dumps(cursor)}" if cursor else ""
+    return _BATCH_PAGED[connection].format(after=after)
+
+
+def _graphql_query(fields):
+    return (
+        "query($owner:String!,$repo:String!){"
+        "repository(owner:$owner,name:$repo){"
+        + "".join(fields)
+        + "}}"
+    )
+
+
+def _build_batch_query(pr_numbers):
+    """Return a GraphQL query fetching several PRs (aliased `pr<N>`)."""
+    paged = "".join(_paged(c) for c in _BATCH_PAGED)
+    return _graphql_query(
+        f"pr{int(n)}:pullRequest(number:{int(n)}){{"
+        f"{_BATCH_PR_FIELDS}{paged}}}"
+        for n in pr_numbers
+    )
+
+
+def _build_page_query(pages):
+    """Return a GraphQL query for the next page of PR connections.
+
+    `pages` is a list of (PR number, connection, cursor); result i is
+    aliased `p<i>`.
+    """
+    return _graphql_query(
+        f"p{i}:pullRequest(number:{int(n)}){{"
+        f"{_paged(conn, cursor)}}}"
+        for i, (n, conn, cursor) in enumerate(pages)
+    )
+
+
+def _nodes(conn):
+    return list((conn or {}).get("nodes") or [])
+
+
+def _meta_from_graphql(node):
+    """Convert a batched pullRequest node to `gh pr view --json` form."""
+    meta = {
+        k: node.get(k)
+        for k in (
+            "title", "body", "url", "state",
+            "createdAt", "updatedAt", "headRefOid",
+            "baseRefName", "headRefName",
+            "mergeStateStatus", "reviewDecision",
+        )
+    }
+    meta["author"] = node.get("author") or {"login": "ghost"}
+    meta["labels"] = _nodes(node.get("labels"))
+    meta["files"] = _nodes(node.get("files"))
+    meta["comments"] = _nodes(node.get("comments"))
+    meta["reviews"] = _nodes(node.get("reviews"))
+    meta["reviewRequests"] = [
+        rr.get("requestedReviewer") or {}
+        for rr in _nodes(node.get("reviewRequests"))
+    ]
+    checks = []
+    for commit in _nodes(node.get("commits")):
+        rollup = (commit.get("commit") or {}).get("statusCheckRollup")
+        checks.extend(_nodes((rollup or {}).get("contexts")))
+    meta["statusCheckRollup"] = checks
+    return meta
+
+
+def _threads_from_graphql(node):
+    """Return review_threads.json content for a batched pullRequest node."""
+    return {"data": {"repository": {"pullRequest": {
+        "reviewThreads": {"nodes": _nodes(node.get("reviewThreads"))},
+    }}}}
+
+
+def _review_comments_from_graphql(node):
+    """Return REST-shaped review comments (html_url, diff_hunk) of a node."""
+    out = []
+    for t in _nodes(node.get("reviewThreads")):
+        for c in _nodes(t.get("comments")):
+            out.append({
+                "id": c.get("id"),
+                "html_url": c.get("url", ""),
+                "diff_hunk": c.get("diffHunk", ""),
+                "path": t.get("path"),
+                "user": c.get("author") or {},
+                "body": c.get("body", ""),
+                "created_at": c.get("createdAt", ""),
+            })
+    return out
+
+
 _PR_NUMBER_RE = re.compile(r"^\d+$")
 
 
@@ -212,118 +366,543 @@ def _validate_pr_number(pr_number: str) -> str:
     return pr_dir
 
 
-def fetch(pr_number: str):
-    pr_dir = _validate_pr_number(pr_number)
-    os.makedirs(pr_dir, exist_ok=True)
+# Per-PR fetch state: the PR version the cached diff/comments/threads
+# belong to, and the digest of the inputs of the last status report.
+_FETCH_STATE = "fetch_state.json"
+_CACHED_OUTPUTS = (
+    "diff.patch", "review_comments.json", "review_threads.json",
+)
 
-    # 1. PR metadata (expanded fields)
-    meta = _run([
-        "gh", "pr", "view", pr_number,
-        "--json", _META_FIELDS,
-    ])
-    if meta.returncode != 0:
-        print(
-            f"Failed to fetch PR #{pr_number}: "
-            f"{meta.stderr}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
 
-    meta_path = os.path.join(pr_dir, "meta.json")
-    with open(meta_path, "w") as f:
+def _load_fetch_state(pr_dir):
+    path = os.path.join(pr_dir, _FETCH_STATE)
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_fetch_state(pr_dir, **updates):
+    state = _load_fetch_state(pr_dir)
+    state.update(updates)
+    with open(os.path.join(pr_dir, _FETCH_STATE), "w") as f:
+        json.dump(state, f, indent=2)
+        f.write("\n")
+
+
+def _pr_version(data):
+    """Return [updatedAt, headRefOid] of a PR listing/metadata entry."""
+    return [data.get("updatedAt"), data.get("headRefOid")]
+
+
+def _cached_version(pr_dir):
+    """Return the PR version the cached outputs were fetched at, if complete."""
+    for name in _CACHED_OUTPUTS:
+        if not os.path.exists(os.path.join(pr_dir, name)):
+            return None
+    return _load_fetch_state(pr_dir).get("version")
+
+
+def _fetch_commands(pr_number, owner, repo):
+    """Return the gh commands that fetch one PR, by output."""
+    cmds = {
+        # 1. PR metadata (expanded fields)
+        "meta": [
+            "gh", "pr", "view", pr_number,
+            "--json", _META_FIELDS,
+        ],
+        # 2. Diff
+        "diff": ["gh", "pr", "diff", pr_number],
+        # 3. Review comments (REST — keeps diff_hunk etc.)
+        "comments": [
+            "gh", "api",
+            f"repos/{{owner}}/{{repo}}/pulls/"
+            f"{pr_number}/comments",
+            "--paginate",
+        ],
+    }
+    # 4. Review threads via GraphQL (isResolved)
+    if owner and repo:
+        cmds["threads"] = [
+            "gh", "api", "graphql",
+            "-f", f"query={_REVIEW_THREADS_QUERY}",
+            "-F", f"n={pr_number}",
+            "-f", f"owner={owner}",
+            "-f", f"repo={repo}",
+        ]
+    return cmds
+
+
+def _start_fetch(pool, pr_number, owner, repo, listed=None, force=False):
+    """Submit one PR's gh calls to the pool; return futures by output.
+
+    If the cached diff/comments/threads match the listed PR version (or
+    no listing is available), only the metadata is requested up front;
+    _finish_fetch() requests the rest if the metadata shows a change.
+    """
+    pr_dir = _validate_pr_number(pr_number)
+    cmds = _fetch_commands(pr_number, owner, repo)
+    cached = None if force else _cached_version(pr_dir)
+    if cached is not None and listed in (None, cached):
+        cmds = {"meta": cmds["meta"]}
+    return {
+        name: _submit(pool, name, cmd, pr_dir)
+        for name, cmd in cmds.items()
+    }
+
+
+def _save_json(pr_dir, name, data, label):
+    path = os.path.join(pr_dir, name)
+    with open(path, "w") as f:
         json.dump(
-            json.loads(meta.stdout), f,
+            data, f,
             indent=2, ensure_ascii=False,
         )
         f.write("\n")
     print(
-        f"  Saved metadata → "
-        f"{os.path.relpath(meta_path, ROOT)}"
+        f"  Saved {label} → "
+        f"{os.path.relpath(path, ROOT)}"
+    )
+
+
+# diff.patch sidecar: per-file byte ranges and hunk ranges, so status
+# rendering reads only the hunks it needs (see _diff_hunk_lookup).
+_DIFF_INDEX = "diff_index.json"
+_HUNK_RE = re.compile(rb"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def _write_indexed_diff(lines, path):
+    """Write diff lines (bytes) to path; return its offset index.
+
+    The index maps each file path to {"start", "end", "hunks"}, where
+    each hunk is [start, end, new_start, new_count] (byte offsets into
+    the diff, line numbers on the new side).
+    """
+    files = {}
+    cur = hunk = None
+    offset = 0
+    with open(path, "wb") as f:
+        for line in lines:
+            if line.startswith(b"diff --git "):
+                name = line.rstrip(b"\r\n").rsplit(b" b/", 1)[-1]
+                cur = {"start": offset, "end": offset, "hunks": []}
+                files[name.decode("utf-8", "replace")] = cur
+                hunk = None
+            elif cur is not None:
+                m = _HUNK_RE.match(line)
+                if m:
+                    hunk = [
+                        offset, offset,
+                        int(m.group(1)), int(m.group(2) or 1),
+                    ]
+                    cur["hunks"].append(hunk)
+            f.write(line)
+            offset += len(line)
+            if cur is not None:
+                cur["end"] = offset
+            if hunk is not None:
+                hunk[1] = offset
+    return files
+
+
+def _gh_stream(gh_args, pr_dir, lines_of=None):
+    """Run gh, streaming its stdout into <pr_dir>/diff.patch.part.
+
+    `lines_of` turns stdout lines into diff lines (default: as is).
+    The offset index goes to diff.patch.part.index; _save_diff() moves
+    both into place. With --record, gh's raw stdout is snapshotted as
+    well. Returns the CompletedProcess (stdout not kept).
+    """
+    os.makedirs(pr_dir, exist_ok=True)
+    part = os.path.join(pr_dir, "diff.patch.part")
+    raw = part + ".raw" if RECORD_DIR else None
+    with tempfile.TemporaryFile() as err, (
+        open(raw, "wb") if raw else contextlib.nullcontext()
+    ) as tee:
+        proc = subprocess.Popen(
+            GH + gh_args, stdout=subprocess.PIPE, stderr=err, cwd=ROOT,
+        )
+        with proc.stdout:
+            out = _tee(proc.stdout, tee) if tee else proc.stdout
+            index = _write_indexed_diff(
+                lines_of(out) if lines_of else out, part,
+            )
+        returncode = proc.wait()
+        err.seek(0)
+        stderr = err.read().decode("utf-8", "replace")
+    with open(part + ".index", "w") as f:
+        json.dump(index, f)
+    if raw:
+        from fake_gh import record_file
+        record_file(RECORD_DIR, gh_args, raw, stderr, returncode)
+        os.remove(raw)
+    return subprocess.CompletedProcess(
+        ["gh"] + gh_args, returncode, None, stderr,
     )
 
-    # 2. Diff
+
+def _tee(lines, sink):
+    for line in lines:
+        sink.write(line)
+        yield line
+
+
+def _stream_diff(cmd, pr_dir):
+    """Stream `gh pr diff` (cmd) to disk; see _gh_stream()."""
+    return _gh_stream(cmd[1:], pr_dir)
+
+
+def _files_api_diff_lines(stdout):
+    """Rebuild diff lines from `pulls/<n>/files` entries (one per line)."""
+    for raw in stdout:
+        if not raw.strip():
+            continue
+        entry = json.loads(raw)
+        new = entry.get("filename", "")
+        old = entry.get("previous_filename") or new
+        status = entry.get("status", "")
+        yield f"diff --git a/{old} b/{new}\n".encode("utf-8")
+        a_path = "/dev/null" if status == "added" else f"a/{old}"
+        b_path = "/dev/null" if status == "removed" else f"b/{new}"
+        patch = entry.get("patch")
+        if patch is None:
+            # GitHub omits the patch of binary and very large files
+            yield b"# patch unavailable via the files API\n"
+            continue
+        yield f"--- {a_path}\n+++ {b_path}\n".encode("utf-8")
+        for ln in patch.splitlines(True):
+            yield ln.encode("utf-8")
+        if not patch.endswith("\n"):
+            yield b"\n"
+
+
+def _submit(pool, name, cmd, pr_dir):
+    """Submit one gh call of a PR fetch (the diff is streamed to disk)."""
+    if name == "diff":
+        return pool.submit(_stream_diff, cmd, pr_dir)
+    return pool.submit(_run, cmd)
+
+
+def _save_diff(pr_number, pr_dir, diff):
+    """Move a streamed `gh pr diff` result into place.
+
+    A diff gh refuses for size is rebuilt per file from the paginated
+    files API (a placeholder is kept if that fails too). Exits if the
+    diff failed for other reasons.
+    """
     diff_path = os.path.join(pr_dir, "diff.patch")
-    diff = _run(["gh", "pr", "diff", pr_number])
+    part = diff_path + ".part"
+    label = "diff"
     if diff.returncode != 0:
         err = (diff.stderr or "").strip()
         too_large = (
             "PullRequest.diff too_large" in err
             or "diff exceeded the maximum number of lines" in err
         )
-        if too_large:
-            with open(diff_path, "w") as f:
+        if not too_large:
+            print(
+                f"Failed to fetch diff for PR "
+                f"#{pr_number}: {diff.stderr}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        files = _gh_stream([
+            "api",
+            f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/files",
+            "--paginate", "--jq", ".[]",
+        ], pr_dir, _files_api_diff_lines)
+        if files.returncode != 0:
+            with open(part, "w") as f:
                 f.write(
                     f"# WARNING: PR #{pr_number} diff is too large to fetch via gh\n"
                     f"# Original error:\n# {err.replace(chr(10), chr(10) + '# ')}\n"
                 )
-            print(
-                f"  Saved diff placeholder → "
-                f"{os.path.relpath(diff_path, ROOT)}",
-                file=sys.stderr,
-            )
+            with open(part + ".index", "w") as f:
+                json.dump({}, f)
+            label = "diff placeholder"
         else:
             print(
-                f"Failed to fetch diff for PR "
-                f"#{pr_number}: {diff.stderr}",
+                f"  Diff too large for gh; rebuilt it from "
+                f"the files API",
                 file=sys.stderr,
             )
-            sys.exit(1)
-    else:
-        with open(diff_path, "w") as f:
-            f.write(diff.stdout)
+    os.replace(part + ".index", os.path.join(pr_dir, _DIFF_INDEX))
+    os.replace(part, diff_path)
+    print(
+        f"  Saved {label} → "
+        f"{os.path.relpath(diff_path, ROOT)}"
+    )
+
+
+def _report_unchanged(pr_number):
+    print(
+        "  Unchanged since last fetch — kept diff, "
+        "review comments and threads"
+    )
+    print(f"  ✓ PR #{pr_number} fetched")
+
+
+def _finish_fetch(pool, pr_number, owner, repo, futures):
+    """Wait for one PR's gh calls and save their output."""
+    pr_dir = _validate_pr_number(pr_number)
+    os.makedirs(pr_dir, exist_ok=True)
+
+    meta = futures["meta"].result()
+    if meta.returncode != 0:
         print(
-            f"  Saved diff → "
-            f"{os.path.relpath(diff_path, ROOT)}"
+            f"Failed to fetch PR #{pr_number}: "
+            f"{meta.stderr}",
+            file=sys.stderr,
         )
+        sys.exit(1)
 
-    # 3. Review comments (REST — keeps diff_hunk etc.)
-    comments = _run([
-        "gh", "api",
-        f"repos/{{owner}}/{{repo}}/pulls/"
-        f"{pr_number}/comments",
-        "--paginate",
-    ])
+    meta_data = json.loads(meta.stdout)
+    _save_json(pr_dir, "meta.json", meta_data, "metadata")
+
+    version = _pr_version(meta_data)
+    if "diff" not in futures:
+        if version == _cached_version(pr_dir):
+            _report_unchanged(pr_number)
+            return
+        futures.update(
+            (name, _submit(pool, name, cmd, pr_dir))
+            for name, cmd in _fetch_commands(
+                pr_number, owner, repo,
+            ).items()
+            if name != "meta"
+        )
+
+    _save_diff(pr_number, pr_dir, futures["diff"].result())
+
+    comments = futures["comments"].result()
     if comments.returncode == 0:
-        rc_path = os.path.join(
-            pr_dir, "review_comments.json"
+        _save_json(
+            pr_dir, "review_comments.json",
+            json.loads(comments.stdout), "review comments",
         )
-        with open(rc_path, "w") as f:
-            json.dump(
-                json.loads(comments.stdout), f,
-                indent=2, ensure_ascii=False,
-            )
-            f.write("\n")
-        print(
-            f"  Saved review comments → "
-            f"{os.path.relpath(rc_path, ROOT)}"
+
+    threads = futures.get("threads")
+    threads = threads.result() if threads else None
+    if threads is not None and threads.returncode == 0:
+        _save_json(
+            pr_dir, "review_threads.json",
+            json.loads(threads.stdout), "review threads",
         )
 
-    # 4. Review threads via GraphQL (isResolved)
+    # Only a complete fetch may be reused by the next run.
+    complete = (
+        comments.returncode == 0
+        and threads is not None and threads.returncode == 0
+    )
+    _save_fetch_state(pr_dir, version=version if complete else None)
+    print(f"  ✓ PR #{pr_number} fetched")
+
+
+def fetch(pr_number: str, jobs=None, force=False):
+    """Fetch one PR; its gh calls run concurrently.
+
+    Diff, review comments and threads are re-downloaded only if the
+    PR's updatedAt or head SHA changed (or with force).
+    """
     owner, repo = _owner_repo()
-    if owner and repo:
-        threads = _run([
-            "gh", "api", "graphql",
-            "-f", f"query={_REVIEW_THREADS_QUERY}",
-            "-F", f"n={pr_number}",
-            "-f", f"owner={owner}",
-            "-f", f"repo={repo}",
-        ])
-        if threads.returncode == 0:
-            threads_path = os.path.join(
-                pr_dir, "review_threads.json"
+    with ThreadPoolExecutor(max_workers=jobs or DEFAULT_JOBS) as pool:
+        _finish_fetch(
+            pool, pr_number, owner, repo,
+            _start_fetch(
+                pool, pr_number, owner, repo, force=force,
+            ),
+        )
+
+
+def fetch_many(pr_numbers, jobs=None, force=False, listed=None):
+    """Fetch several PRs through one bounded pool of gh calls.
+
+    `listed` maps PR numbers to the [updatedAt, headRefOid] from the PR
+    listing, so unchanged PRs only have their metadata refreshed.
+    Results are saved (and reported) in PR order. A failing PR is
+    reported and skipped; returns the list of PR numbers that failed.
+    """
+    owner, repo = _owner_repo()
+    listed = listed or {}
+    failures = []
+    with ThreadPoolExecutor(max_workers=jobs or DEFAULT_JOBS) as pool:
+        started = [
+            (num, _start_fetch(
+                pool, num, owner, repo,
+                listed=listed.get(num), force=force,
+            ))
+            for num in pr_numbers
+        ]
+        for num, futures in started:
+            try:
+                _finish_fetch(pool, num, owner, repo, futures)
+            except (SystemExit, OSError, ValueError) as e:
+                reason = (
+                    f"exit={e.code}"
+                    if isinstance(e, SystemExit) else str(e)
+                )
+                print(
+                    f"  Failed to fetch PR #{num} ({reason})",
+                    file=sys.stderr,
+                )
+                failures.append(num)
+    return failures
+
+
+def _graphql(query, owner, repo):
+    """Run a GraphQL query; return (repository data, error text)."""
+    r = _run([
+        "gh", "api", "graphql",
+        "-f", f"query={query}",
+        "-f", f"owner={owner}",
+        "-f", f"repo={repo}",
+    ])
+    try:
+        data = json.loads(r.stdout or "null") or {}
+    except ValueError:
+        data = {}
+    # A missing PR nulls its alias and fails the call, but the other
+    # aliases still carry data.
+    repo_data = (data.get("data") or {}).get("repository") or {}
+    err = (r.stderr or "").strip()
+    if not err and data.get("errors"):
+        err = "; ".join(
+            e.get("message", "") for e in data["errors"]
+        )
+    return repo_data, err
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def fetch_many_graphql(pr_numbers, jobs=None, force=False, listed=None):
+    """Fetch several PRs with batched GraphQL queries.
+
+    Metadata, comments, review threads (paginated past 100) and their
+    diff hunks come from one aliased query per GRAPHQL_BATCH PRs; only
+    the raw diff of changed PRs is fetched via `gh pr diff`. Writes the
+    same files as the per-PR mode. `listed` is accepted for parity
+    with fetch_many; the batch already carries every PR's version.
+    Returns the PR numbers that failed.
+    """
+    owner, repo = _owner_repo()
+    if not (owner and repo):
+        print(
+            "Failed to resolve owner/repo for GraphQL fetch",
+            file=sys.stderr,
+        )
+        return list(pr_numbers)
+    for num in pr_numbers:
+        _validate_pr_number(num)
+
+    nodes = {}
+    errors = {}
+    batch = max(1, GRAPHQL_BATCH)
+    with ThreadPoolExecutor(max_workers=jobs or DEFAULT_JOBS) as pool:
+        started = [
+            (chunk, pool.submit(
+                _graphql, _build_batch_query(chunk), owner, repo,
+            ))
+            for chunk in _chunks(list(pr_numbers), batch)
+        ]
+        for chunk, fut in started:
+            repo_data, err = fut.result()
+            for num in chunk:
+                node = repo_data.get(f"pr{num}")
+                if node:
+                    nodes[num] = node
+                else:
+                    errors[num] = err or "no data"
+
+        pages = [
+            (num, conn, node[conn]["pageInfo"]["endCursor"])
+            for num, node in nodes.items()
+            for conn in _BATCH_PAGED
+            if node[conn]["pageInfo"]["hasNextPage"]
+        ]
+        while pages:
+            started = [
+                (chunk, pool.submit(
+                    _graphql, _build_page_query(chunk), owner, repo,
+                ))
+                for chunk in _chunks(pages, batch)
+            ]
+            pages = []
+            for chunk, fut in started:
+                repo_data, err = fut.result()
+                for i, (num, conn, _cursor) in enumerate(chunk):
+                    page = (repo_data.get(f"p{i}") or {}).get(conn)
+                    if not page:
+                        errors[num] = err or f"no {conn} page"
+                        continue
+                    target = nodes[num][conn]
+                    target["nodes"].extend(_nodes(page))
+                    target["pageInfo"] = page["pageInfo"]
+                    if page["pageInfo"]["hasNextPage"]:
+                        pages.append((
+                            num, conn,
+                            page["pageInfo"]["endCursor"],
+                        ))
+
+        diffs = {
+            num: _submit(
+                pool, "diff", ["gh", "pr", "diff", num],
+                _validate_pr_number(num),
             )
-            with open(threads_path, "w") as f:
-                json.dump(
-                    json.loads(threads.stdout), f,
-                    indent=2, ensure_ascii=False,
+            for num, node in nodes.items()
+            if num not in errors and (
+                force
+                or _pr_version(node) != _cached_version(
+                    _validate_pr_number(num),
                 )
-                f.write("\n")
-            print(
-                f"  Saved review threads → "
-                f"{os.path.relpath(threads_path, ROOT)}"
             )
+        }
 
-    print(f"  ✓ PR #{pr_number} fetched")
+        failures = []
+        for num in pr_numbers:
+            try:
+                if num in errors:
+                    print(
+                        f"Failed to fetch PR #{num}: {errors[num]}",
+                        file=sys.stderr,
+                    )
+                    sys.exit(1)
+                pr_dir = _validate_pr_number(num)
+                os.makedirs(pr_dir, exist_ok=True)
+                node = nodes[num]
+                _save_json(
+                    pr_dir, "meta.json",
+                    _meta_from_graphql(node), "metadata",
+                )
+                if num not in diffs:
+                    _report_unchanged(num)
+                    continue
+                _save_diff(num, pr_dir, diffs[num].result())
+                _save_json(
+                    pr_dir, "review_comments.json",
+                    _review_comments_from_graphql(node),
+                    "review comments",
+                )
+                _save_json(
+                    pr_dir, "review_threads.json",
+                    _threads_from_graphql(node), "review threads",
+                )
+                _save_fetch_state(pr_dir, version=_pr_version(node))
+                print(f"  ✓ PR #{num} fetched")
+            except (SystemExit, OSError, ValueError) as e:
+                reason = (
+                    f"exit={e.code}"
+                    if isinstance(e, SystemExit) else str(e)
+                )
+                print(
+                    f"  Failed to fetch PR #{num} ({reason})",
+                    file=sys.stderr,
+                )
+                failures.append(num)
+    return failures
 
 
 BOTS = {
@@ -379,50 +958,89 @@ def _load_diff_hunks(pr_dir):
     return hunks
 
 
-def _has_quote_match(original_body, reply_body):
-    """Check if reply quotes text from the original."""
-    quoted = []
-    for line in reply_body.splitlines():
+def _hunk_upto(hunk, new_start, line):
+    """Cut a hunk after new-side `line`, like GitHub's diff_hunk."""
+    out = []
+    n = new_start
+    for hl in hunk.splitlines():
+        out.append(hl)
+        if len(out) == 1 or hl.startswith(("-", "\\")):
+            continue
+        if n == line:
+            break
+        n += 1
+    return "\n".join(out)
+
+
+def _add_indexed_hunks(pr_dir, threads, hunks):
+    """Fill in missing thread hunks (url → hunk) from diff.patch.
+
+    Uses the diff_index.json sidecar to mmap-read only the hunks the
+    review threads point at.
+    """
+    wanted = []
+    for t in threads:
+        nodes = t.get("comments", {}).get("nodes", [])
+        url = nodes[0].get("url", "") if nodes else ""
+        line = t.get("line") or t.get("startLine")
+        if url and url not in hunks and t.get("path") and line:
+            wanted.append((url, t["path"], line))
+    index_path = os.path.join(pr_dir, _DIFF_INDEX)
+    diff_path = os.path.join(pr_dir, "diff.patch")
+    if not (wanted and os.path.exists(index_path)):
+        return
+    with open(index_path) as f:
+        index = json.load(f)
+    with open(diff_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for url, path, line in wanted:
+                for start, end, new_start, count in (
+                    index.get(path, {}).get("hunks", [])
+                ):
+                    if new_start <= line < new_start + count:
+                        hunks[url] = _hunk_upto(
+                            mm[start:end].decode("utf-8", "replace"),
+                            new_start, line,
+                        )
+                        break
+
+
+def _quoted_lines(body):
+    """Return the lowercased `>`-quoted lines of a reply (no @mentions)."""
+    quoted = set()
+    for line in (body or "").splitlines():
         s = line.strip()
         if s.startswith(">"):
             txt = s.lstrip(">").strip()
             if txt and not txt.startswith("@"):
-                quoted.append(txt.lower())
-    if not quoted:
-        return False
-    orig_lower = original_body.lower()
-    return any(q in orig_lower for q in quoted)
+                quoted.add(txt.lower())
+    return quoted
 
 
 def _detect_pr_replies(comments, pr_author):
-    """Return set of comment URLs that the author replied to."""
+    """Return set of comment URLs that the author replied to.
+
+    A comment counts as replied when a later comment by the PR author
+    quotes text from it. Comments are walked newest first, collecting
+    the quotes of author replies seen so far, so each body is split and
+    lowercased once.
+    """
     replied = set()
-    human = [
-        c for c in comments
-        if not _is_bot(
-            c.get("author", {}).get("login", "")
-        )
-    ]
-    for i, c in enumerate(human):
-        c_author = (
-            c.get("author", {}).get("login", "")
-        )
+    later_quotes = set()
+    for c in reversed(comments):
+        c_author = c.get("author", {}).get("login", "")
+        if _is_bot(c_author):
+            continue
         if c_author == pr_author:
+            later_quotes |= _quoted_lines(c.get("body"))
             continue
-        c_body = c.get("body") or ""
-        c_url = c.get("url", "")
-        # Check subsequent author comments for quote
-        for j in range(i + 1, len(human)):
-            r = human[j]
-            r_author = (
-                r.get("author", {}).get("login", "")
-            )
-            if r_author != pr_author:
-                continue
-            r_body = r.get("body") or ""
-            if _has_quote_match(c_body, r_body):
-                replied.add(c_url)
-                break
+        if not later_quotes:
+            continue
+        c_lower = (c.get("body") or "").lower()
+        if any(q in c_lower for q in later_quotes):
+            replied.add(c.get("url", ""))
     return replied
 
 
@@ -514,12 +1132,70 @@ def _ci_summary(meta):
     return ", ".join(parts) if parts else "—"
 
 
-def status(pr_number: str):
+def status(pr_number: str, jobs=None, force=False):
     # Always fetch the latest PR data before report
-    fetch(pr_number)
+    fetch(pr_number, jobs, force)
+    write_status(pr_number, force)
+
+
+# Untriaged copy of the last render; status.md is restored from it.
+_STATUS_RENDERED = "status.rendered.md"
 
+# Files the status report is rendered from (plus this script itself).
+_STATUS_INPUTS = (
+    "meta.json", "review_comments.json", "review_threads.json",
+    _DIFF_INDEX,
+)
+
+
+def _status_inputs_digest(pr_dir):
+    h = hashlib.sha256()
+    for path in [os.path.abspath(__file__)] + [
+        os.path.join(pr_dir, n) for n in _STATUS_INPUTS
+    ]:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        h.update(hashlib.sha256(data).digest())
+    return h.hexdigest()
+
+
+def write_status(pr_number: str, force=False):
+    """Render .prs/<n>/status.md from the fetched PR data.
+
+    Every run yields a fresh, untriaged report. When none of its inputs
+    changed since the last render, status.md is restored from the
+    pristine copy of that render instead of rendering it again, so
+    severities and audit verdicts edited since are discarded.
+    """
     pr_dir = os.path.join(PRS_DIR, pr_number)
     meta_path = os.path.join(pr_dir, "meta.json")
+    report_path = os.path.join(
+        pr_dir, "status.md"
+    )
+    if not os.path.exists(meta_path):
+        print(
+            f"No fetched data for PR #{pr_number}.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    rendered_path = os.path.join(pr_dir, _STATUS_RENDERED)
+    inputs_digest = _status_inputs_digest(pr_dir)
+    if (
+        not force
+        and os.path.exists(rendered_path)
+        and _load_fetch_state(pr_dir).get("status_inputs")
+        == inputs_digest
+    ):
+        shutil.copyfile(rendered_path, report_path)
+        print(
+            f"  ✓ Status report unchanged → "
+            f"{os.path.relpath(report_path, ROOT)}"
+        )
+        return
 
     with open(meta_path) as f:
         meta = json.load(f)
@@ -538,6 +1214,7 @@ def status(pr_number: str):
     # --- Load data ---
     all_threads = _load_review_threads(pr_dir)
     diff_hunks = _load_diff_hunks(pr_dir)
+    _add_indexed_hunks(pr_dir, all_threads, diff_hunks)
     resolved_threads = [
         t for t in all_threads if t.get("isResolved")
     ]
@@ -822,11 +1499,10 @@ def status(pr_number: str):
         ln.append("---")
         ln.append("")
 
-    report_path = os.path.join(
-        pr_dir, "status.md"
-    )
-    with open(report_path, "w") as f:
+    with open(rendered_path, "w") as f:
         f.write("\n".join(ln))
+    shutil.copyfile(rendered_path, report_path)
+    _save_fetch_state(pr_dir, status_inputs=inputs_digest)
     print(
         f"  ✓ Status report → "
         f"{os.path.relpath(report_path, ROOT)}"
@@ -909,19 +1585,126 @@ def reorder(pr_number: str):
     print(f"  ✓ PR #{pr_number} status report reordered")
 
 
+def _pop_options(args):
+    """Strip `--jobs N`, `--force`, `--graphql`, `--offline` and
+    `--record DIR` (also as `--opt=value`) from args.
+
+    Returns (args, options).
+    """
+    rest = []
+    options = {
+        "jobs": None, "force": False,
+        "graphql": FETCH_MODE == "graphql",
+        "offline": False,
+        "record": None,
+    }
+    it = iter(args)
+    for a in it:
+        if a == "--force":
+            options["force"] = True
+            continue
+        if a == "--graphql":
+            options["graphql"] = True
+            continue
+        if a == "--offline":
+            options["offline"] = True
+            continue
+        if a == "--record":
+            a = "--record=" + next(it, "")
+        if a.startswith("--record="):
+            options["record"] = a.split("=", 1)[1]
+            continue
+        if a == "--jobs":
+            a = "--jobs=" + next(it, "")
+        if a.startswith("--jobs="):
+            val = a.split("=", 1)[1]
+            if not val.isdigit() or int(val) < 1:
+                print(
+                    f"Invalid --jobs value: {val!r}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            options["jobs"] = int(val)
+            continue
+        rest.append(a)
+    return rest, options
+
+
+def _cached_prs():
+    """Return the non-excluded PR numbers with fetched data in PRS_DIR.
+
+    Reports the skipped (excluded) ones.
+    """
+    excludes = _load_exclude_list()
+    nums = []
+    if os.path.isdir(PRS_DIR):
+        for name in os.listdir(PRS_DIR):
+            meta_path = os.path.join(PRS_DIR, name, "meta.json")
+            if not (
+                _PR_NUMBER_RE.match(name)
+                and os.path.isfile(meta_path)
+            ):
+                continue
+            if name in excludes:
+                print(f"  Skipping PR #{name} (excluded)")
+                continue
+            nums.append(name)
+    return sorted(nums, key=int)
+
+
+def _target_prs():
+    """Return {PR number: [updatedAt, headRefOid]} of open, non-excluded PRs.
+
+    Reports the skipped (excluded) ones.
+    """
+    prs = _list_open_prs()
+    excludes = _load_exclude_list()
+    targets = {}
+    for pr in prs:
+        num = str(pr["number"])
+        if num in excludes:
+            print(f"  Skipping PR #{num} (excluded)")
+            continue
+        targets[num] = _pr_version(pr)
+    return targets
+
+
 def main():
-    if len(sys.argv) < 2:
+    global RECORD_DIR
+    args, opts = _pop_options(sys.argv[1:])
+    jobs = opts["jobs"]
+    force = opts["force"]
+    offline = opts["offline"]
+    many = fetch_many_graphql if opts["graphql"] else fetch_many
+    if opts["record"]:
+        RECORD_DIR = os.path.abspath(opts["record"])
+    if len(args) < 1:
         print(
             "Usage: pr.py "
             "{list|fetch|status|reorder} "
-            "[PR_NUMBER]",
+            "[PR_NUMBER] [--jobs N] [--force] [--graphql] "
+            "[--offline] [--record DIR]",
             file=sys.stderr,
         )
         sys.exit(1)
 
-    cmd = sys.argv[1]
+    cmd = args[0]
 
-    if cmd == "list":
+    if cmd == "fetch" and offline:
+        print(
+            "fetch cannot run with --offline",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    if cmd == "list" and offline:
+        for num in _cached_prs():
+            with open(os.path.join(PRS_DIR, num, "meta.json")) as f:
+                meta = json.load(f)
+            author = meta.get("author", {}).get("login", "?")
+            print(f"  #{num}\t@{author}\t{meta.get('title', '')}")
+
+    elif cmd == "list":
         prs = _list_open_prs()
         excludes = _load_exclude_list()
         for pr in prs:
@@ -941,46 +1724,42 @@ def main():
         )
 
     elif cmd == "fetch":
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print(
-                "Usage: pr.py fetch <PR_NUMBER|ALL>",
+                "Usage: pr.py fetch <PR_NUMBER|ALL> "
+                "[--jobs N] [--force] [--graphql]",
                 file=sys.stderr,
             )
             sys.exit(1)
-        arg = sys.argv[2]
+        arg = args[1]
         if arg.upper() == "ALL":
-            prs = _list_open_prs()
-            excludes = _load_exclude_list()
-            for pr in prs:
-                num = str(pr["number"])
-                if num in excludes:
-                    print(f"  Skipping PR #{num} (excluded)")
-                    continue
-                fetch(num)
+            targets = _target_prs()
+            if many(list(targets), jobs, force, targets):
+                sys.exit(1)
         else:
-            fetch(arg)
+            fetch(arg, jobs, force)
 
     elif cmd == "status":
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print(
-                "Usage: pr.py status <PR_NUMBER|ALL>",
+                "Usage: pr.py status <PR_NUMBER|ALL> "
+                "[--jobs N] [--force] [--graphql] [--offline]",
                 file=sys.stderr,
             )
             sys.exit(1)
-        arg = sys.argv[2]
+        arg = args[1]
         if arg.upper() == "ALL":
-            prs = _list_open_prs()
-            excludes = _load_exclude_list()
-            failures = []
-            for pr in prs:
-                num = str(pr["number"])
-                if num in excludes:
-                    print(
-                        f"  Skipping PR #{num} (excluded)",
-                    )
+            if offline:
+                # Render purely from the fetched data in PRS_DIR
+                targets, failures = _cached_prs(), []
+            else:
+                targets = _target_prs()
+                failures = many(list(targets), jobs, force, targets)
+            for num in targets:
+                if num in failures:
                     continue
                 try:
-                    status(num)
+                    write_status(num, force)
                 except SystemExit as e:
                     print(
                         f"  Failed to generate status for PR #{num} (exit={e.code})",
@@ -989,17 +1768,20 @@ def main():
                     failures.append(num)
             if failures:
                 sys.exit(1)
+        elif offline:
+            _validate_pr_number(arg)
+            write_status(arg, force)
         else:
-            status(arg)
+            status(arg, jobs, force)
 
     elif cmd == "reorder":
-        if len(sys.argv) < 3:
+        if len(args) < 2:
             print(
                 "Usage: pr.py reorder <PR_NUMBER>",
                 file=sys.stderr,
             )
             sys.exit(1)
-        reorder(sys.argv[2])
+        reorder(args[1])
 
     else:
         print(
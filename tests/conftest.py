@@ -10,3 +10,5 @@ def pytest_configure() -> None:
     sys.path.insert(0, str(cypilot_scripts_dir))
     overwork_alert_src_dir = repo_root / "examples" / "overwork_alert" / "src"
     sys.path.insert(0, str(overwork_alert_src_dir))
+    pr_script_dir = repo_root / "skills" / "scripts"
+    sys.path.insert(0, str(pr_script_dir))
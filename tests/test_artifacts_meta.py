@@ -676,6 +676,42 @@ class TestArtifactsMetaIterators(unittest.TestCase):
         # Test not found
         self.assertIsNone(meta.get_system_by_slug("nonexistent"))
 
+    def test_iter_system_artifacts_and_get_system_for_id(self):
+        """Cover subtree artifact iteration and ID owner lookup."""
+        data = {
+            "version": "1.0",
+            "project_root": "..",
+            "kits": {},
+            "systems": [
+                {
+                    "name": "MyApp",
+                    "slug": "myapp",
+                    "kit": "cypilot-sdlc",
+                    "artifacts": [{"path": "docs/PRD.md", "kind": "PRD"}],
+                    "children": [
+                        {
+                            "name": "Core",
+                            "slug": "core",
+                            "kit": "cypilot-sdlc",
+                            "artifacts": [{"path": "core/DESIGN.md", "kind": "DESIGN"}],
+                        }
+                    ],
+                },
+                {"name": "Other", "slug": "other", "kit": "cypilot-sdlc", "artifacts": [{"path": "other/PRD.md", "kind": "PRD"}]},
+            ],
+        }
+        meta = ArtifactsMeta.from_dict(data)
+        root = meta.get_system_by_slug("myapp")
+        paths = sorted(a.path for a, _ in meta.iter_system_artifacts(root))
+        self.assertEqual(paths, ["core/DESIGN.md", "docs/PRD.md"])
+        core = meta.get_system_by_slug("core")
+        self.assertEqual([a.path for a, _ in meta.iter_system_artifacts(core)], ["core/DESIGN.md"])
+
+        self.assertIs(meta.get_system_for_id("cpt-myapp-core-fr-login"), core)
+        self.assertIs(meta.get_system_for_id("cpt-myapp-fr-login"), root)
+        self.assertIsNone(meta.get_system_for_id("cpt-unknown-fr-x"))
+        self.assertIsNone(meta.get_system_for_id("not-an-id"))
+
     def test_validate_all_slugs(self):
         """Cover validate_all_slugs method."""
         data = {
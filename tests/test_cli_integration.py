@@ -738,6 +738,103 @@ class TestCLIAgentsCommand(unittest.TestCase):
             out = json.loads(stdout.getvalue())
             self.assertGreater(len(out.get("skills", {}).get("updated", [])), 0)
 
+    def test_agents_rerenders_only_changed_outputs(self):
+        """Test agents command uses its manifest to skip unchanged proxies."""
+        from cypilot import cli as cypilot_cli
+
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / ".git").mkdir()
+            self._write_minimal_cypilot_skill(root)
+            self._write_workflows_with_frontmatter(root)
+            argv = ["agents", "--agent", "claude", "--root", str(root), "--cypilot-root", str(root)]
+
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(main(argv), 0)
+            self.assertTrue((root / ".cypilot-cache" / "agents.json").is_file())
+
+            def _run():
+                parsed = []
+                orig = cypilot_cli._parse_frontmatter
+
+                def _pf(path):
+                    parsed.append(Path(path).name)
+                    return orig(path)
+
+                stdout = io.StringIO()
+                with unittest.mock.patch.object(cypilot_cli, "_parse_frontmatter", _pf):
+                    with redirect_stdout(stdout):
+                        self.assertEqual(main(argv), 0)
+                return parsed, json.loads(stdout.getvalue())
+
+            parsed, out = _run()
+            self.assertEqual(parsed, [])
+            self.assertEqual(out["workflows"]["counts"], {"created": 0, "updated": 0, "renamed": 0, "deleted": 0})
+            self.assertEqual({o["action"] for o in out["skills"]["outputs"]}, {"unchanged"})
+
+            # Only the proxy of the edited source workflow is re-rendered.
+            src = root / "workflows" / "analyze.md"
+            src.write_text(src.read_text(encoding="utf-8").replace("Analyze Cypilot", "Inspect Cypilot"), encoding="utf-8")
+            parsed, out = _run()
+            self.assertIn("analyze.md", parsed)
+            self.assertNotIn("generate.md", parsed)
+            self.assertEqual(out["workflows"]["updated"], [(root / ".claude" / "commands" / "cypilot-analyze.md").resolve().as_posix()])
+            self.assertIn("Inspect Cypilot", (root / ".claude" / "commands" / "cypilot-analyze.md").read_text(encoding="utf-8"))
+
+            # A touched but identical output is matched by its content digest.
+            proxy = root / ".claude" / "commands" / "cypilot-generate.md"
+            st = proxy.stat()
+            os.utime(proxy, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+            parsed, out = _run()
+            self.assertEqual(parsed, [])
+            self.assertEqual(out["workflows"]["updated"], [])
+
+            # Hand-edited outputs are detected and restored.
+            proxy.write_text("# Modified\n", encoding="utf-8")
+            parsed, out = _run()
+            self.assertEqual(parsed, ["generate.md"])
+            self.assertEqual(out["workflows"]["updated"], [proxy.resolve().as_posix()])
+
+    def test_agents_all_generates_every_configured_agent(self):
+        """Test --agent all renders every agent in one pass, with --dry-run support."""
+        from cypilot import cli as cypilot_cli
+
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / ".git").mkdir()
+            self._write_minimal_cypilot_skill(root)
+            self._write_workflows_with_frontmatter(root)
+            argv = ["agents", "--agent", "all", "--root", str(root), "--cypilot-root", str(root)]
+
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                self.assertEqual(main(argv + ["--dry-run"]), 0)
+            out = json.loads(stdout.getvalue())
+            self.assertTrue(out["dry_run"])
+            self.assertEqual(set(out["agents"]), {"windsurf", "cursor", "claude", "copilot", "openai"})
+            self.assertFalse((root / ".windsurf").exists())
+            self.assertFalse((root / "cypilot-agents.json").exists())
+
+            orig = cypilot_cli._list_workflow_files
+            listed = []
+
+            def _lwf(cypilot_root):
+                listed.append(cypilot_root)
+                return orig(cypilot_root)
+
+            stdout = io.StringIO()
+            with unittest.mock.patch.object(cypilot_cli, "_list_workflow_files", _lwf):
+                with redirect_stdout(stdout):
+                    self.assertEqual(main(argv), 0)
+            out = json.loads(stdout.getvalue())
+            self.assertEqual(out["status"], "PASS")
+            self.assertEqual(len(listed), 1)
+            self.assertEqual(out["agents"]["claude"]["status"], "PASS")
+            self.assertGreater(out["agents"]["claude"]["workflows"]["counts"]["created"], 0)
+            self.assertTrue((root / ".windsurf" / "workflows" / "cypilot-generate.md").is_file())
+            self.assertTrue((root / ".claude" / "commands" / "cypilot-generate.md").is_file())
+            self.assertTrue((root / ".agents" / "skills" / "cypilot" / "SKILL.md").is_file())
+
 
 class TestCLIParseFrontmatter(unittest.TestCase):
     """Test _parse_frontmatter function."""
@@ -1820,6 +1917,90 @@ text
             self.assertIn("templates", out)
 
 
+    def test_validate_kits_rechecks_only_changed_templates(self):
+        """The manifest skips unchanged templates; constraints.json edits and --force recheck."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+            design_dir = root / "kits" / "sdlc" / "artifacts" / "DESIGN"
+            design_dir.mkdir()
+            (design_dir / "template.md").write_text(
+                "---\ncypilot-template:\n  version:\n    major: 1\n    minor: 0\n  kind: DESIGN\n---\n"
+                "<!-- cpt:paragraph:summary -->\ntext\n<!-- cpt:paragraph:summary -->\n",
+                encoding="utf-8",
+            )
+
+            def run(*extra):
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    code = main(["validate-kits", *extra])
+                return code, json.loads(stdout.getvalue())
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                code, out = run()
+                self.assertEqual((code, out["templates_validated"], out["cache_hits"]), (0, 2, 0))
+
+                code, out = run()
+                self.assertEqual((code, out["cache_hits"]), (0, 2))
+
+                (design_dir / "template.md").write_text("<!-- cpt:paragraph:summary -->\n", encoding="utf-8")
+                code, out = run()
+                self.assertEqual((code, out["cache_hits"]), (2, 1))
+                self.assertEqual(len(out["failed_templates"]), 1)
+
+                (root / "kits" / "sdlc" / "constraints.json").write_text("[]", encoding="utf-8")
+                code, out = run()
+                self.assertEqual(out["cache_hits"], 0)
+                self.assertTrue(any(e.get("message") == "Invalid constraints.json" for e in out["errors"]))
+
+                code, out = run("--force")
+                self.assertEqual(out["cache_hits"], 0)
+            finally:
+                os.chdir(cwd)
+
+    def test_validate_kits_force_for_one_kit_keeps_other_kits_cached(self):
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+            adr_dir = root / "kits" / "other" / "artifacts" / "ADR"
+            adr_dir.mkdir(parents=True)
+            (adr_dir / "template.md").write_text(
+                "---\ncypilot-template:\n  version:\n    major: 1\n    minor: 0\n  kind: ADR\n---\n"
+                "<!-- cpt:paragraph:summary -->\ntext\n<!-- cpt:paragraph:summary -->\n",
+                encoding="utf-8",
+            )
+            _bootstrap_registry_new_format(
+                root,
+                kits={
+                    "cypilot": {"format": "Cypilot", "path": "kits/sdlc"},
+                    "other": {"format": "Cypilot", "path": "kits/other"},
+                },
+                systems=[],
+            )
+
+            def run(*extra):
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    code = main(["validate-kits", *extra])
+                return code, json.loads(stdout.getvalue())
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                code, out = run()
+                self.assertEqual((code, out["templates_validated"], out["cache_hits"]), (0, 2, 0))
+
+                code, out = run("--kit", "other", "--force")
+                self.assertEqual((code, out["templates_validated"], out["cache_hits"]), (0, 1, 0))
+
+                code, out = run()
+                self.assertEqual((code, out["cache_hits"]), (0, 2))
+            finally:
+                os.chdir(cwd)
+
+
 class TestCLIGetContentCommand(unittest.TestCase):
     """Tests for get-content command."""
 
@@ -3219,6 +3400,70 @@ class TestCLISelfCheckCommand(unittest.TestCase):
             finally:
                 os.chdir(cwd)
 
+    def test_self_check_caches_results_until_inputs_change(self):
+        """Unchanged examples are served from the cache; edits revalidate them."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            tmpl = (
+                "---\ncypilot-template:\n  version:\n    major: 1\n    minor: 0\n  kind: {kind}\n---\n"
+                "<!-- cpt:id:item -->\n- [ ] `p1` - **ID**: `cpt-test-1`\n<!-- cpt:id:item -->\n"
+            )
+            for kind in ("PRD", "DESIGN"):
+                kind_dir = root / "kits" / "sdlc" / "artifacts" / kind
+                (kind_dir / "examples").mkdir(parents=True)
+                (kind_dir / "template.md").write_text(tmpl.format(kind=kind), encoding="utf-8")
+                (kind_dir / "examples" / "example.md").write_text(
+                    "<!-- cpt:id:item -->\n- [x] `p1` - **ID**: `cpt-test-1`\n<!-- cpt:id:item -->\n",
+                    encoding="utf-8",
+                )
+            _bootstrap_registry_new_format(root, kits={"cypilot": {"format": "Cypilot", "path": "kits/sdlc"}}, systems=[])
+
+            def run(*extra):
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    code = main(["self-check", *extra])
+                return code, json.loads(stdout.getvalue())
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                code, out = run()
+                self.assertEqual((code, out["cache_hits"], out["templates_checked"]), (0, 0, 2))
+                self.assertTrue((root / ".cypilot-cache" / "self-check.json").is_file())
+
+                code, out = run("--jobs", "1")
+                self.assertEqual((code, out["cache_hits"]), (0, 2))
+
+                (root / "kits" / "sdlc" / "artifacts" / "PRD" / "examples" / "example.md").write_text(
+                    "<!-- cpt:id:item -->\n- [x] `p1` - **Id**: `cpt-test-1`\n<!-- cpt:id:item -->\n",
+                    encoding="utf-8",
+                )
+                code, out = run()
+                self.assertEqual((code, out["cache_hits"]), (2, 1))
+                failed = [r["kind"] for r in out["results"] if r["status"] == "FAIL"]
+                self.assertEqual(failed, ["PRD"])
+
+                code, out = run("--no-cache")
+                self.assertEqual((code, out["cache_hits"]), (2, 0))
+            finally:
+                os.chdir(cwd)
+
+    def test_self_check_jobs_default_serial_and_broken_pool_fallback(self):
+        """Small batches skip the pool by default; a broken pool falls back to serial."""
+        from concurrent.futures.process import BrokenProcessPool
+        from cypilot import cli
+
+        fake_result = {"errors": [], "warnings": []}
+        jobs = [("e.md", "t.md", "PRD")] * 3
+        with unittest.mock.patch.object(cli, "_self_check_example", return_value=fake_result), \
+                unittest.mock.patch("concurrent.futures.ProcessPoolExecutor") as pool_cls:
+            self.assertEqual(cli._run_self_check_jobs(jobs, 0), [fake_result] * 3)
+            pool_cls.assert_not_called()
+
+            pool_cls.return_value.__enter__.return_value.map.side_effect = BrokenProcessPool("worker died")
+            self.assertEqual(cli._run_self_check_jobs(jobs, 4), [fake_result] * 3)
+            pool_cls.assert_called_once()
+
 
 class TestCLIGetContentErrorBranches(unittest.TestCase):
     """Tests for get-content command error branches."""
@@ -4458,6 +4703,213 @@ class TestCLIValidateCodeCommand(unittest.TestCase):
             finally:
                 os.chdir(cwd)
 
+    def test_validate_rules_selection_skips_code_passes(self):
+        """--rules/--skip-rules limit which passes run (orphan marker only caught by code-markers)."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+            (root / "src" / "orphan.py").write_text(
+                "# @cpt-flow:cpt-unknown-id:p1\ndef orphan(): pass\n",
+                encoding="utf-8",
+            )
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--rules", "structure"])
+                out = json.loads(stdout.getvalue())
+                self.assertEqual(exit_code, 0)
+                self.assertEqual(out.get("rules"), ["structure"])
+                self.assertEqual(out.get("code_files_scanned"), 0)
+                self.assertNotIn("to_code_ids_total", out)
+
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--skip-rules", "code-markers"])
+                out = json.loads(stdout.getvalue())
+                self.assertNotIn("code-markers", out.get("rules"))
+                self.assertFalse(any(e.get("type") == "traceability" for e in out.get("errors", [])))
+
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--rules", "code-markers"])
+                self.assertEqual(exit_code, 2)
+                out = json.loads(stdout.getvalue())
+                self.assertTrue(any(e.get("type") == "traceability" for e in out.get("errors", [])))
+            finally:
+                os.chdir(cwd)
+
+    def test_validate_unknown_rule(self):
+        """Unknown --rules names are rejected before loading anything."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--rules", "no-such-rule"])
+                self.assertEqual(exit_code, 1)
+                out = json.loads(stdout.getvalue())
+                self.assertEqual(out.get("status"), "ERROR")
+                self.assertIn("structure", out.get("available_rules"))
+            finally:
+                os.chdir(cwd)
+
+    def test_validate_system_scope_counts_references_from_other_systems(self):
+        """Coverage of scope IDs referenced only from another system matches a full run."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            kit_root = root / "kits" / "sdlc"
+            (kit_root / "artifacts" / "PRD").mkdir(parents=True)
+            (kit_root / "artifacts" / "DESIGN").mkdir(parents=True)
+            (kit_root / "constraints.json").write_text(
+                json.dumps({
+                    "PRD": {"identifiers": {"item": {"references": {"DESIGN": {"coverage": "required"}}}}},
+                    "DESIGN": {"identifiers": {"comp": {}}},
+                }) + "\n",
+                encoding="utf-8",
+            )
+            for rel, text in {
+                "test/PRD.md": "- [x] `p1` - **ID**: `cpt-test-item-1`\n- [x] `p1` - **ID**: `cpt-test-item-2`\n",
+                "test/DESIGN.md": "- [x] `p1` - **ID**: `cpt-test-comp-x`\n- [x] `p1` - `cpt-test-item-2`\n",
+                "other/DESIGN.md": "- [x] `p1` - **ID**: `cpt-other-comp-y`\n- [x] `p1` - `cpt-test-item-1`\n",
+            }.items():
+                (root / rel).parent.mkdir(parents=True, exist_ok=True)
+                (root / rel).write_text(text, encoding="utf-8")
+            _bootstrap_registry_new_format(
+                root,
+                kits={"cypilot": {"format": "Cypilot", "path": "kits/sdlc"}},
+                systems=[
+                    {
+                        "name": "Test",
+                        "slug": "test",
+                        "kit": "cypilot",
+                        "artifacts": [
+                            {"path": "test/PRD.md", "kind": "PRD", "traceability": "DOCS-ONLY"},
+                            {"path": "test/DESIGN.md", "kind": "DESIGN", "traceability": "DOCS-ONLY"},
+                        ],
+                    },
+                    {
+                        "name": "Other",
+                        "slug": "other",
+                        "kit": "cypilot",
+                        "artifacts": [{"path": "other/DESIGN.md", "kind": "DESIGN", "traceability": "DOCS-ONLY"}],
+                    },
+                ],
+            )
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                reports = []
+                for extra in ([], ["--system", "test"]):
+                    stdout = io.StringIO()
+                    with redirect_stdout(stdout):
+                        main(["validate", "--rules", "reference-coverage", "--verbose", *extra])
+                    reports.append(json.loads(stdout.getvalue()))
+                full, scoped = reports
+                self.assertEqual(scoped.get("system"), "test")
+                self.assertEqual(scoped.get("errors"), full.get("errors"))
+                self.assertFalse(any(e.get("id") == "cpt-test-item-1" for e in scoped.get("errors", [])))
+            finally:
+                os.chdir(cwd)
+
+    def test_validate_system_scope(self):
+        """--system validates only that subtree's artifacts and codebase."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+            (root / "other").mkdir()
+            (root / "other" / "PRD.md").write_text(
+                "<!-- cpt:id:item -->\n- [x] `p1` - **ID**: `cpt-other-1`\n<!-- cpt:id:item -->\n",
+                encoding="utf-8",
+            )
+            (root / "other_src").mkdir()
+            (root / "other_src" / "orphan.py").write_text(
+                "# @cpt-flow:cpt-other-missing:p1\ndef orphan(): pass\n",
+                encoding="utf-8",
+            )
+            _bootstrap_registry_new_format(
+                root,
+                kits={"cypilot": {"format": "Cypilot", "path": "kits/sdlc"}},
+                systems=[
+                    {
+                        "name": "Test",
+                        "slug": "test",
+                        "kit": "cypilot",
+                        "artifacts": [{"path": "architecture/PRD.md", "kind": "PRD", "traceability": "FULL"}],
+                        "codebase": [{"path": "src", "extensions": [".py"]}],
+                    },
+                    {
+                        "name": "Other",
+                        "slug": "other",
+                        "kit": "cypilot",
+                        "artifacts": [{"path": "other/PRD.md", "kind": "PRD", "traceability": "FULL"}],
+                        "codebase": [{"path": "other_src", "extensions": [".py"]}],
+                    },
+                ],
+            )
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    main(["validate", "--system", "test", "--verbose"])
+                out = json.loads(stdout.getvalue())
+                self.assertEqual(out.get("system"), "test")
+                self.assertEqual(out.get("artifacts_validated"), 1)
+                self.assertEqual(out.get("code_files_scanned"), 1)
+                self.assertFalse(any("other" in str(e.get("path", "")) for e in out.get("errors", [])))
+
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--system", "other", "--verbose"])
+                self.assertEqual(exit_code, 2)
+                out = json.loads(stdout.getvalue())
+                self.assertTrue(any(e.get("id") == "cpt-other-missing" for e in out.get("errors", [])))
+
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--system", "nope"])
+                self.assertEqual(exit_code, 1)
+                out = json.loads(stdout.getvalue())
+                self.assertEqual(out.get("available_systems"), ["other", "test"])
+            finally:
+                os.chdir(cwd)
+
+    def test_validate_time_budget_partial_report(self):
+        """An exhausted --time-budget returns a partial report listing unvisited files."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--time-budget", "0.000001"])
+                self.assertEqual(exit_code, 3)
+                out = json.loads(stdout.getvalue())
+                self.assertEqual(out.get("status"), "PARTIAL")
+                self.assertEqual(out.get("stop_reason"), "time-budget")
+                self.assertEqual(out.get("artifacts_validated"), 0)
+                self.assertTrue(out["unvisited_artifacts"][0].endswith("PRD.md"))
+                self.assertIn("code-markers", out.get("skipped_rules"))
+
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["validate", "--max-errors", "0"])
+                self.assertEqual(exit_code, 1)
+            finally:
+                os.chdir(cwd)
+
     def test_validate_code_with_nested_systems(self):
         """Test validate-code with nested system hierarchy."""
         with TemporaryDirectory() as tmpdir:
@@ -4928,5 +5380,111 @@ class TestCLIValidateCrossRef(unittest.TestCase):
                 os.chdir(cwd)
 
 
+class TestCLIKitCompileCommand(unittest.TestCase):
+    """Tests for the kit compile command and bundle loading."""
+
+    def test_kit_compile_writes_bundle_used_until_sources_change(self):
+        from cypilot.utils.context import CypilotContext
+        from cypilot.utils.kit_bundle import read_kit_bundle
+
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+            kit_root = (root / "kits" / "sdlc").resolve()
+            (kit_root / "constraints.json").write_text(json.dumps({
+                "PRD": {"identifiers": {"item": {"to_code": True, "headings": ["Items"]}}},
+            }), encoding="utf-8")
+            from_sources = CypilotContext.load(root)
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["kit", "compile"])
+                self.assertEqual(exit_code, 0)
+                out = json.loads(stdout.getvalue())
+                self.assertEqual(out.get("kits_compiled"), 1)
+                self.assertEqual(out["kits"][0]["kinds"], ["PRD"])
+                self.assertTrue((kit_root / "kit.bundle.json").is_file())
+
+                stdout = io.StringIO()
+                with redirect_stdout(stdout):
+                    exit_code = main(["kit", "compile", "--kit", "nope"])
+                self.assertEqual(exit_code, 1)
+            finally:
+                os.chdir(cwd)
+
+            artifacts_dir = root / "kits" / "sdlc" / "artifacts"
+            bundle = read_kit_bundle(kit_root, "cypilot", artifacts_dir)
+            self.assertIsNotNone(bundle)
+            from_bundle = CypilotContext.load(root)
+            src_tmpl = from_sources.get_template("cypilot", "PRD")
+            bundle_tmpl = from_bundle.get_template("cypilot", "PRD")
+            self.assertEqual(bundle_tmpl.path, src_tmpl.path)
+            self.assertEqual(bundle_tmpl.blocks, src_tmpl.blocks)
+            self.assertEqual(bundle_tmpl.blocks[0].attrs.get("to_code"), "true")
+            self.assertEqual(bundle_tmpl.constraints, src_tmpl.constraints)
+            self.assertEqual(from_bundle.kits["cypilot"].constraints, from_sources.kits["cypilot"].constraints)
+
+            # A same-size edit that keeps the mtime is still detected (content digest).
+            constraints_path = kit_root / "constraints.json"
+            st = constraints_path.stat()
+            constraints_path.write_text(
+                constraints_path.read_text(encoding="utf-8").replace("Items", "Stuff"), encoding="utf-8"
+            )
+            os.utime(constraints_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self.assertEqual(constraints_path.stat().st_size, st.st_size)
+            self.assertIsNone(read_kit_bundle(kit_root, "cypilot", artifacts_dir))
+
+    def test_fresh_kit_bundle_loads_without_reading_sources(self):
+        from cypilot.utils.kit_bundle import kit_bundle_sources, read_kit_bundle
+
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            _setup_cypilot_project_with_codebase(root)
+            kit_root = (root / "kits" / "sdlc").resolve()
+            artifacts_dir = kit_root / "artifacts"
+            (kit_root / "constraints.json").write_text("{}", encoding="utf-8")
+            # Sources last edited well before compiling, so their stamps are trusted.
+            sources = kit_bundle_sources(kit_root, artifacts_dir)
+            for src in sources.values():
+                os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+
+            cwd = os.getcwd()
+            try:
+                os.chdir(str(root))
+                with redirect_stdout(io.StringIO()):
+                    self.assertEqual(main(["kit", "compile"]), 0)
+            finally:
+                os.chdir(cwd)
+
+            read_paths = []
+            orig_read_bytes = Path.read_bytes
+            orig_read_text = Path.read_text
+
+            def _rb(self, *args, **kwargs):
+                read_paths.append(self)
+                return orig_read_bytes(self, *args, **kwargs)
+
+            def _rt(self, *args, **kwargs):
+                read_paths.append(self)
+                return orig_read_text(self, *args, **kwargs)
+
+            def _load():
+                read_paths.clear()
+                with unittest.mock.patch.object(Path, "read_bytes", _rb), \
+                        unittest.mock.patch.object(Path, "read_text", _rt):
+                    self.assertIsNotNone(read_kit_bundle(kit_root, "cypilot", artifacts_dir))
+                return [p for p in read_paths if p in sources.values()]
+
+            self.assertEqual(_load(), [])
+
+            # A touched but unchanged source is re-digested once, then restamped.
+            os.utime(sources["constraints.json"], ns=(2_000_000_000, 2_000_000_000))
+            self.assertEqual(_load(), [sources["constraints.json"]])
+            self.assertEqual(_load(), [])
+
+
 if __name__ == "__main__":
     unittest.main()
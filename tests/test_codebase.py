@@ -483,6 +483,41 @@ class TestCodeFileLoad:
         errs2 = cf.load()
         assert errs2 == []
 
+    def test_marker_free_file_skips_parsing(self, tmp_path: Path):
+        code_file = tmp_path / "plain.py"
+        code_file.write_text("def foo():\n    return 'cpt-not-a-marker'\n")
+
+        cf, errs = CodeFile.from_path(code_file)
+        assert not errs
+        assert cf.scope_markers == []
+        assert cf.block_markers == []
+        assert cf.references == []
+
+    def test_mixed_markers_on_one_line(self, tmp_path: Path):
+        code = (
+            "# @cpt-flow:cpt-myapp-flow-a:p1 @cpt-begin:cpt-myapp-flow-a:p1:inst-x\n"
+            "x = 1\n"
+            "# @cpt-end:cpt-myapp-flow-a:p1:inst-x\n"
+        )
+        code_file = tmp_path / "mixed.py"
+        code_file.write_text(code)
+
+        cf, errs = CodeFile.from_path(code_file)
+        assert not errs
+        assert [(m.kind, m.id, m.phase) for m in cf.scope_markers] == [("flow", "cpt-myapp-flow-a", 1)]
+        assert len(cf.block_markers) == 1
+        assert cf.block_markers[0].inst == "x"
+        assert cf.block_markers[0].content == ("x = 1",)
+        assert [r.marker_type for r in cf.references] == ["scope", "block"]
+
+    def test_invalid_utf8_reports_file_error(self, tmp_path: Path):
+        code_file = tmp_path / "binary.py"
+        code_file.write_bytes(b"\xff\xfe @cpt-flow")
+
+        cf, errs = CodeFile.from_path(code_file)
+        assert cf is None
+        assert errs[0]["type"] == "file"
+
 
 class TestCrossValidationEdgeCases:
     """Test edge cases in cross-validation."""
@@ -72,6 +72,39 @@ def test_parse_kit_constraints_valid_happy_path_and_normalizations():
     assert d0.references["DESIGN"].coverage == "required"
 
 
+def test_parse_kit_constraints_builds_lookup_tables():
+    data = {
+        "PRD": {
+            "identifiers": {
+                "Item": {
+                    "headings": [" H1 ", "H2"],
+                    "references": {
+                        "design": {"coverage": "required", "task": True, "headings": ["Impl"]},
+                        "SPEC": {"coverage": "optional"},
+                    },
+                },
+                "actor": {"required": False},
+            },
+        }
+    }
+    kc, errs = parse_kit_constraints(data)
+    assert errs == []
+    prd = kc.by_kind["PRD"]
+    assert prd.id_kind_names == frozenset({"item", "actor"})
+
+    item, actor = prd.id_kinds
+    assert item.kind == "item"
+    assert item.required is True
+    assert item.headings == frozenset({"H1", "H2"})
+    assert [r.target_kind for r in item.references] == ["DESIGN", "SPEC"]
+    design, spec = item.references
+    assert (design.coverage, design.task, design.priority) == ("required", "required", "allowed")
+    assert design.headings == frozenset({"Impl"})
+    assert (spec.coverage, spec.task, spec.headings) == ("optional", "allowed", frozenset())
+    assert actor.required is False
+    assert actor.references == ()
+
+
 def test_parse_kit_constraints_duplicate_kind_detection():
     data = {
         "PRD": {
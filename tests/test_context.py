@@ -4,6 +4,7 @@ Tests for CypilotContext and related functions.
 Tests cover:
 - CypilotContext methods: get_template, get_template_for_kind, get_known_id_kinds
 - Global context functions: get_context, set_context, ensure_context
+- Lazy kit templates: KitTemplates, load_kit_from_sources
 """
 
 import json
@@ -16,13 +17,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "cypilot" / "sc
 
 from cypilot.utils.context import (
     CypilotContext,
+    KitTemplates,
     LoadedKit,
+    load_kit_from_sources,
     get_context,
     set_context,
     ensure_context,
     _global_context,
 )
 from cypilot.utils.artifacts_meta import ArtifactsMeta, Kit
+from cypilot.utils.template import Template
 
 
 def _make_mock_template(kind: str, blocks: list = None) -> MagicMock:
@@ -127,6 +131,43 @@ class TestCypilotContextMethods:
         assert id_kinds == {"fr", "actor", "component", "seq", "flow", "algo"}
 
 
+class TestLazyKitTemplates:
+    """Kit templates are scanned at load and parsed on first access."""
+
+    def _make_kit(self, root: Path) -> Kit:
+        arts = root / "kits" / "k" / "artifacts"
+        (arts / "PRD").mkdir(parents=True)
+        (arts / "PRD" / "template.md").write_text(
+            "---\ncypilot-template:\n  kind: PRD\n  version:\n    major: 1\n    minor: 0\n---\n"
+            "<!-- cpt:id:fr -->\n- [ ] **ID**: `cpt-x-fr-a`\n<!-- cpt:id:fr -->\n",
+            encoding="utf-8",
+        )
+        (arts / "BROKEN").mkdir()
+        (arts / "BROKEN" / "template.md").write_text("<!-- cpt:id:actor -->\n", encoding="utf-8")
+        return Kit(kit_id="k", format="Cypilot", path="kits/k")
+
+    def test_templates_parse_on_first_access(self):
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            kit = self._make_kit(root)
+            with patch("cypilot.utils.context.Template.from_path", wraps=Template.from_path) as from_path:
+                templates, _constraints, errors = load_kit_from_sources("k", kit, root)
+                assert isinstance(templates, KitTemplates)
+                assert set(templates) == {"PRD", "BROKEN"}
+                assert templates.id_kinds() == {"fr", "actor"}
+                assert from_path.call_count == 0
+
+                assert templates.get("PRD").kind == "PRD"
+                assert templates.get("PRD") is templates["PRD"]
+                assert from_path.call_count == 1
+                assert errors == []
+
+                assert templates.get("BROKEN") is None
+                assert any(e.get("message") == "Unclosed marker" for e in errors)
+                assert set(templates.load_all()) == {"PRD"}
+                assert from_path.call_count == 2
+
+
 class TestGlobalContextFunctions:
     """Tests for global context getter/setter functions."""
 
@@ -275,6 +316,8 @@ class TestCypilotContextLoad:
 
             ctx = CypilotContext.load()
             assert ctx is not None
+            # Templates are parsed (and constraints applied) on first use.
+            assert ctx.get_template("k", "PRD") is tmpl
 
             # We should have:
             # - constraints.json parse error surfaced
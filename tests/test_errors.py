@@ -0,0 +1,34 @@
+"""Tests for errors.py - lazy validation error records."""
+import json
+from pathlib import Path
+
+from cypilot.utils.codebase import error as code_error
+from cypilot.utils.errors import ErrorRecord, json_default
+from cypilot.utils.template import Template
+
+
+class TestErrorRecord:
+    def test_dict_form_matches_legacy_layout(self):
+        rec = Template.error("structure", "Bad", path=Path("/x/PRD.md"), line="3", id="cpt-a-fr-x", skip=None)
+        assert rec == {"type": "structure", "message": "Bad", "line": 3, "path": "/x/PRD.md", "id": "cpt-a-fr-x"}
+        assert list(rec.keys()) == ["type", "message", "line", "path", "id"]
+        assert "skip" not in rec
+
+    def test_template_error_omits_non_path(self):
+        rec = Template.error("template", "Missing", path=0)
+        assert "path" not in rec
+        assert rec.get("path") is None
+
+    def test_fields_read_without_materializing(self):
+        rec = code_error("marker", "Oops", path=Path("/src/a.py"), line=7)
+        assert rec.get("path") == "/src/a.py"
+        assert rec["type"] == "marker"
+        assert rec._dict is None
+        assert rec["line"] == 7
+        assert rec._dict is not None
+
+    def test_json_default_serializes_nested_records(self):
+        rec = ErrorRecord("x", "msg", 2, Path("/p"), {"id": "cpt-a"})
+        out = json.loads(json.dumps({"errors": [rec]}, default=json_default))
+        assert out == {"errors": [{"type": "x", "message": "msg", "line": 2, "path": "/p", "id": "cpt-a"}]}
+        assert dict(rec) == out["errors"][0]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from overwork_alert.config import ConfigCache
+from overwork_alert.models import Config
+
+
+def test_config_cache_reparses_only_on_file_change_or_reload_request() -> None:
+    clock = [0.0]
+    file_stat = SimpleNamespace(st_size=10, st_mtime_ns=1)
+    loads: list[Path] = []
+
+    def fake_load(path: Path) -> Config:
+        loads.append(path)
+        return Config(limit_seconds=file_stat.st_size)
+
+    cache = ConfigCache(
+        Path("/cfg.json"),
+        check_interval_seconds=1.0,
+        clock=lambda: clock[0],
+        stat=lambda _path: file_stat,
+        loader=fake_load,
+    )
+
+    # Many ticks and status requests, within and across check intervals: one parse.
+    for _ in range(100):
+        assert cache.get().limit_seconds == 10
+        clock[0] += 0.25
+    assert cache.reload_count == 1
+
+    # A changed mtime/size is picked up at the next check.
+    clock[0] = 30.0
+    cache.get()
+    file_stat = SimpleNamespace(st_size=20, st_mtime_ns=2)
+    clock[0] += 0.5
+    assert cache.get().limit_seconds == 10
+    clock[0] += 0.5
+    assert cache.get().limit_seconds == 20
+    assert cache.reload_count == 2
+
+    # A SIGHUP-style request reloads immediately, even for an unchanged file.
+    cache.request_reload()
+    cache.get()
+    clock[0] += 5.0
+    cache.get()
+    assert cache.reload_count == 3
+    assert loads == [Path("/cfg.json")] * 3
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from overwork_alert.idle import (
+    IDLE_FILE_ENV,
+    CachedIdleProvider,
+    CallableIdleProvider,
+    FileIdleProvider,
+    IoregIdleProvider,
+    default_idle_provider,
+)
+
+
+def test_idle_providers_file_and_cached(tmp_path: Path) -> None:
+    idle_file = tmp_path / "idle"
+    provider = FileIdleProvider(idle_file)
+    assert provider.idle_seconds() is None
+    idle_file.write_text("42\n")
+    assert provider.idle_seconds() == 42
+    idle_file.write_text("garbage")
+    assert provider.idle_seconds() is None
+
+    clock = [0.0]
+    samples = iter(range(100))
+    calls = []
+
+    def sample() -> int:
+        calls.append(clock[0])
+        return next(samples)
+
+    cached = CachedIdleProvider(CallableIdleProvider(sample), ttl_seconds=2.0, clock=lambda: clock[0])
+    values = []
+    for _ in range(10):
+        values.append(cached.idle_seconds())
+        clock[0] += 0.5
+    assert values == [0, 0, 0, 0, 1, 1, 1, 1, 2, 2]
+    assert calls == [0.0, 2.0, 4.0]
+
+
+def test_default_idle_provider_samples_ioreg_directly(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv(IDLE_FILE_ENV, raising=False)
+    assert isinstance(default_idle_provider(), IoregIdleProvider)
+    monkeypatch.setenv(IDLE_FILE_ENV, str(tmp_path / "idle"))
+    assert isinstance(default_idle_provider(), FileIdleProvider)
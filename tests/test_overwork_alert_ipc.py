@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import json
 import os
+import socket
 import tempfile
+import threading
 import time
 
-from overwork_alert.ipc import ControlRequest, ControlServer, send_request
+from overwork_alert.cli import main as cli_main
+from overwork_alert.daemon import Daemon
+from overwork_alert.idle import CallableIdleProvider
+from overwork_alert.ipc import ControlClient, ControlRequest, ControlServer, send_request
 
 
 def test_ipc_request_response_roundtrip() -> None:
@@ -26,3 +32,97 @@ def test_ipc_request_response_roundtrip() -> None:
             assert resp["state"]["status"] == "running"
         finally:
             server.stop()
+
+
+def test_ipc_persistent_connection_pipelining_and_subscribe() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        socket_path = os.path.join(td, "overwork.sock")
+        calls: list[str] = []
+
+        def handler(req: ControlRequest) -> dict:
+            calls.append(req.cmd)
+            return {"ok": True, "cmd": req.cmd}
+
+        server = ControlServer(socket_path=socket_path, request_handler=handler)
+        server.start()
+        try:
+            with ControlClient(socket_path=socket_path, timeout_seconds=1.0) as client:
+                # Several requests in one write; responses come back in order.
+                client._sock.sendall(b'{"cmd": "status"}\n{"cmd": "pause"}\nnot json\n{"cmd": "subscribe"}\n')
+                assert client.receive() == {"ok": True, "cmd": "status"}
+                assert client.receive() == {"ok": True, "cmd": "pause"}
+                assert client.receive() == {"ok": False, "error": "invalid_json"}
+                assert client.receive() == {"ok": True}
+
+                server.publish({"event": "state", "state": {"status": "paused"}})
+                assert client.receive() == {"event": "state", "state": {"status": "paused"}}
+                # The same connection keeps serving requests.
+                assert client.request({"cmd": "resume"}) == {"ok": True, "cmd": "resume"}
+
+                # Only subscribers receive pushes; one-shot requests still work alongside.
+                assert send_request(socket_path=socket_path, payload={"cmd": "status"}, timeout_seconds=1.0)["ok"]
+                server.publish({"event": "state", "state": {"status": "running"}})
+                assert client.receive() == {"event": "state", "state": {"status": "running"}}
+            assert calls == ["status", "pause", "resume", "status"]
+        finally:
+            server.stop()
+        assert not os.path.exists(socket_path)
+
+
+def test_ipc_half_closed_unterminated_request_is_answered() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        socket_path = os.path.join(td, "overwork.sock")
+        server = ControlServer(socket_path=socket_path, request_handler=lambda req: {"ok": True})
+        server.start()
+        try:
+            s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            s.settimeout(1.0)
+            s.connect(socket_path)
+            s.sendall(b'{"cmd": "status"}')
+            s.shutdown(socket.SHUT_WR)
+            data = b""
+            while chunk := s.recv(4096):
+                data += chunk
+            s.close()
+            assert json.loads(data) == {"ok": True}
+        finally:
+            server.stop()
+
+
+def test_watch_prints_pushed_state_changes_until_daemon_stops(tmp_path, capsys) -> None:
+    socket_path = str(tmp_path / "overwork.sock")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"tick_interval_seconds": 30, "control_socket_path": socket_path}))
+    daemon = Daemon(config_path=config_path, idle_provider=CallableIdleProvider(lambda: None))
+    daemon_thread = threading.Thread(target=daemon.run_forever, daemon=True)
+    daemon_thread.start()
+    deadline = time.monotonic() + 2
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    codes: list[int] = []
+    out: list[str] = []
+
+    def printed_states() -> list[str]:
+        out.append(capsys.readouterr().out)
+        *lines, _partial = "".join(out).split("\n")
+        return [json.loads(line)["status"] for line in lines]
+
+    def wait_until(condition) -> None:
+        deadline = time.monotonic() + 3
+        while not condition():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    watch_thread = threading.Thread(target=lambda: codes.append(cli_main(["watch", "--config", str(config_path)])))
+    watch_thread.start()
+    wait_until(lambda: printed_states() == ["running"])
+    wait_until(lambda: any(conn.subscribed for conn in list(daemon._ipc._connections.values())))
+    assert send_request(socket_path=socket_path, payload={"cmd": "pause"}, timeout_seconds=1.0) == {"ok": True}
+    wait_until(lambda: printed_states() == ["running", "paused"])
+    assert send_request(socket_path=socket_path, payload={"cmd": "stop"}, timeout_seconds=1.0) == {"ok": True}
+    watch_thread.join(timeout=3)
+    daemon_thread.join(timeout=3)
+
+    assert codes == [0]
+    assert printed_states() == ["running", "paused"]
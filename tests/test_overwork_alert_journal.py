@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from overwork_alert.journal import StateJournal
+from overwork_alert.models import TrackerState, TrackerStatus
+
+
+def test_state_journal_folds_ticks_and_recovers_past_a_torn_tail(tmp_path: Path) -> None:
+    path = tmp_path / "state.journal"
+    clock = [0.0]
+    journal = StateJournal(path, checkpoint_interval_seconds=30.0, fsync_interval_seconds=60.0, clock=lambda: clock[0])
+    assert journal.recover() == TrackerState()
+    fsyncs_after_recover = journal.fsyncs
+
+    state = TrackerState(status=TrackerStatus.RUNNING)
+    for i in range(120):
+        clock[0] = float(i)
+        state.active_time_seconds = i
+        state.last_tick_at = float(i)
+        journal.record(state)
+    # Ticks only: a checkpoint at t=30/60/90, fsynced once (t=60).
+    assert journal.records_written == 3
+    assert journal.fsyncs - fsyncs_after_recover == 1
+
+    clock[0] = 121.0
+    paused = TrackerState(status=TrackerStatus.PAUSED, active_time_seconds=119, last_tick_at=119.0)
+    journal.record(paused)
+    # A transition is written and fsynced immediately.
+    assert journal.records_written == 4
+    assert journal.fsyncs - fsyncs_after_recover == 2
+
+    # Simulate a crash mid-write: no close(), half a record at the tail.
+    with open(path, "ab") as f:
+        f.write(b'deadbeef {"kind":"checkpoint","state":{"sta')
+
+    restored = StateJournal(path).recover()
+    assert restored.status == TrackerStatus.PAUSED
+    assert restored.active_time_seconds == 119
+    assert restored.last_tick_at is None
+    assert len(path.read_bytes().splitlines()) == 1
+
+
+def test_state_journal_syncs_a_reset_below_the_limit_immediately(tmp_path: Path) -> None:
+    path = tmp_path / "state.journal"
+    clock = [0.0]
+    journal = StateJournal(path, clock=lambda: clock[0])
+    journal.recover()
+    clock[0] = 30.0
+    journal.record(TrackerState(status=TrackerStatus.RUNNING, active_time_seconds=5000, last_tick_at=30.0))
+    fsyncs_before_reset = journal.fsyncs
+
+    # A reset changes only accumulated time, yet must not wait for the next checkpoint.
+    clock[0] = 31.0
+    journal.record(TrackerState(status=TrackerStatus.RUNNING, active_time_seconds=0, last_tick_at=31.0))
+    assert journal.fsyncs == fsyncs_before_reset + 1
+
+    # Crash right after the reset: no close().
+    assert StateJournal(path).recover().active_time_seconds == 0
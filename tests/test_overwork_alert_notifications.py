@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import threading
+import time
+
+from overwork_alert.daemon import _maybe_send_overwork_notification
+from overwork_alert.notify import NotificationWorker
 from overwork_alert.notification_policy import apply_notification_policy, should_notify
 from overwork_alert.models import Config, TrackerState, TrackerStatus
 
@@ -60,3 +65,44 @@ def test_apply_notification_policy_sets_over_limit_since_and_last_reminder() ->
 
     assert out.over_limit_since == 10.0
     assert out.last_reminder_at == 10.0
+
+
+def test_notification_worker_delivers_off_thread_and_coalesces() -> None:
+    in_flight = threading.Event()
+    release = threading.Event()
+    delivered = []
+
+    def slow_send(*, title: str, message: str) -> bool:
+        in_flight.set()
+        release.wait(5)
+        delivered.append(message)
+        return True
+
+    worker = NotificationWorker(send=slow_send, max_pending=2)
+    worker.start()
+    try:
+        config = Config(limit_seconds=100)
+        state = TrackerState(status=TrackerStatus.RUNNING, active_time_seconds=101, last_tick_at=0.0)
+        lock = threading.Lock()
+
+        # The state transition is recorded immediately while delivery is still blocked.
+        started = time.monotonic()
+        with lock:
+            state = _maybe_send_overwork_notification(
+                state=state, config=config, idle_seconds=0, now=10.0, send=worker.submit,
+            )
+        assert time.monotonic() - started < 0.5
+        assert state.over_limit_since == 10.0
+
+        assert in_flight.wait(5)  # first alert is now in flight
+        assert worker.submit(title="t", message="a") is True
+        assert worker.submit(title="t", message="b") is True
+        assert worker.submit(title="t", message="a") is True  # duplicate of a pending alert
+        assert worker.submit(title="t", message="c") is False  # queue full
+        assert (worker.coalesced, worker.dropped) == (1, 1)
+    finally:
+        release.set()
+        worker.stop()
+
+    assert delivered[1:] == ["a", "b"]
+    assert worker.delivered == 3
@@ -1,6 +1,22 @@
 from __future__ import annotations
 
-from overwork_alert.daemon import tick_once
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from overwork_alert.daemon import (
+    MAX_SLEEP_SECONDS,
+    Daemon,
+    _is_away,
+    _rebase_after_away,
+    next_tick_delay,
+    tick_once,
+)
+from overwork_alert.idle import CallableIdleProvider
+from overwork_alert.ipc import send_request
 from overwork_alert.models import Config, TrackerState, TrackerStatus
 
 
@@ -52,3 +68,106 @@ def test_tick_once_clamps_large_delta() -> None:
 
     assert out.active_time_seconds == 10
     assert out.last_tick_at == 1000.0
+
+
+def test_next_tick_delay_targets_nearest_deadline() -> None:
+    config = Config(
+        limit_seconds=3600, idle_threshold_seconds=300, repeat_interval_seconds=1800,
+        tick_interval_seconds=5, max_tick_delta_seconds=10,
+    )
+    active = TrackerState(status=TrackerStatus.RUNNING, active_time_seconds=100, last_tick_at=0.0)
+
+    # Active, far from every deadline: as long as a tick may be without clamping.
+    assert next_tick_delay(state=active, config=config, idle_seconds=0, now=0.0) == 10
+    # About to cross the limit or the idle threshold: wake exactly then.
+    near_limit = TrackerState(active_time_seconds=3597, last_tick_at=0.0)
+    assert next_tick_delay(state=near_limit, config=config, idle_seconds=0, now=0.0) == 4
+    assert next_tick_delay(state=active, config=config, idle_seconds=297, now=0.0) == 3
+    # Over the limit: the next repeat reminder is a deadline too.
+    reminded = TrackerState(active_time_seconds=4000, last_tick_at=0.0, over_limit_since=0.0, last_reminder_at=0.0)
+    assert next_tick_delay(state=reminded, config=config, idle_seconds=0, now=1795.0) == 5
+    # Idle or paused: nothing accrues, back off.
+    assert next_tick_delay(state=active, config=config, idle_seconds=301, now=0.0) == 5
+    assert next_tick_delay(state=active, config=config, idle_seconds=3000, now=0.0) == MAX_SLEEP_SECONDS
+    paused = TrackerState(status=TrackerStatus.PAUSED, last_tick_at=0.0)
+    assert next_tick_delay(state=paused, config=config, idle_seconds=0, now=0.0) == MAX_SLEEP_SECONDS
+
+
+def test_rebase_after_away_starts_the_first_active_tick_at_the_last_input() -> None:
+    config = Config(idle_threshold_seconds=300, max_tick_delta_seconds=10)
+    state = TrackerState(status=TrackerStatus.RUNNING, active_time_seconds=100, last_tick_at=1000.0)
+
+    # Back after a 60 s sleep, last input 4 s ago: only those 4 s accrue, unclamped.
+    rebased = _rebase_after_away(state=state, config=config, idle_seconds=4, now=1060.0)
+    assert rebased.last_tick_at == 1056.0
+    assert tick_once(state=rebased, config=config, idle_seconds=4, now=1060.0).active_time_seconds == 104
+    # Never before the previous tick; short gaps and still-idle samples are left alone.
+    assert _rebase_after_away(state=state, config=config, idle_seconds=200, now=1060.0).last_tick_at == 1000.0
+    assert _rebase_after_away(state=state, config=config, idle_seconds=0, now=1008.0) is state
+    assert _rebase_after_away(state=state, config=config, idle_seconds=400, now=1060.0) is state
+
+
+def _simulate(config: Config, idle_at: Callable[[float], int], until: float, *, adaptive: bool) -> tuple[int, int]:
+    """Run the tick loop on a fake clock; return (active seconds, wakeups)."""
+    state = TrackerState(status=TrackerStatus.RUNNING)
+    now, wakeups, away = 0.0, 0, False
+    while now < until:
+        idle_seconds = idle_at(now)
+        if adaptive and away:
+            state = _rebase_after_away(state=state, config=config, idle_seconds=idle_seconds, now=now)
+        state = tick_once(state=state, config=config, idle_seconds=idle_seconds, now=now)
+        wakeups += 1
+        if adaptive:
+            now += next_tick_delay(state=state, config=config, idle_seconds=idle_seconds, now=now)
+            away = _is_away(state=state, config=config, idle_seconds=idle_seconds)
+        else:
+            now += config.tick_interval_seconds
+    return state.active_time_seconds, wakeups
+
+
+def test_idle_hour_needs_an_order_of_magnitude_fewer_wakeups() -> None:
+    config = Config()
+
+    def idle_at(now: float) -> int:
+        return config.idle_threshold_seconds + int(now)
+
+    _, fixed_wakeups = _simulate(config, idle_at, 3600, adaptive=False)
+    _, adaptive_wakeups = _simulate(config, idle_at, 3600, adaptive=True)
+    assert fixed_wakeups == 720
+    assert adaptive_wakeups * 10 <= fixed_wakeups
+
+
+def test_adaptive_sleep_loses_at_most_one_back_off_when_the_user_returns() -> None:
+    config = Config()
+
+    def idle_at(now: float) -> int:
+        # Away since long before t=0, back at t=1000, working until t=1300.
+        if now < 1000:
+            return 1000 + int(now)
+        return 0 if now < 1300 else int(now - 1300)
+
+    fixed_active, _ = _simulate(config, idle_at, 2000, adaptive=False)
+    adaptive_active, _ = _simulate(config, idle_at, 2000, adaptive=True)
+    # 300 s of work plus the idle threshold it takes to notice the user left.
+    assert fixed_active == 300 + config.idle_threshold_seconds
+    # Only the time between the return and the end of the back-off sleep is missed.
+    assert fixed_active - MAX_SLEEP_SECONDS <= adaptive_active <= fixed_active
+
+
+def test_stop_command_wakes_a_sleeping_daemon(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "overwork.sock")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"tick_interval_seconds": 30, "control_socket_path": socket_path}))
+    daemon = Daemon(config_path=config_path, idle_provider=CallableIdleProvider(lambda: None))
+    thread = threading.Thread(target=daemon.run_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    assert send_request(socket_path=socket_path, payload={"cmd": "stop"}, timeout_seconds=1.0) == {"ok": True}
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 2
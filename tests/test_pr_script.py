@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import pr
+
+_FAKE_GH = '''\
+import json, os, re, sys, time
+
+spec = json.load(open(os.environ["FAKE_GH_SPEC"]))
+args = sys.argv[1:]
+start = time.time()
+time.sleep(spec.get("delay", 0))
+
+
+def pr_entry(num):
+    entry = spec["prs"].get(str(num))
+    if entry is None:
+        sys.stderr.write("no pull requests found\\n")
+        sys.exit(1)
+    return entry
+
+
+out, code = "", 0
+if args[:2] == ["repo", "view"]:
+    out = spec["repo"] + "\\n"
+elif args[:2] == ["pr", "list"]:
+    out = json.dumps([
+        {"number": int(n), "title": "t", "author": {"login": "dev"},
+         "updatedAt": e["meta"]["updatedAt"], "headRefOid": e["meta"]["headRefOid"]}
+        for n, e in spec["prs"].items()
+    ])
+elif args[:2] == ["pr", "view"]:
+    out = json.dumps(pr_entry(args[2])["meta"])
+elif args[:2] == ["pr", "diff"]:
+    out = pr_entry(args[2]).get("diff", "")
+    if "diff_error" in pr_entry(args[2]):
+        out, code = "", 1
+        sys.stderr.write(pr_entry(args[2])["diff_error"] + "\\n")
+elif args[0] == "api" and args[1].endswith("/files"):
+    num = re.search(r"pulls/(\\d+)/", args[1]).group(1)
+    out = "".join(json.dumps(f) + "\\n" for f in pr_entry(num).get("files", []))
+elif args[:2] == ["api", "graphql"] and not any(a.startswith("n=") for a in args):
+    # Batched mode: aliased pullRequest fields, connections paged by `page`.
+    query = next(a[6:] for a in args if a.startswith("query="))
+    size = spec.get("page", 100)
+
+    def page(items, after=0):
+        nxt = after + size
+        return {"nodes": items[after:nxt], "pageInfo": {"hasNextPage": nxt < len(items), "endCursor": str(nxt)}}
+
+    repo, errors = {}, []
+    for num in re.findall(r"pr(\\d+):pullRequest", query):
+        entry = spec["prs"].get(num)
+        if entry is None:
+            repo["pr" + num] = None
+            errors.append({"message": "Could not resolve to a PullRequest with the number of %s." % num})
+            continue
+        meta = entry["meta"]
+        repo["pr" + num] = dict(
+            {k: v for k, v in meta.items() if not isinstance(v, (list, dict))}, author=meta["author"],
+            labels={"nodes": []}, files={"nodes": []}, reviews={"nodes": meta["reviews"]},
+            reviewRequests={"nodes": [{"requestedReviewer": r} for r in meta["reviewRequests"]]},
+            commits={"nodes": [{"commit": {"statusCheckRollup": {"contexts": {"nodes": meta["statusCheckRollup"]}}}}]},
+            comments=page(meta["comments"]), reviewThreads=page(entry.get("threads", [])),
+        )
+    for alias, num, conn, after in re.findall(r'(p\\d+):pullRequest\\(number:(\\d+)\\)\\{(\\w+)\\(first:100,after:"(\\d+)"', query):
+        entry = spec["prs"][num]
+        items = entry["meta"]["comments"] if conn == "comments" else entry.get("threads", [])
+        repo[alias] = {conn: page(items, int(after))}
+    out = json.dumps(dict({"data": {"repository": repo}}, **({"errors": errors} if errors else {})))
+    if errors:
+        sys.stderr.write("GraphQL: " + errors[0]["message"] + "\\n")
+        code = 1
+elif args[:2] == ["api", "graphql"]:
+    num = next(a[2:] for a in args if a.startswith("n="))
+    out = json.dumps({"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": pr_entry(num).get("threads", [])}}}}})
+elif args[0] == "api":
+    num = re.search(r"pulls/(\\d+)/", args[1]).group(1)
+    out = json.dumps(pr_entry(num).get("review_comments", []))
+with open(os.environ["FAKE_GH_LOG"], "a") as f:
+    f.write(json.dumps({"args": args, "start": start, "end": time.time()}) + "\\n")
+sys.stdout.write(out)
+sys.exit(code)
+'''
+
+
+def _meta(num: int) -> dict:
+    return {
+        "title": f"PR {num}", "body": "", "author": {"login": "dev"}, "state": "OPEN",
+        "url": f"https://github.com/acme/widgets/pull/{num}",
+        "createdAt": "2025-01-01T00:00:00Z", "updatedAt": "2025-01-02T00:00:00Z", "headRefOid": "abc123",
+        "comments": [], "reviews": [], "reviewRequests": [], "statusCheckRollup": [],
+    }
+
+
+class FakeGh:
+    """A `gh` stand-in on PATH that serves PR data from a spec file and logs calls."""
+
+    def __init__(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, prs: dict, delay: float = 0.0):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        gh = bin_dir / "gh"
+        gh.write_text(f"#!{sys.executable}\n" + _FAKE_GH, encoding="utf-8")
+        gh.chmod(0o755)
+        self.spec_path = tmp_path / "gh-spec.json"
+        self.log_path = tmp_path / "gh-log.jsonl"
+        self.spec = {"repo": "acme/widgets", "delay": delay, "prs": prs, "page": 100}
+        self.save()
+        monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+        monkeypatch.setenv("FAKE_GH_SPEC", str(self.spec_path))
+        monkeypatch.setenv("FAKE_GH_LOG", str(self.log_path))
+
+    def save(self) -> None:
+        self.spec_path.write_text(json.dumps(self.spec), encoding="utf-8")
+
+    def calls(self) -> list:
+        if not self.log_path.exists():
+            return []
+        return [json.loads(line) for line in self.log_path.read_text(encoding="utf-8").splitlines()]
+
+    def max_concurrency(self) -> int:
+        events = sorted(
+            [(c["start"], 1) for c in self.calls()] + [(c["end"], -1) for c in self.calls()],
+            key=lambda e: (e[0], e[1]),
+        )
+        running = peak = 0
+        for _t, step in events:
+            running += step
+            peak = max(peak, running)
+        return peak
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "project"
+    (root / ".prs").mkdir(parents=True)
+    monkeypatch.setattr(pr, "ROOT", str(root))
+    monkeypatch.setattr(pr, "PRS_DIR", str(root / ".prs"))
+    monkeypatch.setattr(pr, "CONFIG_PATH", str(root / ".prs" / "config.yaml"))
+    monkeypatch.setattr(pr, "GH", ["gh"])
+    monkeypatch.setattr(pr, "RECORD_DIR", None)
+    pr._owner_repo.cache_clear()
+    yield root
+    pr._owner_repo.cache_clear()
+
+
+def _run_main(monkeypatch: pytest.MonkeyPatch, *argv: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["pr.py", *argv])
+    try:
+        pr.main()
+    except SystemExit as e:
+        return int(e.code or 0)
+    return 0
+
+
+def test_fetch_all_runs_gh_calls_in_bounded_pool(project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    prs = {str(n): {"meta": _meta(n), "diff": f"diff {n}\n"} for n in (1, 2, 3)}
+    gh = FakeGh(tmp_path, monkeypatch, prs, delay=0.1)
+
+    assert _run_main(monkeypatch, "fetch", "ALL", "--jobs", "4") == 0
+    for n in (1, 2, 3):
+        assert json.loads((project / ".prs" / str(n) / "meta.json").read_text())["title"] == f"PR {n}"
+        assert (project / ".prs" / str(n) / "diff.patch").read_text() == f"diff {n}\n"
+    calls = gh.calls()
+    assert sum(1 for c in calls if c["args"][:2] == ["repo", "view"]) == 1
+    assert 1 < gh.max_concurrency() <= 4
+
+    gh.log_path.unlink()
+    assert _run_main(monkeypatch, "fetch", "ALL", "--jobs=1") == 0
+    assert gh.max_concurrency() == 1
+
+
+def test_status_all_reports_failed_prs_without_aborting(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture,
+) -> None:
+    prs = {str(n): {"meta": _meta(n), "diff": ""} for n in (1, 2)}
+    FakeGh(tmp_path, monkeypatch, prs)
+    # PR 3 is listed but cannot be viewed.
+    monkeypatch.setattr(pr, "_list_open_prs", lambda: [{"number": n} for n in (1, 3, 2)])
+
+    assert _run_main(monkeypatch, "status", "ALL") == 1
+    assert (project / ".prs" / "1" / "status.md").is_file()
+    assert (project / ".prs" / "2" / "status.md").is_file()
+    assert not (project / ".prs" / "3" / "status.md").exists()
+    assert "Failed to fetch PR #3" in capsys.readouterr().err
+
+
+def test_status_all_skips_unchanged_prs(project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    prs = {str(n): {"meta": _meta(n), "diff": f"diff {n}\n"} for n in (1, 2)}
+    gh = FakeGh(tmp_path, monkeypatch, prs)
+    assert _run_main(monkeypatch, "status", "ALL") == 0
+
+    def fetched():
+        return sorted((c["args"][1], c["args"][2]) for c in gh.calls() if c["args"][0] == "pr" and c["args"][1] != "list")
+
+    # Nothing changed: only metadata is refreshed and the report is restored
+    # from the last untriaged render (triage edits are not carried over).
+    report = project / ".prs" / "1" / "status.md"
+    rendered = report.read_text()
+    report.write_text(rendered.replace("Severity**: TBD", "Severity**: LOW") + "\n<!-- triaged -->\n")
+    gh.log_path.unlink()
+    with monkeypatch.context() as m:
+        m.setattr(pr, "_load_review_threads", lambda pr_dir: pytest.fail("re-rendered"))
+        assert _run_main(monkeypatch, "status", "ALL") == 0
+    assert fetched() == [("view", "1"), ("view", "2")]
+    assert not any(c["args"][0] == "api" for c in gh.calls())
+    assert report.read_text() == rendered
+
+    # A new push to PR 2 re-downloads only its diff, comments and threads.
+    gh.spec["prs"]["2"]["meta"]["headRefOid"] = "def456"
+    gh.spec["prs"]["2"]["diff"] = "diff 2 v2\n"
+    gh.save()
+    gh.log_path.unlink()
+    assert _run_main(monkeypatch, "status", "ALL") == 0
+    assert fetched() == [("diff", "2"), ("view", "1"), ("view", "2")]
+    assert (project / ".prs" / "2" / "diff.patch").read_text() == "diff 2 v2\n"
+
+    # --force re-downloads and re-renders everything.
+    gh.log_path.unlink()
+    report.write_text("<!-- triaged -->\n")
+    assert _run_main(monkeypatch, "status", "1", "--force") == 0
+    assert fetched() == [("diff", "1"), ("view", "1")]
+    assert "triaged" not in report.read_text()
+
+
+def test_fetch_all_graphql_batches_prs_and_pages_connections(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture,
+) -> None:
+    meta = _meta(1)
+    meta["comments"] = [
+        {"id": f"c{i}", "author": {"login": "rev"}, "body": f"comment {i}",
+         "createdAt": "2025-01-01T00:00:00Z", "url": f"https://x/c{i}"}
+        for i in range(5)
+    ]
+    threads = [
+        {"id": f"t{i}", "isResolved": i == 0, "isOutdated": False, "path": "a.py", "line": i, "startLine": None,
+         "comments": {"nodes": [{"id": f"r{i}", "author": {"login": "rev"}, "body": "fix", "createdAt": "2025-01-01T00:00:00Z",
+                                 "url": f"https://x/r{i}", "diffHunk": f"@@ -{i} +{i} @@"}]}}
+        for i in range(3)
+    ]
+    prs = {"1": {"meta": meta, "diff": "diff 1\n", "threads": threads}, "2": {"meta": _meta(2), "diff": "diff 2\n"}}
+    gh = FakeGh(tmp_path, monkeypatch, prs)
+    gh.spec["page"] = 2
+    gh.save()
+    monkeypatch.setattr(pr, "GRAPHQL_BATCH", 2)
+    # PR 3 is listed but does not resolve; the other PR in its batch still lands.
+    monkeypatch.setattr(pr, "_list_open_prs", lambda: [{"number": n} for n in (1, 2, 3)])
+
+    assert _run_main(monkeypatch, "status", "ALL", "--graphql") == 1
+    assert "Failed to fetch PR #3" in capsys.readouterr().err
+    pr1 = project / ".prs" / "1"
+    assert [c["body"] for c in json.loads((pr1 / "meta.json").read_text())["comments"]] == [f"comment {i}" for i in range(5)]
+    nodes = json.loads((pr1 / "review_threads.json").read_text())["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
+    assert [t["id"] for t in nodes] == ["t0", "t1", "t2"]
+    hunks = {c["html_url"]: c["diff_hunk"] for c in json.loads((pr1 / "review_comments.json").read_text())}
+    assert hunks["https://x/r2"] == "@@ -2 +2 @@"
+    assert (pr1 / "diff.patch").read_text() == "diff 1\n"
+    assert (project / ".prs" / "2" / "status.md").is_file()
+
+    calls = gh.calls()
+    # Two batches of PRs, then two pagination rounds for PR 1.
+    assert sum(1 for c in calls if c["args"][:2] == ["api", "graphql"]) == 4
+    assert not any(c["args"][:2] == ["pr", "view"] or c["args"][0] == "api" and c["args"][1] != "graphql" for c in calls)
+    assert sorted(c["args"][2] for c in calls if c["args"][:2] == ["pr", "diff"]) == ["1", "2"]
+
+    # Unchanged PRs cost one batched query and no diff downloads.
+    monkeypatch.setattr(pr, "_list_open_prs", lambda: [{"number": n} for n in (1, 2)])
+    gh.log_path.unlink()
+    assert _run_main(monkeypatch, "fetch", "ALL", "--graphql") == 0
+    assert not any(c["args"][:2] == ["pr", "diff"] for c in gh.calls())
+
+
+def test_detect_pr_replies_matches_later_author_quotes() -> None:
+    def c(login: str, body: str, url: str) -> dict:
+        return {"author": {"login": login}, "body": body, "url": url}
+
+    comments = [
+        c("rev", "Please Rename this helper.", "u1"),
+        c("rev", "Add a test for the empty case.", "u2"),
+        c("dev", "> @rev\n>> please rename this helper\nDone.", "r1"),
+        c("coderabbitai[bot]", "Consider caching the result.", "u3"),
+        c("rev", "Why is the timeout 30s?", "u4"),
+        c("dev", "> consider caching the result\n> why is the timeout 30s?\nAnswered.", "r2"),
+        c("rev", "Add a test for the empty case.", "u5"),
+    ]
+    # Quotes match case-insensitively; bot comments and comments after the reply never count.
+    assert pr._detect_pr_replies(comments, "dev") == {"u1", "u4"}
+
+
+_GRAPHQL_FIXTURES = Path(__file__).parent / "fixtures" / "pr_graphql"
+
+
+def test_graphql_builders_and_converters_against_recorded_fixtures(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The checked-in gh fixtures pin the query text and the GitHub response shape."""
+    fixtures = {
+        name: json.loads((_GRAPHQL_FIXTURES / f"{name}.json").read_text())
+        for name in ("batch_7_12", "page_7_review_threads")
+    }
+
+    def replay(cmd, **kwargs):
+        for fx in fixtures.values():
+            if fx["args"] == cmd[1:]:
+                return SimpleNamespace(stdout=fx["stdout"], stderr=fx["stderr"], returncode=fx["returncode"])
+        pytest.fail(f"query does not match a recorded fixture: {cmd[1:4]}")
+
+    monkeypatch.setattr(pr, "_run", replay)
+
+    repo, err = pr._graphql(pr._build_batch_query(["7", "12"]), "acme", "widgets")
+    assert repo["pr12"] is None
+    assert "number of 12" in err
+    node = repo["pr7"]
+    assert pr._meta_from_graphql(node) == json.loads((_GRAPHQL_FIXTURES / "pr7_meta.json").read_text())
+    assert pr._pr_version(node) == ["2026-10-02T16:03:10Z", "3f9a1c2e8b7d6a5f4e3d2c1b0a9f8e7d6c5b4a39"]
+
+    cursor = node["reviewThreads"]["pageInfo"]["endCursor"]
+    assert node["reviewThreads"]["pageInfo"]["hasNextPage"]
+    page, err = pr._graphql(pr._build_page_query([("7", "reviewThreads", cursor)]), "acme", "widgets")
+    assert err == ""
+    node["reviewThreads"]["nodes"].extend(page["p0"]["reviewThreads"]["nodes"])
+
+    threads = pr._threads_from_graphql(node)["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
+    assert [(t["path"], t["isResolved"]) for t in threads] == [("src/client.py", False), ("tests/test_client.py", True)]
+    comments = pr._review_comments_from_graphql(node)
+    assert [c["html_url"].rsplit("#", 1)[1] for c in comments] == ["discussion_r1", "discussion_r2"]
+    assert comments[0]["diff_hunk"].startswith("@@ -80,6 +80,9 @@")
+    assert comments[1]["user"] == {}
+
+
+def test_recorded_fixtures_replay_through_bundled_fake_gh(
+    project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    prs = {str(n): {"meta": _meta(n), "diff": f"diff {n}\n"} for n in (1, 2)}
+    FakeGh(tmp_path, monkeypatch, prs)
+    fixtures = tmp_path / "fixtures"
+    assert _run_main(monkeypatch, "status", "ALL", "--record", str(fixtures)) == 0
+    recorded = {p.name: p.read_text() for p in (project / ".prs" / "1").iterdir()}
+    assert any(json.loads(p.read_text())["args"][:2] == ["pr", "list"] for p in fixtures.iterdir())
+
+    # Replay with no gh on PATH: every call is served from the fixtures.
+    shutil.rmtree(project / ".prs" / "1")
+    shutil.rmtree(project / ".prs" / "2")
+    pr._owner_repo.cache_clear()
+    monkeypatch.setenv("PATH", os.defpath)
+    fake = Path(pr.__file__).with_name("fake_gh.py")
+    monkeypatch.setattr(pr, "RECORD_DIR", None)
+    monkeypatch.setattr(pr, "GH", [sys.executable, str(fake), "--fixtures", str(fixtures), "--latency", "0.01"])
+    assert _run_main(monkeypatch, "status", "ALL") == 0
+    assert {p.name: p.read_text() for p in (project / ".prs" / "1").iterdir()} == recorded
+
+    # Offline rendering never calls gh, even a missing one.
+    monkeypatch.setattr(pr, "GH", [str(tmp_path / "no-such-gh")])
+    (project / ".prs" / "config.yaml").write_text("exclude_prs:\n  - 2\n")
+    assert _run_main(monkeypatch, "status", "ALL", "--offline", "--force") == 0
+    assert (project / ".prs" / "1" / "status.md").read_text() == recorded["status.md"]
+    assert _run_main(monkeypatch, "status", "5", "--offline") == 1
+    assert _run_main(monkeypatch, "fetch", "1", "--offline") == 1
+
+
+_BIG_DIFF = """\
+diff --git a/src/app.py b/src/app.py
+index 1..2 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,3 +1,4 @@
+ import os
++import sys
+ 
+ def main():
+@@ -40,2 +41,3 @@ def helper():
+     pass
++    return None
+ # end
+diff --git a/README.md b/README.md
+--- a/README.md
++++ b/README.md
+@@ -5 +5 @@
+-old
++new
+"""
+
+
+def _thread(path: str, line: int) -> dict:
+    return {
+        "id": f"{path}:{line}", "isResolved": False, "isOutdated": False, "path": path, "line": line, "startLine": None,
+        "comments": {"nodes": [{"id": "c", "author": {"login": "rev"}, "body": "why?",
+                                "createdAt": "2025-01-01T00:00:00Z", "url": f"https://x/{path}/{line}"}]},
+    }
+
+
+def test_diff_is_streamed_with_hunk_index_used_by_status(project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    prs = {"1": {"meta": _meta(1), "diff": _BIG_DIFF, "threads": [_thread("src/app.py", 42)]}}
+    FakeGh(tmp_path, monkeypatch, prs)
+    assert _run_main(monkeypatch, "status", "1") == 0
+
+    pr_dir = project / ".prs" / "1"
+    data = (pr_dir / "diff.patch").read_bytes()
+    assert data == _BIG_DIFF.encode()
+    assert not list(pr_dir.glob("*.part*"))
+    index = json.loads((pr_dir / "diff_index.json").read_text())
+    assert sorted(index) == ["README.md", "src/app.py"]
+    start, end, new_start, count = index["src/app.py"]["hunks"][1]
+    assert (new_start, count) == (41, 3)
+    assert data[start:end].startswith(b"@@ -40,2 +41,3 @@")
+    assert data[index["README.md"]["start"]:index["README.md"]["end"]].startswith(b"diff --git a/README.md")
+
+    # No REST diff_hunk for the thread: the hunk is read from the indexed diff, up to the commented line.
+    report = (pr_dir / "status.md").read_text()
+    assert "@@ -40,2 +41,3 @@ def helper():\n     pass\n+    return None\n```" in report
+
+
+def test_too_large_diff_is_rebuilt_from_files_api(project: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    files = [
+        {"filename": "a.py", "status": "modified", "patch": "@@ -1 +1,2 @@\n x\n+y"},
+        {"filename": "new.py", "status": "renamed", "previous_filename": "old.py", "patch": "@@ -3 +3 @@\n-a\n+b\n"},
+        {"filename": "blob.bin", "status": "added"},
+    ]
+    prs = {"1": {"meta": _meta(1), "diff_error": "HTTP 406: Sorry, the diff exceeded the maximum number of lines (20000)",
+                 "files": files, "threads": [_thread("a.py", 2)]}}
+    FakeGh(tmp_path, monkeypatch, prs)
+    fixtures = tmp_path / "fixtures"
+    assert _run_main(monkeypatch, "status", "1", "--record", str(fixtures)) == 0
+
+    pr_dir = project / ".prs" / "1"
+    assert (pr_dir / "diff.patch").read_text() == (
+        "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1,2 @@\n x\n+y\n"
+        "diff --git a/old.py b/new.py\n--- a/old.py\n+++ b/new.py\n@@ -3 +3 @@\n-a\n+b\n"
+        "diff --git a/blob.bin b/blob.bin\n# patch unavailable via the files API\n"
+    )
+    assert sorted(json.loads((pr_dir / "diff_index.json").read_text())) == ["a.py", "blob.bin", "new.py"]
+    assert "@@ -1 +1,2 @@\n x\n+y\n```" in (pr_dir / "status.md").read_text()
+    assert not list(pr_dir.glob("*.raw"))
+
+    # Replaying the recording rebuilds the same diff (the files API call was recorded too).
+    recorded = {p.name: p.read_bytes() for p in pr_dir.iterdir()}
+    shutil.rmtree(pr_dir)
+    pr._owner_repo.cache_clear()
+    monkeypatch.setattr(pr, "RECORD_DIR", None)
+    monkeypatch.setattr(pr, "GH", [sys.executable, str(Path(pr.__file__).with_name("fake_gh.py")), "--fixtures", str(fixtures)])
+    assert _run_main(monkeypatch, "status", "1") == 0
+    assert {p.name: p.read_bytes() for p in pr_dir.iterdir()} == recorded
@@ -0,0 +1,108 @@
+"""Tests for rules.py - validation rule pass registry and selection."""
+from cypilot.utils.rules import (
+    NEED_CODE,
+    NEED_HEADINGS,
+    NEED_IDS,
+    RULE_PASSES,
+    STOP_MAX_ERRORS,
+    STOP_TIME_BUDGET,
+    ValidationBudget,
+    ValidationIndex,
+    needs_of,
+    rule_names,
+    run_code_rules,
+    select_rules,
+)
+
+
+class TestSelectRules:
+    def test_default_selects_all(self):
+        selected, errs = select_rules(None, None)
+        assert errs == []
+        assert selected == frozenset(r.name for r in RULE_PASSES)
+
+    def test_include_and_skip(self):
+        selected, errs = select_rules("structure, ref-definitions", "ref-definitions")
+        assert errs == []
+        assert selected == frozenset({"structure"})
+
+    def test_skip_only(self):
+        selected, errs = select_rules(None, "cdsl-coverage")
+        assert errs == []
+        assert "cdsl-coverage" not in selected
+        assert "structure" in selected
+
+    def test_unknown_rule_reported(self):
+        selected, errs = select_rules("structure,bogus", "nope")
+        assert selected == frozenset()
+        assert errs == ["Unknown rule: bogus", "Unknown rule: nope"]
+
+
+class TestNeeds:
+    def test_structure_needs_nothing(self):
+        assert needs_of(["structure"]) == frozenset()
+
+    def test_cross_rules_need_ids_but_not_code(self):
+        needs = needs_of(rule_names("cross"))
+        assert NEED_IDS in needs
+        assert NEED_HEADINGS in needs
+        assert NEED_CODE not in needs
+
+    def test_only_heading_rules_need_headings(self):
+        assert NEED_HEADINGS not in needs_of(["ref-definitions", "ref-task-status", "id-kinds"])
+
+    def test_rule_names_scope_filter(self):
+        assert rule_names("artifact") == ["structure"]
+        assert set(rule_names("code")) == {"code-markers", "to-code-coverage", "cdsl-coverage", "markerless-covered-by"}
+
+
+class TestRunCodeRules:
+    def test_to_code_coverage_uses_index(self):
+        ix = ValidationIndex(to_code_ids={"cpt-a-flow-x", "cpt-a-flow-y"}, code_ids={"cpt-a-flow-x"})
+        result = run_code_rules(ix, ["to-code-coverage"])
+        assert [e["id"] for e in result["errors"]] == ["cpt-a-flow-y"]
+
+    def test_code_load_errors_keep_scan_order(self):
+        class _File:
+            def __init__(self, name):
+                self.path = name
+                self.references = []
+
+            def validate(self):
+                return {"errors": [{"path": self.path}], "warnings": []}
+
+            def list_ids(self):
+                return []
+
+        ix = ValidationIndex()
+        ix.add_code_load_errors([{"path": "a.py"}])
+        ix.add_code_file(_File("b.py"), "FULL")
+        ix.add_code_load_errors([{"path": "c.py"}])
+        ix.add_code_file(_File("d.py"), "FULL")
+        ix.add_code_load_errors([{"path": "e.py"}])
+        result = run_code_rules(ix, ["code-markers"])
+        assert [e["path"] for e in result["errors"]] == ["a.py", "b.py", "c.py", "d.py", "e.py"]
+
+    def test_unselected_rules_do_not_run(self):
+        ix = ValidationIndex(to_code_ids={"cpt-a-flow-y"})
+        result = run_code_rules(ix, ["code-markers"])
+        assert result == {"errors": [], "warnings": []}
+
+
+class TestValidationBudget:
+    def test_unlimited_never_exhausted(self):
+        budget = ValidationBudget.create()
+        assert not budget.exhausted(10_000)
+        assert budget.stop_reason is None
+
+    def test_max_errors_latches(self):
+        budget = ValidationBudget.create(max_errors=3)
+        assert not budget.exhausted(2)
+        assert budget.exhausted(3)
+        assert budget.stop_reason == STOP_MAX_ERRORS
+        assert budget.exhausted(0)
+
+    def test_time_budget(self):
+        budget = ValidationBudget(deadline=0.0)
+        assert budget.exhausted(0)
+        assert budget.stop_reason == STOP_TIME_BUDGET
@@ -212,6 +212,42 @@ def test_template_parses_and_validates_happy_path(tmp_path: Path):
     assert set(art.list_refs()) == {"cpt-demo-item-1"}
 
 
+def test_compiled_template_is_built_once_and_shared(tmp_path: Path):
+    nested = """
+---
+cypilot-template:
+  version:
+    major: 1
+    minor: 0
+  kind: PRD
+---
+<!-- cpt:##:section -->
+## Section
+<!-- cpt:paragraph:body -->
+Text.
+<!-- cpt:paragraph:body -->
+<!-- cpt:##:section -->
+"""
+    tmpl, errs = load_template(_write(tmp_path / "nested.template.md", nested))
+    assert errs == []
+    ct = tmpl.compiled()
+    assert tmpl.compiled() is ct
+    section = ct.first_by_key[("##", "section")]
+    body = ct.first_by_key[("paragraph", "body")]
+    assert ct.parent_of(body) is section
+    assert ct.parent_of(section) is None
+    assert ("paragraph", "body") in ct.validators
+
+    a1 = tmpl.parse(_write(tmp_path / "a1.md", "<!-- cpt:paragraph:body -->\nText.\n<!-- cpt:paragraph:body -->"))
+    a2 = tmpl.parse(_write(tmp_path / "a2.md", "<!-- cpt:##:section -->\n## S\n<!-- cpt:##:section -->"))
+    assert a1.blocks[0].template_block is body
+    assert a2.blocks[0].template_block is section
+    assert tmpl.compiled() is ct
+    msgs = [e["message"] for e in a1.validate()["errors"]]
+    assert "Required block missing" in msgs
+    assert any(m.startswith("Block must be nested inside ##:section") for m in msgs)
+
+
 def test_missing_required_block_fails(tmp_path: Path):
     tmpl_path = _write(tmp_path / "tmpl.template.md", _sample_template_text())
     tmpl, _ = load_template(tmpl_path)